@@ -36,6 +36,7 @@ Target:
 
 Options:
   -y, --yes               Skip confirmation prompts
+  --symlink               Symlink files from this checkout instead of copying
   -h, --help              Show this help message
 
 Examples:
@@ -22,6 +22,12 @@
 #     bash /path/to/beads-compound-plugin/install.sh
 #     bash /path/to/beads-compound-plugin/install.sh /path/to/your-project
 #
+#   Symlink instead of copying (for plugin development checkouts):
+#     ./install.sh --symlink /path/to/your-project
+#
+# Installed files are recorded in .beads-compound-manifest; re-running the
+# installer only copies files that changed and removes ones the plugin dropped.
+#
 
 set -euo pipefail
 
@@ -39,13 +45,15 @@ PLUGIN_DIR="$SCRIPT_DIR/plugins/beads-compound"
 INSTALLER_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "$INSTALLER_DIR/shared-functions.sh"
 
-# Parse --yes/-y flag (skip confirmation prompts)
+# Parse --yes/-y flag (skip confirmation prompts) and --symlink
 AUTO_YES=false
+INSTALL_MODE=copy
 POSITIONAL_ARGS=()
 
 for arg in "$@"; do
   case "$arg" in
     --yes|-y) AUTO_YES=true ;;
+    --symlink) INSTALL_MODE=link ;;
     *) POSITIONAL_ARGS+=("$arg") ;;
   esac
 done
@@ -150,6 +158,15 @@ else
   fi
 fi
 
+# Everything below is queued into the install manifest and placed in one
+# pass by manifest_commit (paths are relative to $TARGET)
+if [ "$GLOBAL_INSTALL" = true ]; then
+  CLAUDE_REL=""
+else
+  CLAUDE_REL=".claude/"
+fi
+manifest_begin "$TARGET" "$TARGET/$CLAUDE_REL$MANIFEST_NAME" "$INSTALL_MODE"
+
 # Install hooks (only for project-specific installs)
 if [ "$GLOBAL_INSTALL" = true ]; then
   echo "[4/9] Skipping hooks (use project-specific install for beads integration)"
@@ -159,9 +176,8 @@ else
   HOOKS_DIR="$TARGET/.claude/hooks"
   create_dir_with_symlink_handling "$HOOKS_DIR"
 
-  for hook in memory-capture.sh auto-recall.sh subagent-wrapup.sh knowledge-db.sh provision-memory.sh; do
-    cp "$PLUGIN_DIR/hooks/$hook" "$HOOKS_DIR/$hook"
-    chmod +x "$HOOKS_DIR/$hook"
+  for hook in memory-capture.sh auto-recall.sh subagent-wrapup.sh knowledge-db.sh provision-memory.sh hook-trace.sh; do
+    manifest_add "$PLUGIN_DIR/hooks/$hook" ".claude/hooks/$hook" 755
     echo "  - Installed $hook"
   done
 fi
@@ -178,6 +194,7 @@ echo "[5/9] Installing workflow commands..."
 
 if [ "$GLOBALLY_INSTALLED" = true ]; then
   CMD_COUNT=0
+  manifest_keep "${CLAUDE_REL}commands/"
   echo "  - Already installed globally -- skipping"
 else
   if [ "$GLOBAL_INSTALL" = true ]; then
@@ -191,8 +208,8 @@ else
 
   for cmd in "$PLUGIN_DIR/commands"/*.md; do
     if [ -f "$cmd" ]; then
-      cp "$cmd" "$COMMANDS_DIR/$(basename "$cmd")"
-      ((CMD_COUNT++))
+      manifest_add "$cmd" "${CLAUDE_REL}commands/$(basename "$cmd")" 644
+      CMD_COUNT=$((CMD_COUNT + 1))
     fi
   done
 
@@ -204,6 +221,7 @@ echo "[6/9] Installing agents..."
 
 if [ "$GLOBALLY_INSTALLED" = true ]; then
   AGENT_COUNT=0
+  manifest_keep "${CLAUDE_REL}agents/"
   echo "  - Already installed globally -- skipping"
 else
   if [ "$GLOBAL_INSTALL" = true ]; then
@@ -219,12 +237,11 @@ else
     for category in "$PLUGIN_DIR/agents"/*/; do
       if [ -d "$category" ]; then
         category_name=$(basename "$category")
-        mkdir -p "$AGENTS_DIR/$category_name"
 
         for agent in "$category"/*.md; do
           if [ -f "$agent" ]; then
-            cp "$agent" "$AGENTS_DIR/$category_name/$(basename "$agent")"
-            ((AGENT_COUNT++))
+            manifest_add "$agent" "${CLAUDE_REL}agents/$category_name/$(basename "$agent")" 644
+            AGENT_COUNT=$((AGENT_COUNT + 1))
           fi
         done
       fi
@@ -241,6 +258,7 @@ SKILL_COUNT=0
 SKILL_SKIPPED=0
 
 if [ "$GLOBALLY_INSTALLED" = true ]; then
+  manifest_keep "${CLAUDE_REL}skills/"
   echo "  - Already installed globally -- skipping"
 else
   if [ "$GLOBAL_INSTALL" = true ]; then
@@ -260,22 +278,20 @@ else
           echo "  - Skipped $skill_name (symlink, not ours)"
           ((SKILL_SKIPPED++))
           continue
-        elif [ -d "$SKILLS_DIR/$skill_name" ]; then
-          if [ -f "$SKILLS_DIR/$skill_name/.beads-compound" ]; then
-            # Our plugin installed this -- safe to overwrite
-            rm -rf "$SKILLS_DIR/$skill_name"
-          else
-            # User's own skill -- skip it
-            echo "  - Skipped $skill_name (already exists, not ours)"
-            ((SKILL_SKIPPED++))
-            continue
-          fi
+        elif [ -d "$SKILLS_DIR/$skill_name" ] && [ ! -f "$SKILLS_DIR/$skill_name/.beads-compound" ]; then
+          # User's own skill -- skip it
+          echo "  - Skipped $skill_name (already exists, not ours)"
+          SKILL_SKIPPED=$((SKILL_SKIPPED + 1))
+          continue
         fi
 
-        # Copy entire skill directory (may contain references/, templates/, etc.)
-        cp -r "$skill_dir" "$SKILLS_DIR/$skill_name"
+        # Queue the entire skill directory (may contain references/, templates/, etc.)
+        while IFS= read -r skill_file; do
+          manifest_add "$skill_file" "${CLAUDE_REL}skills/$skill_name/${skill_file#"$skill_dir"}"
+        done < <(find "$skill_dir" -type f)
+        mkdir -p "$SKILLS_DIR/$skill_name"
         touch "$SKILLS_DIR/$skill_name/.beads-compound"
-        ((SKILL_COUNT++))
+        SKILL_COUNT=$((SKILL_COUNT + 1))
       fi
     done
   fi
@@ -339,13 +355,8 @@ if [ "$GLOBAL_INSTALL" = true ]; then
   echo "[9/9] Configuring global settings..."
 
   # Install all hook scripts for auto-installation in beads projects
-  mkdir -p "$TARGET/hooks"
-
-  for hook in check-memory.sh auto-recall.sh memory-capture.sh subagent-wrapup.sh knowledge-db.sh provision-memory.sh recall.sh; do
-    if [ -f "$PLUGIN_DIR/hooks/$hook" ]; then
-      cp "$PLUGIN_DIR/hooks/$hook" "$TARGET/hooks/$hook"
-      chmod +x "$TARGET/hooks/$hook"
-    fi
+  for hook in check-memory.sh auto-recall.sh memory-capture.sh subagent-wrapup.sh knowledge-db.sh knowledge-index.py provision-memory.sh recall.sh hook-trace.sh; do
+    manifest_add "$PLUGIN_DIR/hooks/$hook" "hooks/$hook" 755
   done
 
   echo "  - Installed hook scripts (check-memory + memory hooks for auto-install)"
@@ -436,6 +447,28 @@ SETTINGS_EOF
   fi
 fi
 
+# Place queued files: copy (or link) what changed, drop what the plugin no longer ships
+manifest_commit
+echo "  - Manifest: $MANIFEST_COPIED updated, $MANIFEST_UNCHANGED unchanged, $MANIFEST_REMOVED removed"
+if [ "$INSTALL_MODE" = link ]; then
+  echo "  - Symlinked into $PLUGIN_DIR (keep that checkout in place)"
+fi
+
+# Global install: stamp the per-project hook set so check-memory.sh can tell
+# whether a project's hook copies are current without hashing anything.
+# Symlinked installs track the checkout, so they get no stamp.
+if [ "$GLOBAL_INSTALL" = true ]; then
+  STAMP="$TARGET/hooks/.beads-compound-stamp"
+  if [ "$INSTALL_MODE" = link ]; then
+    rm -f "$STAMP"
+  else
+    PLUGIN_VERSION=$(sed -n 's/.*"version": *"\([^"]*\)".*/\1/p' "$PLUGIN_DIR/.claude-plugin/plugin.json" | head -1)
+    HOOK_HASHES=$(cd "$PLUGIN_DIR/hooks" && $MANIFEST_SHA256 memory-capture.sh auto-recall.sh subagent-wrapup.sh knowledge-db.sh knowledge-index.py provision-memory.sh recall.sh hook-trace.sh)
+    printf '%s %s\n%s\n' "${PLUGIN_VERSION:-unknown}" "$(printf '%s\n' "$HOOK_HASHES" | $MANIFEST_SHA256 | cut -c1-16)" "$HOOK_HASHES" > "$STAMP"
+    chmod 644 "$STAMP"
+  fi
+fi
+
 # Update .gitignore (only for project-specific installs)
 if [ "$GLOBAL_INSTALL" = false ]; then
   GITIGNORE="$TARGET/.gitignore"
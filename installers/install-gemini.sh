@@ -10,7 +10,10 @@
 #   - MCP server configuration documentation
 #
 # Usage:
-#   Called by install.sh -gemini [target]
+#   Called by install.sh -gemini [--symlink] [target]
+#
+# Installed files are recorded in .beads-compound-manifest; re-running the
+# installer only copies files that changed and removes ones the plugin dropped.
 #
 
 set -euo pipefail
@@ -32,13 +35,15 @@ PLUGIN_DIR="$SCRIPT_DIR/plugins/beads-compound"
 INSTALLER_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "$INSTALLER_DIR/shared-functions.sh"
 
-# Parse --yes/-y flag (skip confirmation prompts)
+# Parse --yes/-y flag (skip confirmation prompts) and --symlink
 AUTO_YES=false
+INSTALL_MODE=copy
 POSITIONAL_ARGS=()
 
 for arg in "$@"; do
   case "$arg" in
     --yes|-y) AUTO_YES=true ;;
+    --symlink) INSTALL_MODE=link ;;
     *) POSITIONAL_ARGS+=("$arg") ;;
   esac
 done
@@ -107,9 +112,12 @@ echo "📂 Step 2/4: Installing hooks..."
 HOOKS_DIR="$TARGET/hooks"
 create_dir_with_symlink_handling "$HOOKS_DIR"
 
-for hook in auto-recall.sh memory-capture.sh subagent-wrapup.sh; do
-  cp "$PLUGIN_DIR/hooks/$hook" "$HOOKS_DIR/"
-  chmod 755 "$HOOKS_DIR/$hook"
+# Files are queued into the install manifest and placed in one pass by
+# manifest_commit (paths are relative to $TARGET)
+manifest_begin "$TARGET" "$TARGET/$MANIFEST_NAME" "$INSTALL_MODE"
+
+for hook in auto-recall.sh memory-capture.sh subagent-wrapup.sh hook-trace.sh; do
+  manifest_add "$PLUGIN_DIR/hooks/$hook" "hooks/$hook" 755
   echo "  ✓ $hook"
 done
 
@@ -122,8 +130,9 @@ echo "📋 Step 3/4: Installing commands, agents, and skills..."
 COMMANDS_DIR="$TARGET/commands"
 create_dir_with_symlink_handling "$COMMANDS_DIR"
 
-find "$PLUGIN_DIR/gemini/commands" -name "*.toml" -exec cp {} "$COMMANDS_DIR/" \;
-find "$COMMANDS_DIR" -type f -exec chmod 644 {} \;
+while IFS= read -r cmd; do
+  manifest_add "$cmd" "commands/$(basename "$cmd")" 644
+done < <(find "$PLUGIN_DIR/gemini/commands" -name "*.toml")
 
 echo "  ✓ Installed $(find "$PLUGIN_DIR/gemini/commands" -name "*.toml" | wc -l | tr -d ' ') commands (.toml)"
 
@@ -132,14 +141,13 @@ AGENTS_DIR="$TARGET/agents"
 create_dir_with_symlink_handling "$AGENTS_DIR"
 
 for category in review research design workflow docs; do
-  mkdir -p "$AGENTS_DIR/$category"
   if [ -d "$PLUGIN_DIR/gemini/agents/$category" ]; then
-    find "$PLUGIN_DIR/gemini/agents/$category" -name "*.md" -exec cp {} "$AGENTS_DIR/$category/" \;
+    while IFS= read -r agent; do
+      manifest_add "$agent" "agents/$category/$(basename "$agent")" 644
+    done < <(find "$PLUGIN_DIR/gemini/agents/$category" -name "*.md")
   fi
 done
 
-find "$AGENTS_DIR" -type f -exec chmod 644 {} \;
-
 echo "  ✓ Installed $(find "$PLUGIN_DIR/gemini/agents" -name "*.md" | wc -l | tr -d ' ') agents"
 
 # Skills
@@ -149,13 +157,15 @@ mkdir -p "$SKILLS_DIR"
 for skill_dir in "$PLUGIN_DIR/gemini/skills"/*; do
   if [ -d "$skill_dir" ]; then
     skill_name=$(basename "$skill_dir")
-    mkdir -p "$SKILLS_DIR/$skill_name"
-    cp "$skill_dir/SKILL.md" "$SKILLS_DIR/$skill_name/" 2>/dev/null || true
-    chmod 444 "$SKILLS_DIR/$skill_name/SKILL.md" 2>/dev/null || true
+    manifest_add "$skill_dir/SKILL.md" "skills/$skill_name/SKILL.md" 444
   fi
 done
 
 echo "  ✓ Installed $(find "$PLUGIN_DIR/gemini/skills" -mindepth 1 -maxdepth 1 -type d | wc -l | tr -d ' ') skills"
+
+# Place queued files: copy (or link) what changed, drop what the plugin no longer ships
+manifest_commit
+echo "  ✓ Manifest: $MANIFEST_COPIED updated, $MANIFEST_UNCHANGED unchanged, $MANIFEST_REMOVED removed"
 echo ""
 
 # Step 4: Provision memory (only for project-specific installs)
@@ -172,9 +182,11 @@ else
   # Copy recall scripts
   cp "$PLUGIN_DIR/hooks/recall.sh" "$BEADS_MEMORY_DIR/"
   cp "$PLUGIN_DIR/hooks/knowledge-db.sh" "$BEADS_MEMORY_DIR/"
+  cp "$PLUGIN_DIR/hooks/knowledge-index.py" "$BEADS_MEMORY_DIR/"
 
   chmod 755 "$BEADS_MEMORY_DIR/recall.sh"
   chmod 755 "$BEADS_MEMORY_DIR/knowledge-db.sh"
+  chmod 755 "$BEADS_MEMORY_DIR/knowledge-index.py"
 
   # Create knowledge.jsonl if it doesn't exist
   if [ ! -f "$BEADS_MEMORY_DIR/knowledge.jsonl" ]; then
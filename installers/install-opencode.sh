@@ -10,7 +10,10 @@
 #   - MCP server configuration documentation
 #
 # Usage:
-#   Called by install.sh -opencode [target]
+#   Called by install.sh -opencode [--symlink] [target]
+#
+# Installed files are recorded in .beads-compound-manifest; re-running the
+# installer only copies files that changed and removes ones the plugin dropped.
 #
 
 set -euo pipefail
@@ -32,13 +35,15 @@ PLUGIN_DIR="$SCRIPT_DIR/plugins/beads-compound"
 INSTALLER_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "$INSTALLER_DIR/shared-functions.sh"
 
-# Parse --yes/-y flag (skip confirmation prompts)
+# Parse --yes/-y flag (skip confirmation prompts) and --symlink
 AUTO_YES=false
+INSTALL_MODE=copy
 POSITIONAL_ARGS=()
 
 for arg in "$@"; do
   case "$arg" in
     --yes|-y) AUTO_YES=true ;;
+    --symlink) INSTALL_MODE=link ;;
     *) POSITIONAL_ARGS+=("$arg") ;;
   esac
 done
@@ -133,40 +138,33 @@ fi
 
 create_dir_with_symlink_handling "$PLUGINS_DIR"
 
-cp "$PLUGIN_DIR/opencode-src/plugin.ts" "$PLUGINS_DIR/"
-cp "$PLUGIN_DIR/opencode-src/package.json" "$PLUGINS_DIR/"
+# Determine base directory: global uses $TARGET directly, project uses $TARGET/.opencode
+if [ "$GLOBAL_INSTALL" = true ]; then
+  BASE_DIR="$TARGET"
+  BASE_REL=""
+else
+  BASE_DIR="$TARGET/.opencode"
+  BASE_REL=".opencode/"
+fi
 
-# Set permissions
-chmod 644 "$PLUGINS_DIR/plugin.ts"
-chmod 644 "$PLUGINS_DIR/package.json"
+# Files are queued into the install manifest and placed in one pass by
+# manifest_commit (paths are relative to $TARGET)
+manifest_begin "$TARGET" "$BASE_DIR/$MANIFEST_NAME" "$INSTALL_MODE"
 
-echo "  ✓ Installed plugin.ts and package.json"
+manifest_add "$PLUGIN_DIR/opencode-src/plugin.ts" "${PLUGINS_DIR#"$TARGET"/}/plugin.ts" 644
+manifest_add "$PLUGIN_DIR/opencode-src/package.json" "${PLUGINS_DIR#"$TARGET"/}/package.json" 644
 
-# Install plugin dependencies
-cd "$PLUGINS_DIR"
-if ! bun install --frozen-lockfile 2>/dev/null; then
-  echo "  ⚠️  Frozen lockfile not found, running regular install..."
-  bun install
-fi
-
-echo "  ✓ Installed plugin dependencies"
+echo "  ✓ Queued plugin.ts and package.json (dependencies install after step 5)"
 echo ""
 
 # Step 4: Copy hooks
 echo "📂 Step 4/6: Installing hooks..."
 
-# Determine base directory: global uses $TARGET directly, project uses $TARGET/.opencode
-if [ "$GLOBAL_INSTALL" = true ]; then
-  HOOKS_DIR="$TARGET/hooks"
-else
-  HOOKS_DIR="$TARGET/.opencode/hooks"
-fi
-
+HOOKS_DIR="$BASE_DIR/hooks"
 create_dir_with_symlink_handling "$HOOKS_DIR"
 
-for hook in auto-recall.sh memory-capture.sh subagent-wrapup.sh; do
-  cp "$PLUGIN_DIR/hooks/$hook" "$HOOKS_DIR/"
-  chmod 755 "$HOOKS_DIR/$hook"
+for hook in auto-recall.sh memory-capture.sh subagent-wrapup.sh hook-trace.sh hook-server.sh; do
+  manifest_add "$PLUGIN_DIR/hooks/$hook" "${BASE_REL}hooks/$hook" 755
   echo "  ✓ $hook"
 done
 
@@ -175,19 +173,13 @@ echo ""
 # Step 5: Copy converted files
 echo "📋 Step 5/6: Installing commands, agents, and skills..."
 
-# Determine base directory: global uses $TARGET directly, project uses $TARGET/.opencode
-if [ "$GLOBAL_INSTALL" = true ]; then
-  BASE_DIR="$TARGET"
-else
-  BASE_DIR="$TARGET/.opencode"
-fi
-
 # Commands
 COMMANDS_DIR="$BASE_DIR/commands"
 create_dir_with_symlink_handling "$COMMANDS_DIR"
 
-find "$PLUGIN_DIR/opencode/commands" -name "*.md" -exec cp {} "$COMMANDS_DIR/" \;
-find "$COMMANDS_DIR" -type f -exec chmod 644 {} \;
+while IFS= read -r cmd; do
+  manifest_add "$cmd" "${BASE_REL}commands/$(basename "$cmd")" 644
+done < <(find "$PLUGIN_DIR/opencode/commands" -name "*.md")
 
 echo "  ✓ Installed $(find "$PLUGIN_DIR/opencode/commands" -name "*.md" | wc -l | tr -d ' ') commands"
 
@@ -196,14 +188,13 @@ AGENTS_DIR="$BASE_DIR/agents"
 create_dir_with_symlink_handling "$AGENTS_DIR"
 
 for category in review research design workflow docs; do
-  mkdir -p "$AGENTS_DIR/$category"
   if [ -d "$PLUGIN_DIR/opencode/agents/$category" ]; then
-    find "$PLUGIN_DIR/opencode/agents/$category" -name "*.md" -exec cp {} "$AGENTS_DIR/$category/" \;
+    while IFS= read -r agent; do
+      manifest_add "$agent" "${BASE_REL}agents/$category/$(basename "$agent")" 644
+    done < <(find "$PLUGIN_DIR/opencode/agents/$category" -name "*.md")
   fi
 done
 
-find "$AGENTS_DIR" -type f -exec chmod 644 {} \;
-
 echo "  ✓ Installed $(find "$PLUGIN_DIR/opencode/agents" -name "*.md" | wc -l | tr -d ' ') agents"
 
 # Skills
@@ -213,13 +204,24 @@ create_dir_with_symlink_handling "$SKILLS_DIR"
 for skill_dir in "$PLUGIN_DIR/opencode/skills"/*; do
   if [ -d "$skill_dir" ]; then
     skill_name=$(basename "$skill_dir")
-    mkdir -p "$SKILLS_DIR/$skill_name"
-    cp "$skill_dir/SKILL.md" "$SKILLS_DIR/$skill_name/" 2>/dev/null || true
-    chmod 444 "$SKILLS_DIR/$skill_name/SKILL.md" 2>/dev/null || true
+    manifest_add "$skill_dir/SKILL.md" "${BASE_REL}skills/$skill_name/SKILL.md" 444
   fi
 done
 
 echo "  ✓ Installed $(find "$PLUGIN_DIR/opencode/skills" -mindepth 1 -maxdepth 1 -type d | wc -l | tr -d ' ') skills"
+
+# Place queued files: copy (or link) what changed, drop what the plugin no longer ships
+manifest_commit
+echo "  ✓ Manifest: $MANIFEST_COPIED updated, $MANIFEST_UNCHANGED unchanged, $MANIFEST_REMOVED removed"
+
+# Install plugin dependencies
+cd "$PLUGINS_DIR"
+if ! bun install --frozen-lockfile 2>/dev/null; then
+  echo "  ⚠️  Frozen lockfile not found, running regular install..."
+  bun install
+fi
+
+echo "  ✓ Installed plugin dependencies"
 echo ""
 
 # Step 6: Provision memory (only for project-specific installs)
@@ -236,9 +238,11 @@ else
   # Copy recall scripts
   cp "$PLUGIN_DIR/hooks/recall.sh" "$BEADS_MEMORY_DIR/"
   cp "$PLUGIN_DIR/hooks/knowledge-db.sh" "$BEADS_MEMORY_DIR/"
+  cp "$PLUGIN_DIR/hooks/knowledge-index.py" "$BEADS_MEMORY_DIR/"
 
   chmod 755 "$BEADS_MEMORY_DIR/recall.sh"
   chmod 755 "$BEADS_MEMORY_DIR/knowledge-db.sh"
+  chmod 755 "$BEADS_MEMORY_DIR/knowledge-index.py"
 
   # Create knowledge.jsonl if it doesn't exist
   if [ ! -f "$BEADS_MEMORY_DIR/knowledge.jsonl" ]; then
@@ -51,3 +51,193 @@ resolve_target_dir() {
 
   echo "$resolved"
 }
+
+# --- Install manifest -------------------------------------------------------
+#
+# Every file an installer places is recorded in a manifest (one
+# "relpath<TAB>sha256<TAB>mode" line per file, mode is an octal mode or
+# "link"). Re-installs compare source hashes against it, so only new or
+# changed files are copied, files dropped from the plugin are removed, and
+# the uninstallers get an exact file list.
+#
+#   manifest_begin ROOT MANIFEST_FILE [copy|link]
+#   manifest_add SRC RELPATH [MODE]     # queue a file (RELPATH under ROOT)
+#   manifest_keep PREFIX                # carry old entries under PREFIX forward
+#   manifest_commit                     # copy/link/remove, write the manifest
+#   manifest_uninstall ROOT MANIFEST_FILE
+
+MANIFEST_NAME=".beads-compound-manifest"
+
+# sha256sum on Linux, shasum on macOS
+if command -v sha256sum &>/dev/null; then
+  MANIFEST_SHA256="sha256sum"
+else
+  MANIFEST_SHA256="shasum -a 256"
+fi
+
+manifest_begin() {
+  MANIFEST_ROOT="$1"
+  MANIFEST_FILE="$2"
+  MANIFEST_MODE="${3:-copy}"
+  MANIFEST_QUEUE=$(mktemp "${TMPDIR:-/tmp}/beads-manifest.XXXXXX")
+  MANIFEST_KEEP=""
+  MANIFEST_COPIED=0
+  MANIFEST_UNCHANGED=0
+  MANIFEST_REMOVED=0
+  MANIFEST_KEPT=0
+}
+
+manifest_add() {
+  local src="$1" rel="$2" mode="${3:-}"
+  [ -f "$src" ] || return 0
+  if [ -z "$mode" ]; then
+    if [ -x "$src" ]; then mode=755; else mode=644; fi
+  fi
+  printf '%s\t%s\t%s\n' "$src" "$rel" "$mode" >> "$MANIFEST_QUEUE"
+}
+
+manifest_keep() {
+  MANIFEST_KEEP="$MANIFEST_KEEP$1"$'\n'
+}
+
+# Remove now-empty directories from DIR up to (not including) MANIFEST_ROOT.
+# A skill directory holding nothing but our marker counts as empty.
+_manifest_prune() {
+  local dir="$1" root="$2"
+  while [ "$dir" != "$root" ] && [ "${dir#"$root"/}" != "$dir" ]; do
+    if [ -f "$dir/.beads-compound" ] && [ "$(ls -A "$dir" 2>/dev/null)" = ".beads-compound" ]; then
+      rm -f "$dir/.beads-compound"
+    fi
+    rmdir "$dir" 2>/dev/null || break
+    dir=$(dirname "$dir")
+  done
+}
+
+# Remove an installed file unless the user edited it since we recorded it.
+# Prints "removed" or "kept".
+_manifest_remove() {
+  local dest="$1" hash="$2" mode="$3" current
+  if [ "$mode" = "link" ]; then
+    [ -L "$dest" ] && rm -f "$dest"
+    echo removed
+    return
+  fi
+  [ -f "$dest" ] || { echo removed; return; }
+  current=$($MANIFEST_SHA256 "$dest" | cut -d' ' -f1)
+  if [ "$current" = "$hash" ]; then
+    rm -f "$dest"
+    echo removed
+  else
+    echo kept
+  fi
+}
+
+manifest_commit() {
+  local new old plan action src rel mode hash dest tmp present
+  new="$MANIFEST_QUEUE.new"
+  old="$MANIFEST_FILE"
+  [ -f "$old" ] || old=/dev/null
+  plan="$MANIFEST_QUEUE.plan"
+
+  # Hash every queued source in one call; xargs keeps input order
+  if [ -s "$MANIFEST_QUEUE" ]; then
+    cut -f1 "$MANIFEST_QUEUE" | tr '\n' '\0' | xargs -0 $MANIFEST_SHA256 \
+      | cut -d' ' -f1 | sed 's/^\\//' | paste "$MANIFEST_QUEUE" - > "$new"
+  else
+    : > "$new"
+  fi
+
+  # Join against the previous manifest:
+  #   copy SRC REL MODE HASH | same SRC REL MODE HASH | stale - REL MODE HASH | keep - REL MODE HASH
+  awk -F'\t' -v OFS='\t' -v link="$MANIFEST_MODE" -v keep="$MANIFEST_KEEP" -v oldf="$old" '
+    BEGIN {
+      n = split(keep, prefixes, "\n")
+      while ((getline line < oldf) > 0) {
+        split(line, f, "\t")
+        oh[f[1]] = f[2]; om[f[1]] = f[3]; order[++o] = f[1]
+      }
+    }
+    {
+      mode = (link == "link") ? "link" : $3
+      seen[$2] = 1
+      print (($2 in oh) && oh[$2] == $4 && om[$2] == mode) ? "same" : "copy", $1, $2, mode, $4
+    }
+    END {
+      for (i = 1; i <= o; i++) {
+        r = order[i]
+        if (r in seen) continue
+        kept = 0
+        for (p = 1; p <= n; p++)
+          if (prefixes[p] != "" && index(r, prefixes[p]) == 1) kept = 1
+        print kept ? "keep" : "stale", "-", r, om[r], oh[r]
+      }
+    }
+  ' "$new" > "$plan"
+
+  : > "$new"
+  while IFS=$'\t' read -r action src rel mode hash; do
+    dest="$MANIFEST_ROOT/$rel"
+    case "$action" in
+      same|copy)
+        # Re-copy anything deleted (or swapped between file and link) since
+        present=false
+        if [ "$mode" = "link" ]; then
+          [ -L "$dest" ] && present=true
+        else
+          [ -f "$dest" ] && [ ! -L "$dest" ] && present=true
+        fi
+        if [ "$action" = "same" ] && [ "$present" = true ]; then
+          MANIFEST_UNCHANGED=$((MANIFEST_UNCHANGED + 1))
+        else
+          mkdir -p "$(dirname "$dest")"
+          if [ "$mode" = "link" ]; then
+            rm -f "$dest"
+            ln -s "$src" "$dest"
+          else
+            tmp="$dest.beads-tmp.$$"
+            cp "$src" "$tmp" && chmod "$mode" "$tmp" && mv -f "$tmp" "$dest"
+          fi
+          MANIFEST_COPIED=$((MANIFEST_COPIED + 1))
+        fi
+        printf '%s\t%s\t%s\n' "$rel" "$hash" "$mode" >> "$new"
+        ;;
+      keep)
+        printf '%s\t%s\t%s\n' "$rel" "$hash" "$mode" >> "$new"
+        ;;
+      stale)
+        if [ "$(_manifest_remove "$dest" "$hash" "$mode")" = "removed" ]; then
+          MANIFEST_REMOVED=$((MANIFEST_REMOVED + 1))
+          _manifest_prune "$(dirname "$dest")" "$MANIFEST_ROOT"
+        else
+          MANIFEST_KEPT=$((MANIFEST_KEPT + 1))
+          echo "  [!] Kept $rel (modified locally, no longer part of the plugin)"
+        fi
+        ;;
+    esac
+  done < "$plan"
+
+  mkdir -p "$(dirname "$MANIFEST_FILE")"
+  mv -f "$new" "$MANIFEST_FILE"
+  chmod 644 "$MANIFEST_FILE"
+  rm -f "$MANIFEST_QUEUE" "$plan"
+}
+
+# Remove everything a manifest lists (skipping locally modified files) and
+# the manifest itself. Returns 1 when there is no manifest.
+manifest_uninstall() {
+  local root="$1" manifest="$2" rel hash mode
+  MANIFEST_REMOVED=0
+  MANIFEST_KEPT=0
+  [ -f "$manifest" ] || return 1
+  while IFS=$'\t' read -r rel hash mode; do
+    [ -n "$rel" ] || continue
+    if [ "$(_manifest_remove "$root/$rel" "$hash" "$mode")" = "removed" ]; then
+      MANIFEST_REMOVED=$((MANIFEST_REMOVED + 1))
+      _manifest_prune "$(dirname "$root/$rel")" "$root"
+    else
+      MANIFEST_KEPT=$((MANIFEST_KEPT + 1))
+      echo "  [!] Kept $rel (modified locally)"
+    fi
+  done < "$manifest"
+  rm -f "$manifest"
+}
@@ -9,6 +9,10 @@
 #   - Skills from .claude/skills/
 #   - Hook configuration from .claude/settings.json
 #
+# Installs that wrote a .beads-compound-manifest are removed file by file from
+# that list (locally modified files are kept); older installs fall back to the
+# known file lists below.
+#
 # What this PRESERVES:
 #   - .beads/ directory and all data
 #   - .beads/memory/ and knowledge.jsonl (your accumulated knowledge)
@@ -31,6 +35,9 @@ set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 
+# Source shared functions (BASH_SOURCE: this script is sourced by uninstall.sh)
+source "$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)/shared-functions.sh"
+
 # Default to ~/.claude if no argument provided
 if [ $# -eq 0 ]; then
   TARGET="$HOME/.claude"
@@ -52,6 +59,29 @@ echo ""
 
 REMOVED_COUNT=0
 
+# Remove exactly what the installer recorded
+if [ "$GLOBAL_UNINSTALL" = true ]; then
+  MANIFEST="$TARGET/$MANIFEST_NAME"
+else
+  MANIFEST="$TARGET/.claude/$MANIFEST_NAME"
+fi
+
+# Hook stamps (written by the global installer and check-memory.sh) are not
+# listed in the manifest
+if [ "$GLOBAL_UNINSTALL" = true ]; then
+  rm -f "$TARGET/hooks/.beads-compound-stamp"
+else
+  rm -f "$TARGET/.claude/hooks/.beads-compound-stamp" "$TARGET/.claude/hooks/.beads-compound-source-meta"
+fi
+
+MANIFEST_USED=false
+if manifest_uninstall "$TARGET" "$MANIFEST"; then
+  MANIFEST_USED=true
+  echo "Removed $MANIFEST_REMOVED installed file(s) listed in $MANIFEST_NAME"
+  REMOVED_COUNT=$((REMOVED_COUNT + MANIFEST_REMOVED))
+  echo ""
+fi
+
 # Remove hooks
 echo "[1/5] Removing hooks..."
 
@@ -61,8 +91,10 @@ else
   HOOKS_DIR="$TARGET/.claude/hooks"
 fi
 
-if [ -d "$HOOKS_DIR" ]; then
-  for hook in memory-capture.sh auto-recall.sh subagent-wrapup.sh knowledge-db.sh provision-memory.sh check-memory.sh; do
+if [ "$MANIFEST_USED" = true ]; then
+  echo "  - Removed via install manifest"
+elif [ -d "$HOOKS_DIR" ]; then
+  for hook in memory-capture.sh auto-recall.sh subagent-wrapup.sh knowledge-db.sh knowledge-index.py provision-memory.sh check-memory.sh hook-trace.sh; do
     if [ -f "$HOOKS_DIR/$hook" ]; then
       rm "$HOOKS_DIR/$hook"
       echo "  - Removed $hook"
@@ -89,7 +121,9 @@ else
   COMMANDS_DIR="$TARGET/.claude/commands"
 fi
 
-if [ -d "$COMMANDS_DIR" ]; then
+if [ "$MANIFEST_USED" = true ]; then
+  echo "  - Removed via install manifest"
+elif [ -d "$COMMANDS_DIR" ]; then
   PLUGIN_COMMANDS=(
     beads-plan.md beads-work.md beads-parallel.md beads-review.md beads-checkpoint.md
     beads-brainstorm.md beads-compound.md
@@ -121,7 +155,9 @@ else
   AGENTS_DIR="$TARGET/.claude/agents"
 fi
 
-if [ -d "$AGENTS_DIR" ]; then
+if [ "$MANIFEST_USED" = true ]; then
+  echo "  - Removed via install manifest"
+elif [ -d "$AGENTS_DIR" ]; then
   AGENT_CATEGORIES=(review research design docs workflow)
 
   for category in "${AGENT_CATEGORIES[@]}"; do
@@ -151,7 +187,9 @@ else
   SKILLS_DIR="$TARGET/.claude/skills"
 fi
 
-if [ -d "$SKILLS_DIR" ]; then
+if [ "$MANIFEST_USED" = true ]; then
+  echo "  - Removed via install manifest"
+elif [ -d "$SKILLS_DIR" ]; then
   PLUGIN_SKILLS=(git-worktree brainstorming create-agent-skills agent-native-architecture beads-knowledge agent-browser andrew-kane-gem-writer dhh-rails-style dspy-ruby every-style-editor file-todos frontend-design gemini-imagegen rclone skill-creator)
 
   for skill in "${PLUGIN_SKILLS[@]}"; do
@@ -10,6 +10,9 @@ set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 
+# Source shared functions (BASH_SOURCE: this script is sourced by uninstall.sh)
+source "$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)/shared-functions.sh"
+
 # Default to ~/.config/gemini if no argument provided
 if [ $# -eq 0 ]; then
   TARGET="$HOME/.config/gemini"
@@ -43,7 +46,7 @@ echo "  - All hooks (hooks/)"
 echo "  - All commands (commands/*.toml)"
 echo "  - All agents (agents/)"
 echo "  - All skills (skills/)"
-echo "  - Memory scripts (recall.sh, knowledge-db.sh)"
+echo "  - Memory scripts (recall.sh, knowledge-db.sh, knowledge-index.py)"
 echo ""
 echo "Note: Your knowledge.jsonl database will be preserved"
 echo ""
@@ -58,9 +61,16 @@ fi
 echo ""
 echo "🗑️  Removing files..."
 
+# Remove exactly what the installer recorded; fall back to known file lists
+MANIFEST_USED=false
+if manifest_uninstall "$TARGET" "$TARGET/$MANIFEST_NAME"; then
+  MANIFEST_USED=true
+  echo "  ✓ Removed $MANIFEST_REMOVED installed file(s) listed in $MANIFEST_NAME"
+fi
+
 # Remove hooks
-if [ -d "$TARGET/hooks" ]; then
-  for hook in auto-recall.sh memory-capture.sh subagent-wrapup.sh; do
+if [ "$MANIFEST_USED" = false ] && [ -d "$TARGET/hooks" ]; then
+  for hook in auto-recall.sh memory-capture.sh subagent-wrapup.sh hook-trace.sh; do
     if [ -f "$TARGET/hooks/$hook" ]; then
       rm "$TARGET/hooks/$hook"
       echo "  ✓ Removed $hook"
@@ -69,14 +79,14 @@ if [ -d "$TARGET/hooks" ]; then
 fi
 
 # Remove commands (.toml files)
-if [ -d "$TARGET/commands" ]; then
+if [ "$MANIFEST_USED" = false ] && [ -d "$TARGET/commands" ]; then
   # Remove all .toml files generated by plugin
   find "$TARGET/commands" -type f -name "*.toml" -exec grep -l "Generated by beads-compound" {} \; -delete 2>/dev/null || true
   echo "  ✓ Removed commands (.toml)"
 fi
 
 # Remove agents
-if [ -d "$TARGET/agents" ]; then
+if [ "$MANIFEST_USED" = false ] && [ -d "$TARGET/agents" ]; then
   for category in review research design workflow docs; do
     if [ -d "$TARGET/agents/$category" ]; then
       find "$TARGET/agents/$category" -type f -name "*.md" -exec grep -l "Generated by beads-compound" {} \; -delete 2>/dev/null || true
@@ -86,7 +96,7 @@ if [ -d "$TARGET/agents" ]; then
 fi
 
 # Remove skills
-if [ -d "$TARGET/skills" ]; then
+if [ "$MANIFEST_USED" = false ] && [ -d "$TARGET/skills" ]; then
   # List of known plugin skills
   PLUGIN_SKILLS=(
     git-worktree brainstorming create-agent-skills agent-native-architecture
@@ -117,6 +127,10 @@ if [ -d "$TARGET/.beads/memory" ]; then
     rm "$TARGET/.beads/memory/knowledge-db.sh"
     echo "  ✓ Removed knowledge-db.sh"
   fi
+  if [ -f "$TARGET/.beads/memory/knowledge-index.py" ]; then
+    rm "$TARGET/.beads/memory/knowledge-index.py"
+    echo "  ✓ Removed knowledge-index.py"
+  fi
 
   # Note: knowledge.jsonl and knowledge.archive.jsonl are preserved (user data)
   if [ -f "$TARGET/.beads/memory/knowledge.jsonl" ]; then
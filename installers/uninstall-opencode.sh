@@ -10,6 +10,9 @@ set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 
+# Source shared functions (BASH_SOURCE: this script is sourced by uninstall.sh)
+source "$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)/shared-functions.sh"
+
 # Default to ~/.config/opencode if no argument provided
 if [ $# -eq 0 ]; then
   TARGET="$HOME/.config/opencode"
@@ -58,7 +61,7 @@ else
   echo "  - All agents (.opencode/agents/)"
   echo "  - All skills (.opencode/skills/)"
 fi
-echo "  - Memory scripts (recall.sh, knowledge-db.sh)"
+echo "  - Memory scripts (recall.sh, knowledge-db.sh, knowledge-index.py)"
 echo ""
 echo "Note: Your knowledge.jsonl database will be preserved"
 echo ""
@@ -73,6 +76,13 @@ fi
 echo ""
 echo "🗑️  Removing files..."
 
+# Remove exactly what the installer recorded; fall back to known file lists
+MANIFEST_USED=false
+if manifest_uninstall "$TARGET" "$BASE_DIR/$MANIFEST_NAME"; then
+  MANIFEST_USED=true
+  echo "  ✓ Removed $MANIFEST_REMOVED installed file(s) listed in $MANIFEST_NAME"
+fi
+
 # Remove plugin
 if [ -d "$TARGET/plugins/beads-compound" ]; then
   rm -rf "$TARGET/plugins/beads-compound"
@@ -80,8 +90,8 @@ if [ -d "$TARGET/plugins/beads-compound" ]; then
 fi
 
 # Remove hooks
-if [ -d "$BASE_DIR/hooks" ]; then
-  for hook in auto-recall.sh memory-capture.sh subagent-wrapup.sh; do
+if [ "$MANIFEST_USED" = false ] && [ -d "$BASE_DIR/hooks" ]; then
+  for hook in auto-recall.sh memory-capture.sh subagent-wrapup.sh hook-trace.sh hook-server.sh; do
     if [ -f "$BASE_DIR/hooks/$hook" ]; then
       rm "$BASE_DIR/hooks/$hook"
       echo "  ✓ Removed $hook"
@@ -90,14 +100,14 @@ if [ -d "$BASE_DIR/hooks" ]; then
 fi
 
 # Remove commands
-if [ -d "$BASE_DIR/commands" ]; then
+if [ "$MANIFEST_USED" = false ] && [ -d "$BASE_DIR/commands" ]; then
   # Remove all .md files generated by plugin
   find "$BASE_DIR/commands" -type f -name "*.md" -exec grep -l "Generated by beads-compound" {} \; -delete 2>/dev/null || true
   echo "  ✓ Removed commands"
 fi
 
 # Remove agents
-if [ -d "$BASE_DIR/agents" ]; then
+if [ "$MANIFEST_USED" = false ] && [ -d "$BASE_DIR/agents" ]; then
   for category in review research design workflow docs; do
     if [ -d "$BASE_DIR/agents/$category" ]; then
       find "$BASE_DIR/agents/$category" -type f -name "*.md" -exec grep -l "Generated by beads-compound" {} \; -delete 2>/dev/null || true
@@ -107,7 +117,7 @@ if [ -d "$BASE_DIR/agents" ]; then
 fi
 
 # Remove skills
-if [ -d "$BASE_DIR/skills" ]; then
+if [ "$MANIFEST_USED" = false ] && [ -d "$BASE_DIR/skills" ]; then
   # List of known plugin skills
   PLUGIN_SKILLS=(
     git-worktree brainstorming create-agent-skills agent-native-architecture
@@ -138,6 +148,10 @@ if [ -d "$TARGET/.beads/memory" ]; then
     rm "$TARGET/.beads/memory/knowledge-db.sh"
     echo "  ✓ Removed knowledge-db.sh"
   fi
+  if [ -f "$TARGET/.beads/memory/knowledge-index.py" ]; then
+    rm "$TARGET/.beads/memory/knowledge-index.py"
+    echo "  ✓ Removed knowledge-index.py"
+  fi
 
   # Note: knowledge.jsonl and knowledge.archive.jsonl are preserved (user data)
   if [ -f "$TARGET/.beads/memory/knowledge.jsonl" ]; then
@@ -15,6 +15,10 @@
 # Resolve script directory early (works for both native plugin and manual install)
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 
+# Opt-in latency tracing (no-op unless BEADS_COMPOUND_TRACE=1)
+source "${0%/*}/hook-trace.sh" 2>/dev/null || { trace_init() { :; }; trace_begin() { :; }; trace_add() { :; }; trace_end() { :; }; }
+trace_init auto-recall
+
 # Exit silently if bd is not installed
 if ! command -v bd &>/dev/null; then
   exit 0
@@ -45,6 +49,8 @@ fi
 MEMORY_DIR="$PROJECT_DIR/.beads/memory"
 KNOWLEDGE_FILE="$MEMORY_DIR/knowledge.jsonl"
 
+trace_begin context
+
 # Get currently open beads
 OPEN_BEADS=$(bd list --status=open --json 2>/dev/null | jq -r '.[].id' 2>/dev/null | head -5)
 IN_PROGRESS=$(bd list --status=in_progress --json 2>/dev/null | jq -r '.[].id' 2>/dev/null | head -5)
@@ -87,9 +93,16 @@ else
       DB_PATH="$MEMORY_DIR/knowledge.db"
 
       # Incremental sync (imports new entries from JSONL into FTS5)
+      trace_begin sync
+      [[ -n "$BEADS_COMPOUND_TRACE" ]] && ROWS_BEFORE=$(sqlite3 "$DB_PATH" "SELECT count(*) FROM knowledge;" 2>/dev/null)
       kb_sync "$DB_PATH" "$MEMORY_DIR"
+      [[ -n "$BEADS_COMPOUND_TRACE" ]] && trace_add rows "$(( $(sqlite3 "$DB_PATH" "SELECT count(*) FROM knowledge;" 2>/dev/null || echo 0) - ${ROWS_BEFORE:-0} ))"
       kb_ensure_db "$DB_PATH"
 
+      # Keep this project in the cross-project index once the user opted in
+      [[ -f "$KB_GLOBAL_DB" ]] && kb_global_register "$DB_PATH" "$PROJECT_DIR"
+
+      trace_begin search
       RELEVANT_KNOWLEDGE=$(kb_search "$DB_PATH" "$SEARCH_TERMS" 10 | while IFS='|' read -r type content bead tags; do
         echo "$(echo "$type" | tr '[:lower:]' '[:upper:]'): $content"
       done)
@@ -110,6 +123,9 @@ $MATCHES"
   fi
 fi
 
+trace_add bytes "${#RELEVANT_KNOWLEDGE}"
+trace_end
+
 # If we found relevant knowledge, output it
 if [[ -n "$RELEVANT_KNOWLEDGE" ]]; then
   cat << EOF
@@ -3,7 +3,22 @@
 # SessionStart hook: auto-install memory features in beads projects
 #
 # Installed globally by ./install.sh (global install).
-# Detects beads projects missing memory hooks and installs them automatically.
+# Detects beads projects missing memory hooks and installs them automatically,
+# and refreshes project hook copies when the global install is upgraded.
+#
+# Runs at the start of every session in every directory, so the common cases
+# are answered with builtin tests only:
+#   - not a beads project                  -> one stat, exit
+#   - project managed by a project install -> its manifest owns the hooks, exit
+#   - project hooks current                -> project stamp matches the global
+#                                             stamp (.beads-compound-stamp), exit
+#   - no global stamp (marketplace,        -> source hooks' size/mtime match
+#     --symlink or legacy installs)           .beads-compound-source-meta, exit
+#
+# A stamp is "<plugin version> <hash of the hook hashes>" followed by one
+# "sha256  name" line per hook. The project stamp records what was copied, so
+# an upgrade only replaces hooks whose content changed and keeps hooks the
+# user edited locally.
 #
 
 # Only relevant if this project has .beads/ initialized
@@ -11,11 +26,16 @@ if [ ! -d ".beads" ]; then
   exit 0
 fi
 
-# Already has memory hooks -- nothing to do
-if [ -f ".claude/hooks/memory-capture.sh" ]; then
+# Installed per-project by install.sh -- upgraded by re-running it
+if [ -f ".claude/.beads-compound-manifest" ]; then
   exit 0
 fi
 
+HOOK_FILES="memory-capture.sh auto-recall.sh subagent-wrapup.sh knowledge-db.sh knowledge-index.py provision-memory.sh recall.sh hook-trace.sh"
+STAMP_NAME=".beads-compound-stamp"
+META_NAME=".beads-compound-source-meta"
+HOOKS_DIR=".claude/hooks"
+
 # Find where the hook scripts are installed
 # Try multiple locations in order:
 # 1. Global hooks directory (manual install)
@@ -31,7 +51,8 @@ fi
 
 # Option 2: Same directory as this script (for marketplace installs)
 if [ -z "$HOOKS_SOURCE_DIR" ]; then
-  SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+  SCRIPT_DIR="${0%/*}"
+  [ "$SCRIPT_DIR" = "$0" ] && SCRIPT_DIR="."
   if [ -f "$SCRIPT_DIR/memory-capture.sh" ]; then
     HOOKS_SOURCE_DIR="$SCRIPT_DIR"
   fi
@@ -39,7 +60,7 @@ fi
 
 # Option 3: Legacy plugin source path (backward compatibility)
 if [ -z "$HOOKS_SOURCE_DIR" ] && [ -f "$HOME/.claude/.beads-compound-source" ]; then
-  PLUGIN_SOURCE=$(cat "$HOME/.claude/.beads-compound-source")
+  read -r PLUGIN_SOURCE < "$HOME/.claude/.beads-compound-source"
   PLUGIN_DIR="$PLUGIN_SOURCE/plugins/beads-compound"
   if [ -f "$PLUGIN_DIR/hooks/memory-capture.sh" ]; then
     HOOKS_SOURCE_DIR="$PLUGIN_DIR/hooks"
@@ -56,7 +77,52 @@ NOFIND
   exit 0
 fi
 
-# --- Auto-install memory features ---
+# --- Fast path: project stamp matches the installed hooks ---
+
+SOURCE_STAMP=""
+PROJECT_STAMP=""
+[ -f "$HOOKS_SOURCE_DIR/$STAMP_NAME" ] && read -r SOURCE_STAMP < "$HOOKS_SOURCE_DIR/$STAMP_NAME"
+[ -f "$HOOKS_DIR/$STAMP_NAME" ] && read -r PROJECT_STAMP < "$HOOKS_DIR/$STAMP_NAME"
+
+if [ -n "$SOURCE_STAMP" ] && [ "$SOURCE_STAMP" = "$PROJECT_STAMP" ] && [ -f "$HOOKS_DIR/memory-capture.sh" ]; then
+  exit 0
+fi
+
+# --- Slow path: install or upgrade ---
+
+if command -v sha256sum &>/dev/null; then
+  SHA256="sha256sum"
+else
+  SHA256="shasum -a 256"
+fi
+
+# Source hook hashes: from the global stamp, or computed (marketplace installs
+# and --symlink installs ship no stamp)
+if [ -n "$SOURCE_STAMP" ]; then
+  SOURCE_HASHES=$(tail -n +2 "$HOOKS_SOURCE_DIR/$STAMP_NAME")
+else
+  # Without a stamp the sources would be hashed every session, so first
+  # compare their size/mtime (one stat, following symlinks) with what they
+  # were when the project stamp was last written
+  # shellcheck disable=SC2086
+  SOURCE_META="$HOOKS_SOURCE_DIR:$(cd "$HOOKS_SOURCE_DIR" && { stat -L -c '%s:%Y' $HOOK_FILES 2>/dev/null || stat -L -f '%z:%m' $HOOK_FILES 2>/dev/null; } | tr '\n' ',')"
+  RECORDED_META=""
+  [ -f "$HOOKS_DIR/$META_NAME" ] && IFS= read -r RECORDED_META < "$HOOKS_DIR/$META_NAME"
+  if [ -n "$PROJECT_STAMP" ] && [ "$SOURCE_META" = "$RECORDED_META" ] && [ -f "$HOOKS_DIR/memory-capture.sh" ]; then
+    exit 0
+  fi
+
+  # shellcheck disable=SC2086
+  SOURCE_HASHES=$(cd "$HOOKS_SOURCE_DIR" && $SHA256 $HOOK_FILES 2>/dev/null)
+  SOURCE_STAMP="unknown $(printf '%s\n' "$SOURCE_HASHES" | $SHA256 | cut -c1-16)"
+  if [ "$SOURCE_STAMP" = "$PROJECT_STAMP" ] && [ -f "$HOOKS_DIR/memory-capture.sh" ]; then
+    printf '%s\n' "$SOURCE_META" > "$HOOKS_DIR/$META_NAME"
+    exit 0
+  fi
+fi
+
+FRESH_INSTALL=false
+[ -f "$HOOKS_DIR/memory-capture.sh" ] || FRESH_INSTALL=true
 
 # 1. Set up memory directory
 PROVISION_SCRIPT="$HOOKS_SOURCE_DIR/provision-memory.sh"
@@ -71,24 +137,67 @@ else
   [ ! -f "$MEMORY_DIR/knowledge.jsonl" ] && touch "$MEMORY_DIR/knowledge.jsonl"
 fi
 
-# 2. Install hook scripts from source directory
-HOOKS_DIR=".claude/hooks"
+# 2. Install or refresh hook scripts from source directory
 mkdir -p "$HOOKS_DIR"
 
-for hook in memory-capture.sh auto-recall.sh subagent-wrapup.sh knowledge-db.sh provision-memory.sh recall.sh; do
-  if [ -f "$HOOKS_SOURCE_DIR/$hook" ]; then
-    cp "$HOOKS_SOURCE_DIR/$hook" "$HOOKS_DIR/$hook"
-    chmod +x "$HOOKS_DIR/$hook"
-  fi
-done
+# shellcheck disable=SC2086
+CURRENT_HASHES=$(cd "$HOOKS_DIR" && $SHA256 $HOOK_FILES 2>/dev/null)
+RECORDED_HASHES=""
+[ -n "$PROJECT_STAMP" ] && RECORDED_HASHES=$(tail -n +2 "$HOOKS_DIR/$STAMP_NAME")
+
+# One line per source hook: "copy|same|kept NAME HASH_TO_RECORD"
+# A hook is only kept when it differs from what we last installed (a local edit)
+PLAN=$(awk -v current="$CURRENT_HASHES" -v recorded="$RECORDED_HASHES" '
+  BEGIN {
+    n = split(current, lines, "\n")
+    for (i = 1; i <= n; i++) { split(lines[i], f, " +"); if (f[2] != "") cur[f[2]] = f[1] }
+    n = split(recorded, lines, "\n")
+    for (i = 1; i <= n; i++) { split(lines[i], f, " +"); if (f[2] != "") rec[f[2]] = f[1] }
+  }
+  NF >= 2 {
+    name = $2
+    if (!(name in cur)) print "copy", name, $1
+    else if (cur[name] == $1) print "same", name, $1
+    else if ((name in rec) && rec[name] != cur[name]) print "kept", name, rec[name]
+    else print "copy", name, $1
+  }
+' <<< "$SOURCE_HASHES")
+
+UPDATED=0
+KEPT=""
+NEW_HASHES=""
+while read -r ACTION NAME HASH; do
+  [ -n "$NAME" ] || continue
+  case "$ACTION" in
+    copy)
+      cp "$HOOKS_SOURCE_DIR/$NAME" "$HOOKS_DIR/$NAME.tmp.$$" && chmod +x "$HOOKS_DIR/$NAME.tmp.$$" \
+        && mv -f "$HOOKS_DIR/$NAME.tmp.$$" "$HOOKS_DIR/$NAME"
+      UPDATED=$((UPDATED + 1))
+      ;;
+    kept)
+      KEPT="$KEPT $NAME"
+      ;;
+  esac
+  NEW_HASHES="$NEW_HASHES$HASH  $NAME"$'\n'
+done <<< "$PLAN"
+
+printf '%s\n%s' "$SOURCE_STAMP" "$NEW_HASHES" > "$HOOKS_DIR/$STAMP_NAME"
+if [ -n "$SOURCE_META" ]; then
+  printf '%s\n' "$SOURCE_META" > "$HOOKS_DIR/$META_NAME"
+else
+  rm -f "$HOOKS_DIR/$META_NAME"
+fi
 
-# 3. Configure settings.json with hook definitions
+# 3. Configure settings.json with hook definitions (skipped on upgrades that
+# already have them wired up)
 SETTINGS=".claude/settings.json"
 
-if [ -f "$SETTINGS" ] && command -v jq &>/dev/null; then
+if [ -f "$SETTINGS" ] && [ "$FRESH_INSTALL" = false ] && grep -q 'memory-capture' "$SETTINGS" 2>/dev/null; then
+  :
+elif [ -f "$SETTINGS" ] && command -v jq &>/dev/null; then
   EXISTING=$(cat "$SETTINGS")
 
-  UPDATED=$(echo "$EXISTING" | jq '
+  UPDATED_SETTINGS=$(echo "$EXISTING" | jq '
     .hooks.SessionStart = (
       [(.hooks.SessionStart // [])[] | select(.hooks[]?.command | contains("auto-recall") | not)] +
       [{"hooks":[{"type":"command","command":"bash .claude/hooks/auto-recall.sh","async":true}]}]
@@ -104,7 +213,7 @@ if [ -f "$SETTINGS" ] && command -v jq &>/dev/null; then
     if .hooks.PreToolUse == null then del(.hooks.PreToolUse) else . end |
     if .hooks.SubagentStop == null then del(.hooks.SubagentStop) else . end
   ')
-  echo "$UPDATED" > "$SETTINGS"
+  echo "$UPDATED_SETTINGS" > "$SETTINGS"
 elif [ ! -f "$SETTINGS" ]; then
   mkdir -p "$(dirname "$SETTINGS")"
   cat > "$SETTINGS" << 'SETTINGS_EOF'
@@ -124,8 +233,9 @@ elif [ ! -f "$SETTINGS" ]; then
 SETTINGS_EOF
 fi
 
-# Report success
-cat <<'EOF'
+# Report
+if [ "$FRESH_INSTALL" = true ]; then
+  cat <<'EOF'
 {
   "systemMessage": "[beads-compound] Auto-installed memory hooks. Restart Claude Code to activate auto-recall and knowledge capture.",
   "hookSpecificOutput": {
@@ -134,3 +244,8 @@ cat <<'EOF'
   }
 }
 EOF
+elif [ "$UPDATED" -gt 0 ] || [ -n "$KEPT" ]; then
+  MESSAGE="[beads-compound] Updated $UPDATED memory hook(s) in .claude/hooks to the installed plugin version."
+  [ -n "$KEPT" ] && MESSAGE="$MESSAGE Kept locally edited:$KEPT."
+  printf '{\n  "systemMessage": "%s"\n}\n' "$MESSAGE"
+fi
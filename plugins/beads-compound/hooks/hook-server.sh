@@ -0,0 +1,40 @@
+#!/bin/bash
+#
+# hook-server.sh - Persistent hook runner for in-process plugin hosts
+#
+# Long-lived alternative to spawning `bash <hook>.sh` per event (used by the
+# OpenCode plugin). Reads one request per line on stdin:
+#
+#   HOOK<TAB>PROJECT_DIR<TAB>PAYLOAD_JSON
+#
+# HOOK is auto-recall or memory-capture; PAYLOAD_JSON (single line) becomes
+# the hook's stdin. Each hook runs in a forked subshell of this process, so
+# bash startup is paid once. The response is the hook's stdout followed by a
+# NUL byte; stderr passes through. Invalid requests get an empty response.
+#
+
+HOOKS_DIR="$(cd "$(dirname "$0")" && pwd)"
+
+# Hooks locate their siblings via $0, which must survive the per-request cd
+[[ "$0" == /* ]] || exec bash "$HOOKS_DIR/${0##*/}"
+
+while IFS=$'\t' read -r HOOK DIR PAYLOAD; do
+  case "$HOOK" in
+    auto-recall|memory-capture) ;;
+    *) printf '\0'; continue ;;
+  esac
+
+  # Validate absolute path (security)
+  if [[ "$DIR" != /* ]] || [[ ! -d "$DIR" ]]; then
+    printf '\0'
+    continue
+  fi
+
+  (
+    cd "$DIR" || exit 0
+    export CLAUDE_PROJECT_DIR="$DIR"
+    source "$HOOKS_DIR/$HOOK.sh"
+  ) <<< "$PAYLOAD"
+
+  printf '\0'
+done
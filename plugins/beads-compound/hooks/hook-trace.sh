@@ -0,0 +1,200 @@
+#!/bin/bash
+#
+# hook-trace.sh - Opt-in latency tracing for beads-compound hooks
+#
+# Enabled by BEADS_COMPOUND_TRACE=1. Every hook sources this file; when
+# tracing is off the functions are no-ops and nothing forks.
+#
+# Records are appended as JSONL to $BEADS_COMPOUND_TRACE_FILE
+# (default ~/.beads-compound/trace.jsonl), rotated to .1 past 5 MB:
+#
+#   {"ts":..,"hook":"memory-capture","phase":"parse","wall_ms":..,"cpu_ms":..,
+#    "subprocs":..,"rows":..,"bytes":..,"pid":..}
+#
+# A "total" span covering the whole hook is written on exit. subprocs is an
+# estimate from a DEBUG trap: external commands and $( ) substitutions run by
+# the hook's own shell. Commands inside a substitution or pipeline are not seen.
+#
+# Usage (in a hook):
+#   source "${0%/*}/hook-trace.sh" 2>/dev/null || { trace_init() { :; }; ... }
+#   trace_init memory-capture
+#   trace_begin parse; ...; trace_add bytes "${#INPUT}"; trace_end
+#
+# Report:
+#   bash hook-trace.sh report [TRACE_FILE]   # p50/p95 per hook and phase
+#
+
+TRACE_FILE="${BEADS_COMPOUND_TRACE_FILE:-${BEADS_COMPOUND_HOME:-$HOME/.beads-compound}/trace.jsonl}"
+TRACE_MAX_BYTES=5242880
+
+if [[ -z "$BEADS_COMPOUND_TRACE" ]] || [[ "$BEADS_COMPOUND_TRACE" == "0" ]]; then
+  trace_init() { :; }
+  trace_begin() { :; }
+  trace_add() { :; }
+  trace_end() { :; }
+else
+
+# Wall clock in milliseconds (bash 5 EPOCHREALTIME, else date)
+_trace_wall_ms() {
+  local NOW="$EPOCHREALTIME"
+  if [[ -z "$NOW" ]]; then
+    NOW=$(date +%s.%N)
+    [[ "$NOW" == *N ]] && NOW="${NOW%.*}.000"
+  fi
+  local FRAC="${NOW#*.}000"
+  _TRACE_NOW=$(( ${NOW%.*} * 1000 + 10#${FRAC:0:3} ))
+}
+
+# Shell + children user/sys CPU in milliseconds, via the `times` builtin
+_trace_cpu_ms() {
+  times > "$_TRACE_TIMES"
+  local A B C D
+  { read -r A B; read -r C D; } < "$_TRACE_TIMES"
+
+  local TOTAL=0 T M S INT FRAC
+  for T in "$A" "$B" "$C" "$D"; do
+    M="${T%%m*}"
+    S="${T#*m}"
+    S="${S%s}"
+    INT="${S%.*}"
+    FRAC="${S#*.}000"
+    TOTAL=$(( TOTAL + M * 60000 + INT * 1000 + 10#${FRAC:0:3} ))
+  done
+  _TRACE_CPU=$TOTAL
+}
+
+# DEBUG trap: count external commands and command substitutions
+_trace_count() {
+  local CMD="$1"
+  local WORD="${CMD%% *}"
+
+  case "$WORD" in
+    *=*|'(('|for|case|while|until|if|select|echo|printf|read|local|cd|test|'['|'[['|export|source|.|return|exit|shift|set|unset|declare|true|false|:|let|eval|trap|wait|continue|break|times|type|builtin|pwd|_trace_*|trace_*) ;;
+    *) declare -F "$WORD" >/dev/null || _TRACE_SUBPROCS=$(( _TRACE_SUBPROCS + 1 )) ;;
+  esac
+
+  # Each $( ... ) is a forked subshell; $(( ... )) is arithmetic
+  local REST="$CMD"
+  while [[ "$REST" == *'$('* ]]; do
+    REST="${REST#*\$(}"
+    [[ "$REST" == '('* ]] || _TRACE_SUBPROCS=$(( _TRACE_SUBPROCS + 1 ))
+  done
+  return 0
+}
+
+_trace_emit() {
+  local PHASE="$1" START_WALL="$2" START_CPU="$3" SUBPROCS="$4" ROWS="$5" BYTES="$6"
+
+  _trace_wall_ms
+  _trace_cpu_ms
+
+  printf '{"ts":%s,"hook":"%s","phase":"%s","wall_ms":%s,"cpu_ms":%s,"subprocs":%s,"rows":%s,"bytes":%s,"pid":%s}\n' \
+    "$(( _TRACE_NOW / 1000 ))" "$_TRACE_HOOK" "$PHASE" \
+    "$(( _TRACE_NOW - START_WALL ))" "$(( _TRACE_CPU - START_CPU ))" \
+    "$SUBPROCS" "$ROWS" "$BYTES" "$$" >> "$TRACE_FILE"
+}
+
+trace_init() {
+  _TRACE_HOOK="${1//[^a-zA-Z0-9_-]/}"
+  _TRACE_SUBPROCS=0
+  _TRACE_TOTAL_ROWS=0
+  _TRACE_TOTAL_BYTES=0
+  _TRACE_PHASE=""
+
+  mkdir -p "$(dirname "$TRACE_FILE")" 2>/dev/null
+  _TRACE_TIMES="${TMPDIR:-/tmp}/beads-trace.$$"
+
+  if [[ -f "$TRACE_FILE" ]] && [[ $(wc -c < "$TRACE_FILE") -gt $TRACE_MAX_BYTES ]]; then
+    mv -f "$TRACE_FILE" "$TRACE_FILE.1" 2>/dev/null
+  fi
+
+  _trace_wall_ms
+  _trace_cpu_ms
+  _TRACE_INIT_WALL=$_TRACE_NOW
+  _TRACE_INIT_CPU=$_TRACE_CPU
+
+  set -o functrace
+  trap '_trace_count "$BASH_COMMAND"' DEBUG
+  trap '_trace_finish' EXIT
+}
+
+_trace_finish() {
+  trap - DEBUG
+  [[ -n "$_TRACE_PHASE" ]] && trace_end
+  _trace_emit total "$_TRACE_INIT_WALL" "$_TRACE_INIT_CPU" "$_TRACE_SUBPROCS" "$_TRACE_TOTAL_ROWS" "$_TRACE_TOTAL_BYTES"
+  rm -f "$_TRACE_TIMES"
+}
+
+trace_begin() {
+  [[ -n "$_TRACE_PHASE" ]] && trace_end
+  _TRACE_PHASE="${1//[^a-zA-Z0-9_-]/}"
+  _TRACE_PHASE_ROWS=0
+  _TRACE_PHASE_BYTES=0
+  _TRACE_PHASE_SUBPROCS=$_TRACE_SUBPROCS
+  _trace_wall_ms
+  _trace_cpu_ms
+  _TRACE_PHASE_WALL=$_TRACE_NOW
+  _TRACE_PHASE_CPU=$_TRACE_CPU
+}
+
+# trace_add rows|bytes N -- attribute work to the current phase and the total
+trace_add() {
+  local N="$2"
+  [[ "$N" =~ ^[0-9]+$ ]] || return 0
+
+  case "$1" in
+    rows)
+      _TRACE_PHASE_ROWS=$(( _TRACE_PHASE_ROWS + N ))
+      _TRACE_TOTAL_ROWS=$(( _TRACE_TOTAL_ROWS + N ))
+      ;;
+    bytes)
+      _TRACE_PHASE_BYTES=$(( _TRACE_PHASE_BYTES + N ))
+      _TRACE_TOTAL_BYTES=$(( _TRACE_TOTAL_BYTES + N ))
+      ;;
+  esac
+}
+
+trace_end() {
+  [[ -z "$_TRACE_PHASE" ]] && return 0
+  _trace_emit "$_TRACE_PHASE" "$_TRACE_PHASE_WALL" "$_TRACE_PHASE_CPU" \
+    "$(( _TRACE_SUBPROCS - _TRACE_PHASE_SUBPROCS ))" "$_TRACE_PHASE_ROWS" "$_TRACE_PHASE_BYTES"
+  _TRACE_PHASE=""
+}
+
+fi
+
+# Aggregate a trace file: count and p50/p95 wall/cpu per hook and phase
+trace_report() {
+  local FILE="${1:-$TRACE_FILE}"
+
+  if [[ ! -f "$FILE" ]]; then
+    echo "No trace file at $FILE (set BEADS_COMPOUND_TRACE=1 to record)"
+    return 0
+  fi
+
+  printf '%-20s %-12s %6s %9s %9s %9s %9s %8s %8s %10s\n' \
+    "HOOK" "PHASE" "COUNT" "WALL_P50" "WALL_P95" "CPU_P50" "CPU_P95" "PROCS" "ROWS" "BYTES"
+
+  jq -rs '
+    # Nearest rank: the smallest value with at least p of the samples at or below it
+    def pct(p): sort | .[([(length * p | ceil) - 1, 0] | max)];
+    def avg: add / length | floor;
+    [.[] | select(.hook and .phase)] |
+    group_by([.hook, .phase])[] |
+    [.[0].hook, .[0].phase, length,
+     (map(.wall_ms) | pct(0.5)), (map(.wall_ms) | pct(0.95)),
+     (map(.cpu_ms) | pct(0.5)), (map(.cpu_ms) | pct(0.95)),
+     (map(.subprocs) | avg), (map(.rows) | avg), (map(.bytes) | avg)] |
+    @tsv
+  ' "$FILE" 2>/dev/null | while IFS=$'\t' read -r HOOK PHASE COUNT W50 W95 C50 C95 PROCS ROWS BYTES; do
+    printf '%-20s %-12s %6s %9s %9s %9s %9s %8s %8s %10s\n' \
+      "$HOOK" "$PHASE" "$COUNT" "$W50" "$W95" "$C50" "$C95" "$PROCS" "$ROWS" "$BYTES"
+  done
+}
+
+if [[ "${BASH_SOURCE[0]}" == "$0" ]]; then
+  case "$1" in
+    report) trace_report "$2" ;;
+    *) echo "Usage: hook-trace.sh report [TRACE_FILE]"; exit 1 ;;
+  esac
+fi
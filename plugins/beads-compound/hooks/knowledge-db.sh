@@ -3,8 +3,11 @@
 # knowledge-db.sh - Shared library for SQLite FTS5 knowledge operations
 #
 # Provides functions for creating, inserting, searching, and backfilling
-# a SQLite FTS5 knowledge database. All inserts use CSV .import via temp
-# files to avoid SQL string interpolation (injection-safe).
+# a SQLite FTS5 knowledge database, plus the compressed archive segment
+# format used by rotation (needs only gzip and jq). All inserts use CSV .import via temp
+# files to avoid SQL string interpolation (injection-safe). The first-time
+# beads.db backfill copies rows database-to-database via ATTACH, so comment
+# text never passes through the shell either.
 #
 # Usage: source knowledge-db.sh
 #
@@ -14,6 +17,15 @@
 #   kb_search DB_PATH QUERY TOP_N - FTS5 search with BM25 ranking
 #   kb_sync DB_PATH MEMORY_DIR     - Incremental sync from JSONL + first-time beads import
 #   kb_backfill DB_PATH MEMORY_DIR - Alias for kb_sync (backward compat)
+#   kb_global_register DB_PATH PROJECT_DIR [WEIGHT] - Add project to global catalog
+#   kb_global_refresh              - Pull new rows from stale catalog projects
+#   kb_global_search QUERY TOP_N   - Weighted BM25 search across all projects
+#   kb_graph_refresh DB_PATH BEADS_DIR - Rebuild bead closure if beads data changed
+#   kb_topic DB_PATH BEAD_ID       - Knowledge for a bead and its whole subtree
+#   kb_archive_write ARCHIVE_DIR FILE - Write FILE as a compressed archive segment
+#   kb_archive_cat ARCHIVE_DIR [--bead ID|--since TS|--last N] - Stream matching archived lines
+#   kb_archive_filter [--bead ID|--since TS|--last N] - Same filter for plain JSONL on stdin
+#   kb_archive_count ARCHIVE_DIR   - Number of archived entries
 #
 
 # Create knowledge.db with FTS5 schema if missing
@@ -105,6 +117,28 @@ kb_insert() {
   return $RC
 }
 
+# Build an FTS5 MATCH expression from free text: 2+ char alphanumeric
+# terms (strips all SQL-dangerous characters), quoted and joined with OR
+_kb_fts_query() {
+  local QUERY="$1"
+
+  local TERMS
+  TERMS=$(echo "$QUERY" | grep -oE '\b[a-zA-Z0-9_.]{2,}\b' | sort -u)
+
+  [[ -z "$TERMS" ]] && return 0
+
+  local FTS_QUERY=""
+  while IFS= read -r TERM; do
+    if [[ -n "$FTS_QUERY" ]]; then
+      FTS_QUERY="$FTS_QUERY OR \"$TERM\""
+    else
+      FTS_QUERY="\"$TERM\""
+    fi
+  done <<< "$TERMS"
+
+  echo "$FTS_QUERY"
+}
+
 # FTS5 MATCH search with BM25 ranking
 # Output: type|content|bead|tags_text (pipe-delimited)
 kb_search() {
@@ -121,23 +155,8 @@ kb_search() {
     return 0
   fi
 
-  # Extract 2+ char alphanumeric terms (strips all SQL-dangerous characters)
-  local TERMS
-  TERMS=$(echo "$QUERY" | grep -oE '\b[a-zA-Z0-9_.]{2,}\b' | sort -u)
-
-  if [[ -z "$TERMS" ]]; then
-    return 0
-  fi
-
-  # Build FTS5 MATCH expression: quote each term, join with OR
-  local FTS_QUERY=""
-  while IFS= read -r TERM; do
-    if [[ -n "$FTS_QUERY" ]]; then
-      FTS_QUERY="$FTS_QUERY OR \"$TERM\""
-    else
-      FTS_QUERY="\"$TERM\""
-    fi
-  done <<< "$TERMS"
+  local FTS_QUERY
+  FTS_QUERY=$(_kb_fts_query "$QUERY")
 
   if [[ -z "$FTS_QUERY" ]]; then
     return 0
@@ -175,33 +194,8 @@ kb_sync() {
     local BEADS_DB
     BEADS_DB="${CLAUDE_PROJECT_DIR:-.}/.beads/beads.db"
 
-    if [[ -f "$BEADS_DB" ]] && command -v sqlite3 &>/dev/null; then
-      local COMMENTS
-      COMMENTS=$(sqlite3 "$BEADS_DB" "SELECT text FROM comments WHERE text LIKE 'LEARNED:%' OR text LIKE 'DECISION:%' OR text LIKE 'FACT:%' OR text LIKE 'PATTERN:%' OR text LIKE 'INVESTIGATION:%';" 2>/dev/null || true)
-
-      if [[ -n "$COMMENTS" ]]; then
-        while IFS= read -r COMMENT; do
-          [[ -z "$COMMENT" ]] && continue
-
-          local PREFIX TYPE CONTENT SLUG KEY
-
-          for P in INVESTIGATION LEARNED DECISION FACT PATTERN; do
-            if echo "$COMMENT" | grep -q "^${P}:"; then
-              PREFIX="$P"
-              break
-            fi
-          done
-
-          [[ -z "$PREFIX" ]] && continue
-
-          TYPE=$(echo "$PREFIX" | tr '[:upper:]' '[:lower:]')
-          CONTENT=$(echo "$COMMENT" | sed "s/^${PREFIX}:[[:space:]]*//" | head -c 2048)
-          SLUG=$(echo "$CONTENT" | head -c 60 | tr '[:upper:]' '[:lower:]' | tr -cs 'a-z0-9' '-' | sed 's/^-//;s/-$//')
-          KEY="${TYPE}-${SLUG}"
-
-          kb_insert "$DB_PATH" "$KEY" "$TYPE" "$CONTENT" "backfill" "" "$(date +%s)" ""
-        done <<< "$COMMENTS"
-      fi
+    if [[ -f "$BEADS_DB" ]]; then
+      _kb_backfill_beads "$DB_PATH" "$BEADS_DB"
     fi
 
     # Re-read count after beads import
@@ -211,6 +205,125 @@ kb_sync() {
   # Incremental import from JSONL files
   _kb_sync_jsonl "$DB_PATH" "$MEMORY_DIR/knowledge.jsonl" "$DB_COUNT"
   _kb_sync_jsonl "$DB_PATH" "$MEMORY_DIR/knowledge.archive.jsonl" "$DB_COUNT"
+  _kb_sync_archive "$DB_PATH" "$MEMORY_DIR/archive"
+}
+
+# Import archive segments not yet recorded in kb_segments. Segments are
+# immutable, so each one is imported exactly once.
+_kb_sync_archive() {
+  local DB_PATH="$1"
+  local ARCHIVE_DIR="$2"
+
+  [[ ! -d "$ARCHIVE_DIR" ]] && return 0
+
+  sqlite3 "$DB_PATH" "CREATE TABLE IF NOT EXISTS kb_segments(name TEXT PRIMARY KEY);" 2>/dev/null || return 0
+
+  local SYNCED
+  SYNCED=$(sqlite3 "$DB_PATH" "SELECT name FROM kb_segments;" 2>/dev/null)
+
+  local IDX NAME
+  for IDX in "$ARCHIVE_DIR"/*.idx; do
+    [[ ! -f "$IDX" ]] && continue
+    NAME=$(basename "$IDX" .idx)
+    [[ ! -f "$ARCHIVE_DIR/$NAME.jsonl.gz" ]] && continue
+    grep -qxF "$NAME" <<< "$SYNCED" && continue
+
+    gzip -dc "$ARCHIVE_DIR/$NAME.jsonl.gz" 2>/dev/null | _kb_import_jsonl "$DB_PATH" \
+      && sqlite3 "$DB_PATH" "INSERT OR IGNORE INTO kb_segments(name) VALUES ('${NAME//\'/\'\'}');" 2>/dev/null
+  done
+}
+
+# Bulk-import JSONL from stdin: one jq pass to CSV, one sqlite3 .import into
+# a staging table, then INSERT OR IGNORE (first key wins, as in kb_insert)
+_kb_import_jsonl() {
+  local DB_PATH="$1"
+
+  local TMPFILE
+  TMPFILE=$(mktemp "${TMPDIR:-/tmp}/kb-import.XXXXXX")
+
+  jq -Rr 'fromjson? | select(.key != null and .key != "") |
+    [.key, (.type // ""), (.content // ""), (.source // ""),
+     ((.tags // []) | join(" ")), (.ts // 0), (.bead // "")] | @csv' > "$TMPFILE" 2>/dev/null
+
+  sqlite3 "$DB_PATH" \
+    "CREATE TABLE IF NOT EXISTS kb_import(key, type, content, source, tags_text, ts, bead);" \
+    ".mode csv" \
+    ".import '$TMPFILE' kb_import" \
+    "INSERT OR IGNORE INTO knowledge(key, type, content, source, tags_text, ts, bead) SELECT key, type, content, source, tags_text, CAST(ts AS INTEGER), bead FROM kb_import;" \
+    "DROP TABLE kb_import;" 2>/dev/null
+  local RC=$?
+
+  rm -f "$TMPFILE"
+  return $RC
+}
+
+# One-shot import of knowledge-prefixed comments from beads.db.
+# Runs as a single ATTACHed INSERT ... SELECT: prefix classification, content
+# stripping and slug/key generation all happen inside SQLite, so thousands of
+# historical comments import without a per-comment fork. The recursive CTE
+# mirrors memory-capture.sh's slug rule (lowercase, runs of non-[a-z0-9]
+# squeezed to one hyphen, leading/trailing hyphen dropped, first 60 chars).
+# INSERT OR IGNORE keeps the first comment for a duplicate key, as kb_insert does.
+_kb_backfill_beads() {
+  local DB_PATH="$1"
+  local BEADS_DB="$2"
+
+  [[ ! -f "$BEADS_DB" ]] && return 0
+
+  # ATTACH takes a string literal; double any single quotes in the path
+  local SAFE_BEADS_DB="${BEADS_DB//\'/\'\'}"
+
+  sqlite3 "$DB_PATH" 2>/dev/null <<SQL
+ATTACH DATABASE '$SAFE_BEADS_DB' AS beads;
+
+WITH RECURSIVE
+src AS (
+  SELECT c.rowid AS id, c.issue_id AS bead, c.text AS text,
+    CASE
+      WHEN c.text GLOB 'INVESTIGATION:*' THEN 'INVESTIGATION'
+      WHEN c.text GLOB 'LEARNED:*' THEN 'LEARNED'
+      WHEN c.text GLOB 'DECISION:*' THEN 'DECISION'
+      WHEN c.text GLOB 'FACT:*' THEN 'FACT'
+      WHEN c.text GLOB 'PATTERN:*' THEN 'PATTERN'
+    END AS prefix
+  FROM beads.comments c
+  WHERE c.text GLOB 'INVESTIGATION:*' OR c.text GLOB 'LEARNED:*'
+     OR c.text GLOB 'DECISION:*' OR c.text GLOB 'FACT:*' OR c.text GLOB 'PATTERN:*'
+),
+entries AS (
+  SELECT id, bead, lower(prefix) AS type,
+    substr(ltrim(substr(text, length(prefix) + 2), ' ' || char(9)), 1, 2048) AS content
+  FROM src
+),
+walk(id, pos, src_text, slug) AS (
+  SELECT id, 1, lower(substr(content, 1, 60)), '' FROM entries
+  UNION ALL
+  SELECT id, pos + 1, src_text,
+    CASE
+      WHEN substr(src_text, pos, 1) BETWEEN 'a' AND 'z'
+        OR substr(src_text, pos, 1) BETWEEN '0' AND '9'
+        THEN slug || substr(src_text, pos, 1)
+      WHEN substr(slug, -1) = '-' THEN slug
+      ELSE slug || '-'
+    END
+  FROM walk
+  WHERE pos <= length(src_text)
+),
+slugs AS (
+  SELECT id, trim(slug, '-') AS slug
+  FROM walk
+  WHERE pos = length(src_text) + 1
+)
+INSERT OR IGNORE INTO knowledge(key, type, content, source, tags_text, ts, bead)
+SELECT e.type || '-' || s.slug, e.type, e.content, 'backfill', '',
+  CAST(strftime('%s', 'now') AS INTEGER), COALESCE(e.bead, '')
+FROM entries e
+JOIN slugs s ON s.id = e.id
+WHERE e.content != ''
+ORDER BY e.id;
+
+DETACH DATABASE beads;
+SQL
 }
 
 # Import tail of a JSONL file, skipping lines likely already in SQLite.
@@ -249,6 +362,429 @@ _kb_sync_jsonl() {
   done
 }
 
+# --- Global (cross-project) knowledge index ---
+#
+# A user-level catalog at $KB_GLOBAL_DB lists registered project knowledge.db
+# files and holds a merged FTS5 index of their rows. Refresh is incremental:
+# each project remembers the last knowledge rowid it contributed, and one
+# sqlite3 process ATTACHes stale projects one at a time and copies only newer
+# rows. Search is a single FTS5 query over the merged index, so cost does not
+# grow with the number of projects.
+
+KB_GLOBAL_DIR="${BEADS_COMPOUND_HOME:-$HOME/.beads-compound}"
+KB_GLOBAL_DB="$KB_GLOBAL_DIR/global-knowledge.db"
+KB_GLOBAL_TTL="${KB_GLOBAL_TTL:-600}"
+
+_kb_global_ensure_db() {
+  mkdir -p "$KB_GLOBAL_DIR" || return 1
+
+  sqlite3 "$KB_GLOBAL_DB" <<'SQL'
+CREATE TABLE IF NOT EXISTS projects(
+  path TEXT PRIMARY KEY,
+  name TEXT,
+  weight REAL DEFAULT 1.0,
+  last_rowid INTEGER DEFAULT 0,
+  synced_at INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS knowledge(
+  project TEXT,
+  key TEXT,
+  type TEXT,
+  content TEXT,
+  source TEXT,
+  tags_text TEXT,
+  ts INTEGER,
+  bead TEXT,
+  PRIMARY KEY(project, key)
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS knowledge_fts USING fts5(
+  content, tags_text, type, key,
+  content=knowledge,
+  content_rowid=rowid,
+  tokenize='porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS knowledge_ai AFTER INSERT ON knowledge BEGIN
+  INSERT INTO knowledge_fts(rowid, content, tags_text, type, key)
+  VALUES (new.rowid, new.content, new.tags_text, new.type, new.key);
+END;
+
+CREATE TRIGGER IF NOT EXISTS knowledge_ad AFTER DELETE ON knowledge BEGIN
+  INSERT INTO knowledge_fts(knowledge_fts, rowid, content, tags_text, type, key)
+  VALUES ('delete', old.rowid, old.content, old.tags_text, old.type, old.key);
+END;
+SQL
+}
+
+# Register (or re-weight) a project's knowledge.db in the global catalog.
+# Registration is keyed on the knowledge.db path; WEIGHT multiplies BM25.
+kb_global_register() {
+  local DB_PATH="$1"
+  local PROJECT_DIR="$2"
+  local WEIGHT="$3"
+
+  if [[ -z "$DB_PATH" ]] || [[ ! -f "$DB_PATH" ]]; then
+    return 1
+  fi
+
+  # Validate WEIGHT is numeric to prevent SQL injection
+  if [[ -n "$WEIGHT" ]] && ! [[ "$WEIGHT" =~ ^[0-9]+(\.[0-9]+)?$ ]]; then
+    WEIGHT=""
+  fi
+
+  local ABS_DB NAME
+  ABS_DB="$(cd "$(dirname "$DB_PATH")" && pwd)/$(basename "$DB_PATH")"
+  NAME=$(basename "$(cd "${PROJECT_DIR:-.}" && pwd)")
+
+  local SAFE_DB="${ABS_DB//\'/\'\'}"
+  local SAFE_NAME="${NAME//\'/\'\'}"
+
+  # Runs on every SessionStart: a registered project costs one read-only
+  # SELECT, no schema DDL or write on the shared database
+  if [[ -z "$WEIGHT" ]] && [[ -f "$KB_GLOBAL_DB" ]] \
+     && [[ "$(sqlite3 "$KB_GLOBAL_DB" "SELECT 1 FROM projects WHERE path = '$SAFE_DB';" 2>/dev/null)" == "1" ]]; then
+    return 0
+  fi
+
+  _kb_global_ensure_db || return 1
+
+  if [[ -n "$WEIGHT" ]]; then
+    sqlite3 "$KB_GLOBAL_DB" "INSERT INTO projects(path, name, weight) VALUES ('$SAFE_DB', '$SAFE_NAME', $WEIGHT) ON CONFLICT(path) DO UPDATE SET name = excluded.name, weight = excluded.weight;" 2>/dev/null
+  else
+    sqlite3 "$KB_GLOBAL_DB" "INSERT OR IGNORE INTO projects(path, name) VALUES ('$SAFE_DB', '$SAFE_NAME');" 2>/dev/null
+  fi
+}
+
+# Copy new rows from every project not synced within KB_GLOBAL_TTL seconds.
+# A project whose knowledge.db was rebuilt (max rowid went backwards) has its
+# rows dropped and re-imported. Missing databases are skipped, not ATTACHed
+# (ATTACH would silently create an empty file).
+# $1 = "force" to ignore the TTL.
+kb_global_refresh() {
+  local FORCE="$1"
+
+  [[ ! -f "$KB_GLOBAL_DB" ]] && return 0
+
+  local NOW CUTOFF
+  NOW=$(date +%s)
+  CUTOFF=$(( NOW - KB_GLOBAL_TTL ))
+  [[ "$FORCE" == "force" ]] && CUTOFF=$(( NOW + 1 ))
+
+  local STALE
+  STALE=$(sqlite3 "$KB_GLOBAL_DB" "SELECT path FROM projects WHERE synced_at < $CUTOFF;" 2>/dev/null)
+  [[ -z "$STALE" ]] && return 0
+
+  local SQL="" P
+  while IFS= read -r P; do
+    [[ -z "$P" ]] || [[ ! -f "$P" ]] && continue
+
+    local SAFE_P="${P//\'/\'\'}"
+    SQL+="ATTACH DATABASE '$SAFE_P' AS src;
+BEGIN;
+DELETE FROM knowledge WHERE project = '$SAFE_P'
+  AND (SELECT coalesce(max(rowid), 0) FROM src.knowledge) < (SELECT last_rowid FROM projects WHERE path = '$SAFE_P');
+UPDATE projects SET last_rowid = 0 WHERE path = '$SAFE_P'
+  AND (SELECT coalesce(max(rowid), 0) FROM src.knowledge) < last_rowid;
+INSERT OR IGNORE INTO knowledge(project, key, type, content, source, tags_text, ts, bead)
+  SELECT '$SAFE_P', key, type, content, source, tags_text, ts, bead FROM src.knowledge
+  WHERE rowid > (SELECT last_rowid FROM projects WHERE path = '$SAFE_P');
+UPDATE projects SET
+  last_rowid = (SELECT coalesce(max(rowid), 0) FROM src.knowledge),
+  synced_at = $NOW
+  WHERE path = '$SAFE_P';
+COMMIT;
+DETACH DATABASE src;
+"
+  done <<< "$STALE"
+
+  [[ -z "$SQL" ]] && return 0
+  echo "$SQL" | sqlite3 "$KB_GLOBAL_DB" 2>/dev/null
+}
+
+# Weighted FTS5 search over the merged global index
+# Output: project|type|content|bead|tags_text (pipe-delimited)
+kb_global_search() {
+  local QUERY="$1"
+  local TOP_N="${2:-10}"
+
+  if ! [[ "$TOP_N" =~ ^[0-9]+$ ]]; then
+    TOP_N=10
+  fi
+
+  if [[ -z "$QUERY" ]] || [[ ! -f "$KB_GLOBAL_DB" ]]; then
+    return 0
+  fi
+
+  local FTS_QUERY
+  FTS_QUERY=$(_kb_fts_query "$QUERY")
+
+  if [[ -z "$FTS_QUERY" ]]; then
+    return 0
+  fi
+
+  # BM25 is negative (lower ranks first), so a larger weight ranks higher
+  sqlite3 -separator '|' "$KB_GLOBAL_DB" <<SQL
+SELECT p.name, k.type, k.content, k.bead, k.tags_text
+FROM knowledge_fts fts
+JOIN knowledge k ON k.rowid = fts.rowid
+JOIN projects p ON p.path = k.project
+WHERE knowledge_fts MATCH '$FTS_QUERY'
+ORDER BY bm25(knowledge_fts, -10.0, -5.0, -2.0, -1.0) * p.weight
+LIMIT $TOP_N;
+SQL
+}
+
+# --- Bead graph closure ---
+#
+# bead_closure holds every (ancestor, descendant) pair reachable through
+# parent-child and discovered-from links, so topic recall is one indexed
+# JOIN over an epic's whole subtree instead of a `bd list --parent` plus a
+# scan per child. "blocks" links only order siblings, and "related" links
+# would pull unrelated subtrees in when followed transitively, so neither is
+# followed. The table is rebuilt when the beads data (beads.db and its WAL,
+# or the issues.jsonl export on Dolt-backed installs) changes size or mtime.
+
+KB_GRAPH_LINKS="'parent-child','discovered-from'"
+
+# Portable file mtime (GNU stat, then BSD stat)
+_kb_mtime() {
+  stat -c %Y "$1" 2>/dev/null || stat -f %m "$1" 2>/dev/null
+}
+
+kb_graph_refresh() {
+  local DB_PATH="$1"
+  local BEADS_DIR="$2"
+
+  [[ ! -f "$DB_PATH" ]] && return 1
+
+  local SOURCE=""
+  if [[ -f "$BEADS_DIR/beads.db" ]]; then
+    SOURCE="$BEADS_DIR/beads.db"
+  elif [[ -s "$BEADS_DIR/issues.jsonl" ]]; then
+    SOURCE="$BEADS_DIR/issues.jsonl"
+  else
+    return 1
+  fi
+
+  # With WAL enabled, writes land in beads.db-wal until a checkpoint
+  local SIG SAFE_SIG F
+  SIG="$SOURCE"
+  for F in "$SOURCE" "$SOURCE-wal"; do
+    [[ -f "$F" ]] && SIG="$SIG:$(wc -c < "$F" | tr -d ' '):$(_kb_mtime "$F")"
+  done
+  SAFE_SIG="${SIG//\'/\'\'}"
+
+  local CURRENT
+  CURRENT=$(sqlite3 "$DB_PATH" "SELECT value FROM kb_meta WHERE name = 'graph_source';" 2>/dev/null)
+  [[ "$CURRENT" == "$SIG" ]] && return 0
+
+  # Load (parent, child) edges into a scratch table
+  local LOAD TMPFILE=""
+  if [[ "$SOURCE" == *.db ]]; then
+    LOAD="ATTACH DATABASE '${SOURCE//\'/\'\'}' AS beads;
+INSERT INTO bead_edges SELECT depends_on_id, issue_id FROM beads.dependencies WHERE type IN ($KB_GRAPH_LINKS);
+DETACH DATABASE beads;"
+  else
+    TMPFILE=$(mktemp "${TMPDIR:-/tmp}/kb-graph.XXXXXX")
+    jq -r '(.dependencies // [])[] | select(.type == "parent-child" or .type == "discovered-from") | [.depends_on_id, .issue_id] | @csv' \
+      "$SOURCE" > "$TMPFILE" 2>/dev/null
+    LOAD=".mode csv
+.import '$TMPFILE' bead_edges"
+  fi
+
+  sqlite3 "$DB_PATH" 2>/dev/null <<SQL
+CREATE TABLE IF NOT EXISTS kb_meta(name TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS bead_closure(
+  ancestor TEXT,
+  descendant TEXT,
+  PRIMARY KEY(ancestor, descendant)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_knowledge_bead ON knowledge(bead);
+DROP TABLE IF EXISTS bead_edges;
+CREATE TABLE bead_edges(parent TEXT, child TEXT);
+$LOAD
+BEGIN;
+DELETE FROM bead_closure;
+WITH RECURSIVE reach(ancestor, descendant) AS (
+  SELECT parent, child FROM bead_edges WHERE parent != '' AND child != ''
+  UNION
+  SELECT r.ancestor, e.child FROM reach r JOIN bead_edges e ON e.parent = r.descendant
+)
+INSERT OR IGNORE INTO bead_closure SELECT ancestor, descendant FROM reach WHERE ancestor != descendant;
+INSERT OR REPLACE INTO kb_meta(name, value) VALUES ('graph_source', '$SAFE_SIG');
+COMMIT;
+DROP TABLE bead_edges;
+SQL
+  local RC=$?
+
+  [[ -n "$TMPFILE" ]] && rm -f "$TMPFILE"
+  return $RC
+}
+
+# Knowledge logged to BEAD_ID or any bead below it, oldest first
+# Output: type|content|bead (pipe-delimited)
+kb_topic() {
+  local DB_PATH="$1"
+  local BEAD_ID="$2"
+
+  if [[ -z "$BEAD_ID" ]] || [[ ! -f "$DB_PATH" ]]; then
+    return 0
+  fi
+
+  local SAFE_ID="${BEAD_ID//\'/\'\'}"
+
+  sqlite3 -separator '|' "$DB_PATH" <<SQL
+SELECT k.type, k.content, k.bead
+FROM knowledge k
+WHERE k.bead = '$SAFE_ID'
+   OR k.bead IN (SELECT descendant FROM bead_closure WHERE ancestor = '$SAFE_ID')
+ORDER BY k.ts, k.rowid;
+SQL
+}
+
+# --- Compressed archive segments ---
+#
+# Rotation writes old entries to immutable segments under .beads/memory/archive/:
+#   <min_ts>-<cksum>.jsonl.gz  concatenated gzip members, one per block of
+#                              KB_ARCHIVE_BLOCK lines (a valid multi-member gzip)
+#   <min_ts>-<cksum>.idx       one TSV line per block:
+#                              offset  length  lines  min_ts  max_ts  beads...
+# Each rotation adds new files and never rewrites old ones, so concurrent
+# branches merge without conflicts. Readers consult the .idx and decompress
+# only the blocks whose ts range or bead list matches.
+
+KB_ARCHIVE_BLOCK="${KB_ARCHIVE_BLOCK:-250}"
+
+kb_archive_write() {
+  local ARCHIVE_DIR="$1"
+  local INPUT="$2"
+
+  if [[ -z "$ARCHIVE_DIR" ]] || [[ ! -s "$INPUT" ]]; then
+    return 1
+  fi
+
+  mkdir -p "$ARCHIVE_DIR" || return 1
+
+  local WORK
+  WORK=$(mktemp -d "${TMPDIR:-/tmp}/kb-archive.XXXXXX") || return 1
+
+  split -l "$KB_ARCHIVE_BLOCK" "$INPUT" "$WORK/blk."
+
+  local OFF=0 BLK LEN META
+  for BLK in "$WORK"/blk.*; do
+    gzip -n -c "$BLK" > "$BLK.gz"
+    LEN=$(wc -c < "$BLK.gz" | tr -d ' ')
+    META=$(jq -Rrn '[inputs | fromjson?] |
+      [length, (map(.ts // 0) | min // 0), (map(.ts // 0) | max // 0),
+       (map(.bead // "" | select(. != "")) | unique | join(" "))] | @tsv' < "$BLK")
+
+    cat "$BLK.gz" >> "$WORK/seg.gz"
+    printf '%s\t%s\t%s\n' "$OFF" "$LEN" "$META" >> "$WORK/seg.idx"
+    OFF=$(( OFF + LEN ))
+  done
+
+  local MIN_TS SUM NAME
+  MIN_TS=$(awk -F'\t' 'NR == 1 || $4 < m { m = $4 } END { print m + 0 }' "$WORK/seg.idx")
+  SUM=$(cksum < "$WORK/seg.gz" | cut -d' ' -f1)
+  NAME="${MIN_TS}-${SUM}"
+
+  # Data first, index last: readers only see segments whose index exists
+  mv "$WORK/seg.gz" "$ARCHIVE_DIR/$NAME.jsonl.gz" \
+    && mv "$WORK/seg.idx" "$ARCHIVE_DIR/$NAME.idx"
+  local RC=$?
+
+  rm -rf "$WORK"
+  return $RC
+}
+
+# Keep only the archived lines a kb_archive_cat mode asks for (stdin to
+# stdout). Also used by recall.sh on the legacy knowledge.archive.jsonl.
+kb_archive_filter() {
+  local MODE="$1"
+  local ARG="$2"
+
+  case "$MODE" in
+    '')      cat ;;
+    --bead)  jq -cR --arg id "$ARG" 'fromjson? | select(.bead == $id)' ;;
+    --since) jq -cR --argjson ts "$ARG" 'fromjson? | select((.ts // 0) >= $ts)' ;;
+    --last)  tail -n "$ARG" ;;
+    *)       return 1 ;;
+  esac
+}
+
+# Stream archived JSONL lines, oldest segment first. The .idx selects which
+# blocks to decompress; lines from those blocks are then filtered, so only
+# matching entries are printed.
+#   --bead ID   entries for bead ID
+#   --since TS  entries at or after TS
+#   --last N    the newest N entries
+kb_archive_cat() {
+  local ARCHIVE_DIR="$1"
+  local MODE="$2"
+  local ARG="$3"
+
+  [[ ! -d "$ARCHIVE_DIR" ]] && return 0
+
+  local IDX_FILES=()
+  local IDX
+  for IDX in "$ARCHIVE_DIR"/*.idx; do
+    [[ -f "$IDX" ]] && [[ -f "${IDX%.idx}.jsonl.gz" ]] && IDX_FILES+=("$IDX")
+  done
+  [[ ${#IDX_FILES[@]} -eq 0 ]] && return 0
+
+  # Whole archive: plain multi-member gunzip, no index needed
+  if [[ -z "$MODE" ]]; then
+    for IDX in "${IDX_FILES[@]}"; do
+      gzip -dc "${IDX%.idx}.jsonl.gz" 2>/dev/null
+    done
+    return 0
+  fi
+
+  # Select blocks as "segment<TAB>offset<TAB>length", in archive order
+  local SELECTED
+  case "$MODE" in
+    --bead)
+      SELECTED=$(awk -F'\t' -v want="$ARG" '{
+        n = split($6, b, " ")
+        for (i = 1; i <= n; i++) if (b[i] == want) { print FILENAME "\t" $1 "\t" $2; break }
+      }' "${IDX_FILES[@]}")
+      ;;
+    --since)
+      [[ "$ARG" =~ ^[0-9]+$ ]] || return 1
+      SELECTED=$(awk -F'\t' -v since="$ARG" '$5 >= since { print FILENAME "\t" $1 "\t" $2 }' "${IDX_FILES[@]}")
+      ;;
+    --last)
+      [[ "$ARG" =~ ^[0-9]+$ ]] || return 1
+      SELECTED=$(awk -F'\t' '{ print $5 "\t" FILENAME "\t" $1 "\t" $2 "\t" $3 }' "${IDX_FILES[@]}" \
+        | sort -t$'\t' -k1,1nr \
+        | awk -F'\t' -v want="$ARG" 'got < want { print $2 "\t" $3 "\t" $4; got += $5 }' \
+        | sort -t$'\t' -k1,1 -k2,2n)
+      ;;
+    *)
+      return 1
+      ;;
+  esac
+
+  local SEG OFF LEN
+  while IFS=$'\t' read -r SEG OFF LEN; do
+    [[ -z "$SEG" ]] && continue
+    tail -c +"$(( OFF + 1 ))" "${SEG%.idx}.jsonl.gz" | head -c "$LEN" | gzip -dc 2>/dev/null
+  done <<< "$SELECTED" | kb_archive_filter "$MODE" "$ARG"
+}
+
+kb_archive_count() {
+  local ARCHIVE_DIR="$1"
+
+  if ! compgen -G "$ARCHIVE_DIR/*.idx" >/dev/null; then
+    echo 0
+    return 0
+  fi
+
+  awk -F'\t' '{ n += $3 } END { print n + 0 }' "$ARCHIVE_DIR"/*.idx
+}
+
 # Backward-compatible alias
 kb_backfill() {
   kb_sync "$@"
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Offset index for knowledge.jsonl: look up entries by key, bead or timestamp
+without scanning the whole file and without sqlite3.
+
+The index lives next to the JSONL file (knowledge.jsonl -> knowledge.offsets)
+and holds three sorted fixed-width arrays of 16-byte records:
+
+    keys   (blake2b-64 of key,  byte offset)
+    beads  (blake2b-64 of bead, byte offset)
+    ts     (ts,                 byte offset)
+
+Lookups bisect the mmapped index (O(log n)), then seek straight to each line
+in the mmapped JSONL. Hash matches are confirmed against the parsed line, so
+collisions never produce wrong results.
+
+The header records the JSONL's device, inode, indexed length and a hash of
+the bytes just before that length. When the file only grew, new lines are
+parsed and merged in; when it was replaced or rewritten (rotation, git merge)
+the index is rebuilt. Either way it happens on the next lookup.
+
+Usage:
+    knowledge-index.py JSONL --update
+    knowledge-index.py JSONL --key KEY [--key KEY ...]
+    knowledge-index.py JSONL --bead ID [--bead ID ...]
+    knowledge-index.py JSONL --since TS
+    knowledge-index.py JSONL --recent N
+
+Matching JSONL lines are printed unchanged: --key/--bead in file order,
+--since/--recent in timestamp order.
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b'KBOFFS01'
+HEADER = struct.Struct('<8sQQQQIII')
+HASH_REC = struct.Struct('<QQ')
+TS_REC = struct.Struct('<qQ')
+TAIL_PROBE = 64
+
+
+def index_path(jsonl_path):
+    return os.path.splitext(jsonl_path)[0] + '.offsets'
+
+
+def hash64(value):
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def tail_hash(f, length):
+    """Hash of the bytes just before `length`, used to detect rewrites."""
+    start = max(0, length - TAIL_PROBE)
+    f.seek(start)
+    return int.from_bytes(hashlib.blake2b(f.read(length - start), digest_size=8).digest(), 'little')
+
+
+def parse_records(f, start, end):
+    """Parse complete lines in [start, end). Returns records and the end of the last full line."""
+    keys, beads, stamps = [], [], []
+    f.seek(start)
+    offset = start
+
+    while offset < end:
+        line = f.readline()
+        if not line.endswith(b'\n'):
+            break  # Partial line still being written; pick it up next time
+
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            entry = None
+
+        if isinstance(entry, dict):
+            if entry.get('key'):
+                keys.append((hash64(str(entry['key'])), offset))
+            if entry.get('bead'):
+                beads.append((hash64(str(entry['bead'])), offset))
+            try:
+                stamps.append((int(entry.get('ts') or 0), offset))
+            except (TypeError, ValueError):
+                stamps.append((0, offset))
+
+        offset += len(line)
+
+    return keys, beads, stamps, offset
+
+
+def read_index(path):
+    """Return (header fields, keys, beads, stamps) or None if missing/corrupt."""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    if len(data) < HEADER.size:
+        return None
+
+    magic, dev, ino, length, probe, n_keys, n_beads, n_ts = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or len(data) != HEADER.size + 16 * (n_keys + n_beads + n_ts):
+        return None
+
+    pos = HEADER.size
+    keys = list(HASH_REC.iter_unpack(data[pos:pos + 16 * n_keys]))
+    pos += 16 * n_keys
+    beads = list(HASH_REC.iter_unpack(data[pos:pos + 16 * n_beads]))
+    pos += 16 * n_beads
+    stamps = list(TS_REC.iter_unpack(data[pos:pos + 16 * n_ts]))
+
+    return (dev, ino, length, probe), keys, beads, stamps
+
+
+def write_index(path, st, length, probe, keys, beads, stamps):
+    tmp = f'{path}.tmp.{os.getpid()}'
+    with open(tmp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, st.st_dev, st.st_ino, length, probe,
+                            len(keys), len(beads), len(stamps)))
+        f.write(b''.join(HASH_REC.pack(*r) for r in keys))
+        f.write(b''.join(HASH_REC.pack(*r) for r in beads))
+        f.write(b''.join(TS_REC.pack(*r) for r in stamps))
+    os.replace(tmp, path)
+
+
+def update(jsonl_path):
+    """Bring the index up to date: append-merge when possible, else rebuild."""
+    path = index_path(jsonl_path)
+
+    with open(jsonl_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        existing = read_index(path)
+
+        start, keys, beads, stamps = 0, [], [], []
+        if existing:
+            (dev, ino, length, probe), old_keys, old_beads, old_stamps = existing
+            same_file = dev == st.st_dev and ino == st.st_ino and length <= st.st_size
+            if same_file and tail_hash(f, length) == probe:
+                if length == st.st_size:
+                    return path
+                start, keys, beads, stamps = length, old_keys, old_beads, old_stamps
+
+        new_keys, new_beads, new_stamps, end = parse_records(f, start, st.st_size)
+        if start and end == start:
+            return path
+
+        # Timsort merges the already-sorted prefix with the new run in ~O(n)
+        keys = sorted(keys + new_keys)
+        beads = sorted(beads + new_beads)
+        stamps = sorted(stamps + new_stamps)
+        write_index(path, st, end, tail_hash(f, end), keys, beads, stamps)
+
+    return path
+
+
+class RecordView:
+    """Sequence view over one fixed-width array inside the mmapped index."""
+
+    def __init__(self, mm, base, count, rec):
+        self.mm, self.base, self.count, self.rec = mm, base, count, rec
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        return self.rec.unpack_from(self.mm, self.base + i * 16)
+
+    def lower_bound(self, value):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self[mid][0] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+def open_views(mm):
+    _, _, _, _, _, n_keys, n_beads, n_ts = HEADER.unpack_from(mm, 0)
+    base = HEADER.size
+    keys = RecordView(mm, base, n_keys, HASH_REC)
+    beads = RecordView(mm, base + 16 * n_keys, n_beads, HASH_REC)
+    stamps = RecordView(mm, base + 16 * (n_keys + n_beads), n_ts, TS_REC)
+    return keys, beads, stamps
+
+
+def hash_matches(view, field, values, data):
+    """Offsets whose line has `field` equal to one of `values`, in file order."""
+    offsets = set()
+    for value in values:
+        h = hash64(value)
+        i = view.lower_bound(h)
+        while i < len(view) and view[i][0] == h:
+            offset = view[i][1]
+            if str(json.loads(read_line(data, offset)).get(field)) == value:
+                offsets.add(offset)
+            i += 1
+    return sorted(offsets)
+
+
+def read_line(data, offset):
+    end = data.find(b'\n', offset)
+    return data[offset:end if end >= 0 else len(data)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('jsonl', help='Path to knowledge.jsonl')
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--update', action='store_true', help='Only refresh the index')
+    mode.add_argument('--key', action='append', help='Entries with this key')
+    mode.add_argument('--bead', action='append', help='Entries linked to this bead')
+    mode.add_argument('--since', type=int, help='Entries with ts >= SINCE')
+    mode.add_argument('--recent', type=int, help='Latest N entries by ts')
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.jsonl) or os.path.getsize(args.jsonl) == 0:
+        return
+
+    path = update(args.jsonl)
+    if args.update:
+        return
+
+    with open(path, 'rb') as fi, open(args.jsonl, 'rb') as fj, \
+            mmap.mmap(fi.fileno(), 0, access=mmap.ACCESS_READ) as idx, \
+            mmap.mmap(fj.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        keys, beads, stamps = open_views(idx)
+
+        if args.key:
+            offsets = hash_matches(keys, 'key', args.key, data)
+        elif args.bead:
+            offsets = hash_matches(beads, 'bead', args.bead, data)
+        elif args.since is not None:
+            offsets = [stamps[i][1] for i in range(stamps.lower_bound(args.since), len(stamps))]
+        else:
+            n = max(0, args.recent)
+            offsets = [stamps[i][1] for i in range(max(0, len(stamps) - n), len(stamps))]
+
+        out = sys.stdout.buffer
+        for offset in offsets:
+            out.write(read_line(data, offset) + b'\n')
+
+
+if __name__ == '__main__':
+    main()
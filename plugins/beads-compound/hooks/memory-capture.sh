@@ -7,85 +7,86 @@
 # Extracts knowledge entries into .beads/memory/knowledge.jsonl
 #
 
-INPUT=$(cat)
-TOOL_NAME=$(echo "$INPUT" | jq -r '.tool_name // empty')
-
-[[ "$TOOL_NAME" != "Bash" ]] && exit 0
-
-COMMAND=$(echo "$INPUT" | jq -r '.tool_input.command // empty')
-[[ -z "$COMMAND" ]] && exit 0
-
-echo "$COMMAND" | grep -qE 'bd\s+comments?\s+add\s+' || exit 0
-echo "$COMMAND" | grep -qE '(INVESTIGATION:|LEARNED:|DECISION:|FACT:|PATTERN:)' || exit 0
-
-# Extract BEAD_ID
-BEAD_ID=$(echo "$COMMAND" | sed -E 's/.*bd[[:space:]]+comments?[[:space:]]+add[[:space:]]+([A-Za-z0-9._-]+)[[:space:]]+.*/\1/')
-[[ -z "$BEAD_ID" || "$BEAD_ID" == "$COMMAND" ]] && exit 0
-
-# Extract comment body
-COMMENT_BODY=$(echo "$COMMAND" | sed -E 's/.*bd[[:space:]]+comments?[[:space:]]+add[[:space:]]+[A-Za-z0-9._-]+[[:space:]]+["'\'']//' | sed -E 's/["'\''][[:space:]]*$//' | head -c 4096)
-[[ -z "$COMMENT_BODY" ]] && exit 0
-
-# Detect type from prefix
-TYPE=""
-CONTENT=""
-
-for PREFIX in INVESTIGATION LEARNED DECISION FACT PATTERN; do
-  if echo "$COMMENT_BODY" | grep -q "${PREFIX}:"; then
-    TYPE=$(echo "$PREFIX" | tr '[:upper:]' '[:lower:]')
-    CONTENT=$(echo "$COMMENT_BODY" | sed "s/.*${PREFIX}:[[:space:]]*//" | head -c 2048)
-    break
-  fi
-done
-
-[[ -z "$TYPE" || -z "$CONTENT" ]] && exit 0
-
-# Generate key
-SLUG=$(echo "$CONTENT" | head -c 60 | tr '[:upper:]' '[:lower:]' | tr -cs 'a-z0-9' '-' | sed 's/^-//;s/-$//')
-KEY="${TYPE}-${SLUG}"
-
-# Detect source
-SOURCE="user"
-CWD=$(echo "$INPUT" | jq -r '.cwd // empty')
-
-if echo "$CWD" | grep -q '\.worktrees/'; then
-  SOURCE="supervisor"
-fi
-
-# Build tags
-TAGS_ARRAY=("$TYPE")
-
-for tag in swift swiftui appkit menubar api security test database \
-           networking ui layout performance crash bug fix workaround \
-           gotcha pattern convention architecture auth middleware \
-           async concurrency model protocol adapter scanner engine \
-           decision tradeoff rationale constraint deprecat migration \
-           schema endpoint route validation error config env deploy \
-           cache queue retry timeout rate-limit pagination rollback \
-           react nextjs typescript python rust go docker postgres \
-           redis graphql rest webhook cron worker job; do
-  if echo "$CONTENT" | grep -qi "$tag"; then
-    TAGS_ARRAY+=("$tag")
-  fi
-done
-
-TAGS_JSON=$(printf '%s\n' "${TAGS_ARRAY[@]}" | jq -R . | jq -s .)
-
-TS=$(date +%s)
-
-ENTRY=$(jq -cn \
-  --arg key "$KEY" \
-  --arg type "$TYPE" \
-  --arg content "$CONTENT" \
-  --arg source "$SOURCE" \
-  --argjson tags "$TAGS_JSON" \
-  --argjson ts "$TS" \
-  --arg bead "$BEAD_ID" \
-  '{key: $key, type: $type, content: $content, source: $source, tags: $tags, ts: $ts, bead: $bead}')
-
-[[ -z "$ENTRY" ]] && exit 0
-echo "$ENTRY" | jq . >/dev/null 2>&1 || exit 0
-
+# Opt-in latency tracing (no-op unless BEADS_COMPOUND_TRACE=1)
+source "${0%/*}/hook-trace.sh" 2>/dev/null || { trace_init() { :; }; trace_begin() { :; }; trace_add() { :; }; trace_end() { :; }; }
+trace_init memory-capture
+
+trace_begin parse
+# Read stdin with a builtin (no fork), then reject on a raw substring match
+# before any JSON parsing: almost every Bash tool call ends here
+IFS= read -r -d '' INPUT
+trace_add bytes "${#INPUT}"
+
+case "$INPUT" in
+  *bd*comment*) ;;
+  *) exit 0 ;;
+esac
+case "$INPUT" in
+  *INVESTIGATION:*|*LEARNED:*|*DECISION:*|*FACT:*|*PATTERN:*) ;;
+  *) exit 0 ;;
+esac
+
+# Single jq pass: match, extract and build the entry. Prints the compact
+# entry, then key, type, source, bead, ts and tags on one line each, then
+# the (possibly multi-line) content; nothing if the command doesn't qualify.
+PARSED=$(printf '%s' "$INPUT" | jq -r '
+  def per_line(f): split("\n") | map(f) | join("\n");
+
+  select(.tool_name == "Bash") |
+  (.tool_input.command // "") as $cmd |
+  ([$cmd | match("bd\\s+comments?\\s+add\\s+([A-Za-z0-9._-]+)\\s+"; "g")] | last) as $m |
+  select($m != null) |
+  $m.captures[0].string as $bead |
+
+  ($cmd[($m.offset + $m.length):] | sub("^[\"'"'"']"; "") | .[:4096]
+    | per_line(sub("[\"'"'"']\\s*$"; ""))) as $body |
+
+  ([("INVESTIGATION", "LEARNED", "DECISION", "FACT", "PATTERN")
+    | select(. as $p | $body | contains($p + ":"))] | first) as $prefix |
+  select($prefix != null) |
+
+  ($body | per_line(sub(".*" + $prefix + ":\\s*"; "")) | .[:2048] | sub("\n+$"; "")) as $content |
+  select($content != "") |
+
+  ($prefix | ascii_downcase) as $type |
+  ($content[:60] | ascii_downcase | gsub("[^a-z0-9]+"; "-") | ltrimstr("-") | rtrimstr("-")) as $slug |
+  ($content | ascii_downcase) as $lc |
+  ([$type] + [
+    "swift", "swiftui", "appkit", "menubar", "api", "security", "test", "database",
+    "networking", "ui", "layout", "performance", "crash", "bug", "fix", "workaround",
+    "gotcha", "pattern", "convention", "architecture", "auth", "middleware",
+    "async", "concurrency", "model", "protocol", "adapter", "scanner", "engine",
+    "decision", "tradeoff", "rationale", "constraint", "deprecat", "migration",
+    "schema", "endpoint", "route", "validation", "error", "config", "env", "deploy",
+    "cache", "queue", "retry", "timeout", "rate-limit", "pagination", "rollback",
+    "react", "nextjs", "typescript", "python", "rust", "go", "docker", "postgres",
+    "redis", "graphql", "rest", "webhook", "cron", "worker", "job"
+    | select(. as $t | $lc | contains($t))]) as $tags |
+
+  {key: "\($type)-\($slug)", type: $type, content: $content,
+   source: (if ((.cwd // "") | contains(".worktrees/")) then "supervisor" else "user" end),
+   tags: $tags, ts: (now | floor), bead: $bead} |
+
+  (tojson, .key, .type, .source, .bead, (.ts | tostring), (.tags | join(" ")), .content)
+' 2>/dev/null)
+
+[[ -z "$PARSED" ]] && exit 0
+
+{
+  read -r ENTRY
+  read -r KEY
+  read -r TYPE
+  read -r SOURCE
+  read -r BEAD_ID
+  read -r TS
+  read -r TAGS_TEXT
+  IFS= read -r -d '' CONTENT
+} <<< "$PARSED"
+CONTENT="${CONTENT%$'\n'}"
+
+[[ -z "$ENTRY" || -z "$CONTENT" ]] && exit 0
+
+trace_begin write
 MEMORY_DIR="${CLAUDE_PROJECT_DIR:-.}/.beads/memory"
 mkdir -p "$MEMORY_DIR"
 KNOWLEDGE_FILE="$MEMORY_DIR/knowledge.jsonl"
@@ -95,7 +96,6 @@ if command -v sqlite3 &>/dev/null; then
   SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
   if [[ -f "$SCRIPT_DIR/knowledge-db.sh" ]]; then
     source "$SCRIPT_DIR/knowledge-db.sh"
-    TAGS_TEXT=$(echo "$TAGS_JSON" | jq -r '.[]' 2>/dev/null | tr '\n' ' ')
     kb_ensure_db "$MEMORY_DIR/knowledge.db"
     kb_insert "$MEMORY_DIR/knowledge.db" "$KEY" "$TYPE" "$CONTENT" "$SOURCE" "$TAGS_TEXT" "$TS" "$BEAD_ID"
   fi
@@ -107,16 +107,28 @@ if [[ -f "$KNOWLEDGE_FILE" ]] && grep -qF "\"key\":\"$KEY\"" "$KNOWLEDGE_FILE";
 fi
 
 echo "$ENTRY" >> "$KNOWLEDGE_FILE"
+trace_add rows 1
 
 # Rotation: archive oldest 2500 when file exceeds 5000 lines
 # High threshold avoids rewriting the file (which breaks merge=union)
 LINE_COUNT=$(wc -l < "$KNOWLEDGE_FILE" 2>/dev/null | tr -d ' ')
 
 if [[ "$LINE_COUNT" -gt 5000 ]]; then
-  ARCHIVE_FILE="$MEMORY_DIR/knowledge.archive.jsonl"
-  head -2500 "$KNOWLEDGE_FILE" >> "$ARCHIVE_FILE"
+  trace_begin rotate
+  head -2500 "$KNOWLEDGE_FILE" > "$KNOWLEDGE_FILE.rotate"
+
+  # Archived entries go to a new compressed segment (see kb_archive_write);
+  # plain JSONL append is the fallback when the library is unavailable
+  SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+  if ! { [[ -f "$SCRIPT_DIR/knowledge-db.sh" ]] \
+         && source "$SCRIPT_DIR/knowledge-db.sh" \
+         && kb_archive_write "$MEMORY_DIR/archive" "$KNOWLEDGE_FILE.rotate"; }; then
+    cat "$KNOWLEDGE_FILE.rotate" >> "$MEMORY_DIR/knowledge.archive.jsonl"
+  fi
+
   tail -n +2501 "$KNOWLEDGE_FILE" > "$KNOWLEDGE_FILE.tmp"
   mv "$KNOWLEDGE_FILE.tmp" "$KNOWLEDGE_FILE"
+  rm -f "$KNOWLEDGE_FILE.rotate"
 fi
 
 exit 0
@@ -36,6 +36,17 @@ provision_memory_dir() {
     chmod +x "$MEMORY_DIR/knowledge-db.sh"
   fi
 
+  # Copy knowledge-index.py (offset index for recall without sqlite3)
+  if [[ -f "$HOOKS_SOURCE_DIR/knowledge-index.py" ]]; then
+    cp "$HOOKS_SOURCE_DIR/knowledge-index.py" "$MEMORY_DIR/knowledge-index.py"
+    chmod +x "$MEMORY_DIR/knowledge-index.py"
+  fi
+
+  # Local caches rebuilt on demand -- never committed
+  if [[ ! -f "$MEMORY_DIR/.gitignore" ]]; then
+    printf 'knowledge.offsets\n*.tmp.*\n' > "$MEMORY_DIR/.gitignore"
+  fi
+
   # Setup .gitattributes for union merge (per-directory, scoped to .beads/memory/)
   local GITATTR="$MEMORY_DIR/.gitattributes"
 
@@ -44,6 +55,11 @@ provision_memory_dir() {
     echo "knowledge.archive.jsonl merge=union" >> "$GITATTR"
   fi
 
+  # Archive segments are immutable compressed files
+  if ! grep -q 'archive/' "$GITATTR" 2>/dev/null; then
+    echo "archive/*.gz binary" >> "$GITATTR"
+  fi
+
   # Ensure .beads/memory/ is not gitignored
   # Many projects gitignore .beads/ for the daemon/cache files,
   # but memory files need to be tracked for cross-machine persistence
@@ -64,6 +80,8 @@ provision_memory_dir() {
       .beads/memory/.gitattributes \
       .beads/memory/recall.sh \
       .beads/memory/knowledge-db.sh \
+      .beads/memory/knowledge-index.py \
+      .beads/memory/.gitignore \
       2>/dev/null) || true
   fi
 }
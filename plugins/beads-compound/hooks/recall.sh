@@ -8,17 +8,17 @@
 #   recall.sh --recent 10                  # Show latest N entries
 #   recall.sh --stats                      # Knowledge base stats
 #   recall.sh "keyword" --all              # Include archive
-#   recall.sh --topic BD-005               # Filter by epic parent
+#   recall.sh --compact-archive            # Convert legacy archive to segments
+#   recall.sh --topic BD-005               # Epic and its whole subtree
+#   recall.sh --bead BD-001                # Entries logged to one bead
+#   recall.sh "keyword" --global           # Search all registered projects
+#   recall.sh --register [--weight 2.0]    # Add this project to the global index
 #
 
 MEMORY_DIR="${CLAUDE_PROJECT_DIR:-.}/.beads/memory"
 KNOWLEDGE_FILE="$MEMORY_DIR/knowledge.jsonl"
 ARCHIVE_FILE="$MEMORY_DIR/knowledge.archive.jsonl"
-
-if [[ ! -f "$KNOWLEDGE_FILE" ]]; then
-  echo "No knowledge base found at $KNOWLEDGE_FILE"
-  exit 0
-fi
+ARCHIVE_DIR="$MEMORY_DIR/archive"
 
 # Parse args
 QUERY=""
@@ -27,6 +27,11 @@ RECENT=0
 SHOW_STATS=false
 INCLUDE_ARCHIVE=false
 TOPIC_ID=""
+BEAD_ID=""
+GLOBAL=false
+REGISTER=false
+WEIGHT=""
+COMPACT_ARCHIVE=false
 
 while [[ $# -gt 0 ]]; do
   case "$1" in
@@ -35,6 +40,11 @@ while [[ $# -gt 0 ]]; do
     --stats) SHOW_STATS=true; shift ;;
     --all) INCLUDE_ARCHIVE=true; shift ;;
     --topic) TOPIC_ID="$2"; shift 2 ;;
+    --bead) BEAD_ID="$2"; shift 2 ;;
+    --global) GLOBAL=true; shift ;;
+    --register) REGISTER=true; shift ;;
+    --weight) WEIGHT="$2"; shift 2 ;;
+    --compact-archive) COMPACT_ARCHIVE=true; shift ;;
     *) QUERY="$1"; shift ;;
   esac
 done
@@ -44,11 +54,102 @@ if ! [[ "$RECENT" =~ ^[0-9]+$ ]]; then
   RECENT=0
 fi
 
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+DB_PATH="$MEMORY_DIR/knowledge.db"
+
+# Global index modes -- work from any directory
+if $REGISTER || $GLOBAL; then
+  if ! command -v sqlite3 &>/dev/null || [[ ! -f "$SCRIPT_DIR/knowledge-db.sh" ]]; then
+    echo "Global search requires sqlite3 and knowledge-db.sh"
+    exit 1
+  fi
+
+  source "$SCRIPT_DIR/knowledge-db.sh"
+
+  if $REGISTER; then
+    if [[ ! -f "$KNOWLEDGE_FILE" ]]; then
+      echo "No knowledge base found at $KNOWLEDGE_FILE"
+      exit 1
+    fi
+
+    kb_sync "$DB_PATH" "$MEMORY_DIR"
+    kb_global_register "$DB_PATH" "${CLAUDE_PROJECT_DIR:-.}" "$WEIGHT"
+    kb_global_refresh force
+    echo "Registered $DB_PATH in $KB_GLOBAL_DB"
+    $GLOBAL || exit 0
+  fi
+
+  if [[ -z "$QUERY" ]]; then
+    echo "Usage: recall.sh \"keyword\" --global [--type TYPE]"
+    exit 0
+  fi
+
+  kb_global_refresh
+
+  kb_global_search "$QUERY" 20 | while IFS='|' read -r project type content bead tags; do
+    [[ -z "$type" ]] && continue
+    [[ -n "$TYPE_FILTER" ]] && [[ "$type" != "$TYPE_FILTER" ]] && continue
+
+    echo "[$(echo "$type" | tr '[:lower:]' '[:upper:]')] $content
+  project: $project | bead: $bead | $tags
+"
+  done
+  exit 0
+fi
+
+if [[ ! -f "$KNOWLEDGE_FILE" ]]; then
+  echo "No knowledge base found at $KNOWLEDGE_FILE"
+  exit 0
+fi
+
+# Archive segment readers (kb_archive_*) only need gzip and jq
+[[ -f "$SCRIPT_DIR/knowledge-db.sh" ]] && source "$SCRIPT_DIR/knowledge-db.sh"
+
+# Offset index lookups (knowledge-index.py); non-zero exit means use a scan
+index_lookup() {
+  command -v python3 &>/dev/null && [[ -f "$SCRIPT_DIR/knowledge-index.py" ]] \
+    && python3 "$SCRIPT_DIR/knowledge-index.py" "$KNOWLEDGE_FILE" "$@" 2>/dev/null
+}
+
+# Legacy plain-text archive first, then compressed segments, both filtered
+# by the same --bead/--since/--last mode
+archive_cat() {
+  if [[ -f "$ARCHIVE_FILE" ]]; then
+    if declare -f kb_archive_filter >/dev/null; then
+      kb_archive_filter "$@" < "$ARCHIVE_FILE"
+    else
+      cat "$ARCHIVE_FILE"
+    fi
+  fi
+  declare -f kb_archive_cat >/dev/null && kb_archive_cat "$ARCHIVE_DIR" "$@"
+}
+
+# Compact mode -- move legacy knowledge.archive.jsonl into a segment
+if $COMPACT_ARCHIVE; then
+  if [[ ! -s "$ARCHIVE_FILE" ]]; then
+    echo "No legacy archive to compact"
+    exit 0
+  fi
+
+  if ! declare -f kb_archive_write >/dev/null; then
+    echo "knowledge-db.sh not found -- cannot compact archive"
+    exit 1
+  fi
+
+  BEFORE=$(wc -c < "$ARCHIVE_FILE" | tr -d ' ')
+  kb_archive_write "$ARCHIVE_DIR" "$ARCHIVE_FILE" || { echo "Compaction failed"; exit 1; }
+  rm -f "$ARCHIVE_FILE"
+  AFTER=$(cat "$ARCHIVE_DIR"/*.jsonl.gz | wc -c | tr -d ' ')
+  echo "Compacted archive: $BEFORE bytes -> $AFTER bytes in $ARCHIVE_DIR"
+  exit 0
+fi
+
 # Stats mode
 if $SHOW_STATS; then
   TOTAL=$(wc -l < "$KNOWLEDGE_FILE" | tr -d ' ')
   ARCHIVE_COUNT=0
   [[ -f "$ARCHIVE_FILE" ]] && ARCHIVE_COUNT=$(wc -l < "$ARCHIVE_FILE" | tr -d ' ')
+  declare -f kb_archive_count >/dev/null && ARCHIVE_COUNT=$(( ARCHIVE_COUNT + $(kb_archive_count "$ARCHIVE_DIR") ))
 
   echo "Knowledge base: $KNOWLEDGE_FILE"
   echo "Active entries: $TOTAL"
@@ -62,8 +163,21 @@ if $SHOW_STATS; then
   exit 0
 fi
 
-# Topic mode -- filter by bead parent
+# Topic mode -- knowledge for an epic and everything below it
 if [[ -n "$TOPIC_ID" ]]; then
+  # Indexed JOIN against the bead closure table when the graph can be built.
+  # Sync first so entries captured since the last session are included.
+  if command -v sqlite3 &>/dev/null && declare -f kb_graph_refresh >/dev/null \
+     && kb_sync "$DB_PATH" "$MEMORY_DIR" \
+     && kb_graph_refresh "$DB_PATH" "${CLAUDE_PROJECT_DIR:-.}/.beads"; then
+    kb_topic "$DB_PATH" "$TOPIC_ID" | while IFS='|' read -r type content bead; do
+      [[ -z "$type" ]] && continue
+      echo "$(echo "$type" | tr '[:lower:]' '[:upper:]'): $content"
+    done
+    exit 0
+  fi
+
+  # Fallback: direct children only, via bd
   if ! command -v bd &>/dev/null; then
     echo "bd not found -- cannot query topic children"
     exit 1
@@ -76,25 +190,41 @@ if [[ -n "$TOPIC_ID" ]]; then
     exit 0
   fi
 
+  BEAD_ARGS=()
   for CHILD_ID in $CHILDREN; do
-    grep "\"bead\":\"$CHILD_ID\"" "$KNOWLEDGE_FILE" 2>/dev/null
-  done | jq -r '"\(.type | ascii_upcase): \(.content)"' 2>/dev/null
+    BEAD_ARGS+=(--bead "$CHILD_ID")
+  done
+
+  {
+    index_lookup "${BEAD_ARGS[@]}" || for CHILD_ID in $CHILDREN; do
+      grep "\"bead\":\"$CHILD_ID\"" "$KNOWLEDGE_FILE" 2>/dev/null
+    done
+  } | jq -r '"\(.type | ascii_upcase): \(.content)"' 2>/dev/null
   exit 0
 fi
 
-# Build input (optionally include archive)
-INPUT_FILES="$KNOWLEDGE_FILE"
-$INCLUDE_ARCHIVE && [[ -f "$ARCHIVE_FILE" ]] && INPUT_FILES="$ARCHIVE_FILE $KNOWLEDGE_FILE"
+# Bead mode -- entries logged directly to one bead
+if [[ -n "$BEAD_ID" ]]; then
+  {
+    # Without knowledge-db.sh the legacy archive comes back unfiltered
+    $INCLUDE_ARCHIVE && archive_cat --bead "$BEAD_ID" | jq -c --arg id "$BEAD_ID" 'select(.bead == $id)' 2>/dev/null
+    index_lookup --bead "$BEAD_ID" || grep -F "\"bead\":\"$BEAD_ID\"" "$KNOWLEDGE_FILE" 2>/dev/null
+  } | jq -r '"\(.type | ascii_upcase): \(.content)"' 2>/dev/null
+  exit 0
+fi
 
-# Recent mode
+# Recent mode (archive segments: only the newest blocks are decompressed)
 if [[ "$RECENT" -gt 0 ]]; then
-  cat $INPUT_FILES | tail -"$RECENT" | jq -r '"\(.type | ascii_upcase): \(.content)"' 2>/dev/null
+  {
+    $INCLUDE_ARCHIVE && archive_cat --last "$RECENT"
+    index_lookup --recent "$RECENT" || tail -"$RECENT" "$KNOWLEDGE_FILE"
+  } | tail -"$RECENT" | jq -r '"\(.type | ascii_upcase): \(.content)"' 2>/dev/null
   exit 0
 fi
 
 # Search mode
 if [[ -z "$QUERY" ]]; then
-  echo "Usage: recall.sh \"keyword\" [--type TYPE] [--recent N] [--stats] [--all] [--topic ID]"
+  echo "Usage: recall.sh \"keyword\" [--type TYPE] [--recent N] [--stats] [--all] [--topic ID] [--bead ID] [--global] [--register [--weight W]]"
   exit 0
 fi
 
@@ -102,9 +232,6 @@ fi
 USED_FTS5=false
 
 if command -v sqlite3 &>/dev/null; then
-  DB_PATH="$MEMORY_DIR/knowledge.db"
-  SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
-
   if [[ -f "$DB_PATH" ]] && [[ -f "$SCRIPT_DIR/knowledge-db.sh" ]]; then
     source "$SCRIPT_DIR/knowledge-db.sh"
     RAW_RESULTS=$(kb_search "$DB_PATH" "$QUERY" 20)
@@ -136,7 +263,7 @@ fi
 
 if [[ "$USED_FTS5" = false ]]; then
   # Grep fallback
-  RESULTS=$(grep -i "$QUERY" $INPUT_FILES 2>/dev/null)
+  RESULTS=$({ $INCLUDE_ARCHIVE && archive_cat; cat "$KNOWLEDGE_FILE"; } | grep -i -- "$QUERY" 2>/dev/null)
 
   if [[ -n "$TYPE_FILTER" ]]; then
     RESULTS=$(echo "$RESULTS" | jq -r "select(.type == \"$TYPE_FILTER\")" 2>/dev/null)
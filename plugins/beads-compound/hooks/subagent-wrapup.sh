@@ -2,23 +2,60 @@
 #
 # SubagentStop: Auto-capture learnings before subagent exits
 #
-# This hook runs when any subagent completes. It prompts the subagent
-# to log key learnings to the bead before finishing.
+# This hook runs when any subagent completes. If the subagent worked on a
+# bead and has not logged any knowledge yet, it prompts it to log key
+# learnings to the bead before finishing.
 #
 
-INPUT=$(cat)
-AGENT_TYPE=$(echo "$INPUT" | jq -r '.agent_type // empty')
-AGENT_ID=$(echo "$INPUT" | jq -r '.agent_id // empty')
+# Opt-in latency tracing (no-op unless BEADS_COMPOUND_TRACE=1)
+source "${0%/*}/hook-trace.sh" 2>/dev/null || { trace_init() { :; }; trace_begin() { :; }; trace_add() { :; }; trace_end() { :; }; }
+trace_init subagent-wrapup
+
+trace_begin scan
+IFS= read -r -d '' INPUT
+# Fields are joined with the ASCII unit separator: unlike tab, it is not IFS
+# whitespace, so an empty field stays empty instead of collapsing
+US=$'\x1f'
+IFS="$US" read -r AGENT_ID TRANSCRIPT_PATH <<< "$(printf '%s' "$INPUT" | jq -r '[.agent_id // "", .agent_transcript_path // ""] | join("\u001f")')"
 
 # Only run for actual subagents (not the main agent)
 [[ -z "$AGENT_ID" ]] && exit 0
 
 # Check if there's a BEAD_ID in the agent's context
-TRANSCRIPT_PATH=$(echo "$INPUT" | jq -r '.agent_transcript_path // empty')
-
 if [[ -n "$TRANSCRIPT_PATH" ]] && [[ -f "$TRANSCRIPT_PATH" ]]; then
-  # Try to extract BEAD_ID from the transcript
-  BEAD_ID=$(grep -oE 'BEAD_ID: [A-Za-z0-9._-]+' "$TRANSCRIPT_PATH" 2>/dev/null | head -1 | sed 's/BEAD_ID: //')
+  [[ -n "$BEADS_COMPOUND_TRACE" ]] && trace_add bytes "$(wc -c < "$TRANSCRIPT_PATH")"
+
+  # One streaming pass (line at a time): first BEAD_ID, first timestamp, and
+  # whether a Bash tool call already ran `bd comments add ... "LEARNED: ..."`.
+  # Stops early once both the bead and a logged comment have been seen.
+  IFS="$US" read -r BEAD_ID LOGGED AGENT_START < <(awk -v us="$US" '
+    !start && match($0, /"timestamp":"[^"]+"/) {
+      start = substr($0, RSTART + 13, RLENGTH - 14)
+    }
+    !bead && match($0, /BEAD_ID: [A-Za-z0-9._-]+/) {
+      bead = substr($0, RSTART + 9, RLENGTH - 9)
+    }
+    !logged && /"tool_use"/ && /bd[ \t]+comments?[ \t]+add[ \t]+[A-Za-z0-9._-]+[ \t]/ \
+      && /(INVESTIGATION|LEARNED|DECISION|FACT|PATTERN):/ {
+      logged = 1
+    }
+    bead && logged { exit }
+    END { printf "%s%s%d%s%s\n", bead, us, logged, us, start }
+  ' "$TRANSCRIPT_PATH" 2>/dev/null)
+
+  # memory-capture runs async, so the transcript is the primary signal; the
+  # knowledge DB catches comments logged outside this agent's own tool calls
+  if [[ -n "$BEAD_ID" ]] && [[ "$LOGGED" != "1" ]] && [[ -n "$AGENT_START" ]] && command -v sqlite3 &>/dev/null; then
+    DB_PATH="${CLAUDE_PROJECT_DIR:-.}/.beads/memory/knowledge.db"
+    SAFE_BEAD=$(printf '%s' "$BEAD_ID" | tr -cd 'a-zA-Z0-9._-')
+    SAFE_START=$(printf '%s' "$AGENT_START" | tr -cd '0-9TZ:.+-')
+    if [[ -f "$DB_PATH" ]]; then
+      LOGGED=$(sqlite3 "$DB_PATH" "SELECT count(*) > 0 FROM knowledge WHERE bead = '$SAFE_BEAD' AND ts >= CAST(strftime('%s', '$SAFE_START') AS INTEGER);" 2>/dev/null)
+    fi
+  fi
+
+  # Knowledge already captured - allow completion without another turn
+  [[ "$LOGGED" == "1" ]] && exit 0
 
   if [[ -n "$BEAD_ID" ]]; then
     # Subagent is working on a bead - prompt it to log learnings
@@ -4,6 +4,16 @@
 # Uses JSON decision:block pattern (consistent with subagent-wrapup.sh).
 #
 # TeammateIdle hook -- fires when a teammate tries to go idle.
+#
+# When many teammates go idle at once, one of them refreshes a shared
+# `bd ready` snapshot under a lock and the rest reuse it for
+# BEADS_READY_TTL seconds (default 5) or until the beads DB changes. Each
+# named teammate is also offered a ready bead no other teammate was offered
+# in the last BEADS_READY_CLAIM_TTL seconds (default 120).
+
+# Opt-in latency tracing (no-op unless BEADS_COMPOUND_TRACE=1)
+source "${0%/*}/hook-trace.sh" 2>/dev/null || { trace_init() { :; }; trace_begin() { :; }; trace_add() { :; }; trace_end() { :; }; }
+trace_init teammate-idle-check
 
 INPUT=$(cat)
 TEAMMATE=$(echo "$INPUT" | jq -r '.teammate_name // empty')
@@ -13,15 +23,107 @@ if [[ ! "$TEAMMATE" =~ ^[a-zA-Z0-9_-]{1,64}$ ]]; then
   TEAMMATE="unknown"
 fi
 
-READY=$(bd ready --json 2>/dev/null | jq 'length' 2>/dev/null || echo "0")
+READY_TTL="${BEADS_READY_TTL:-5}"
+CLAIM_TTL="${BEADS_READY_CLAIM_TTL:-120}"
 
-if [ "$READY" -gt 0 ]; then
-  cat << EOF
-{
-  "decision": "block",
-  "reason": "There are $READY beads ready to work on. Run 'bd ready' and pick one."
+PROJECT_DIR="${CLAUDE_PROJECT_DIR:-.}"
+BEADS_DIR="$PROJECT_DIR/.beads"
+CACHE_DIR="${TMPDIR:-/tmp}/beads-compound-ready-$(cd "$PROJECT_DIR" 2>/dev/null && pwd | cksum | cut -d' ' -f1)"
+SNAPSHOT="$CACHE_DIR/snapshot"
+CLAIMS="$CACHE_DIR/claims"
+LOCK="$CACHE_DIR/lock"
+
+mkdir -p "$CACHE_DIR" 2>/dev/null
+
+# size:mtime of whatever backs the beads DB
+beads_signature() {
+  local FILES=() F
+  for F in "$BEADS_DIR/beads.db" "$BEADS_DIR/beads.db-wal" "$BEADS_DIR/issues.jsonl"; do
+    [[ -e "$F" ]] && FILES+=("$F")
+  done
+  [[ ${#FILES[@]} -eq 0 ]] && { echo "none"; return; }
+  { stat -c '%s:%Y' "${FILES[@]}" 2>/dev/null || stat -f '%z:%m' "${FILES[@]}" 2>/dev/null; } | tr '\n' ','
+}
+
+# Snapshot layout: line 1 "SIGNATURE<TAB>FETCHED_AT", line 2 JSON [{id,title}]
+snapshot_fresh() {
+  local SIG AT
+  [[ -f "$SNAPSHOT" ]] || return 1
+  IFS=$'\t' read -r SIG AT < "$SNAPSHOT"
+  [[ "$SIG" == "$SIGNATURE" ]] && [[ "$AT" =~ ^[0-9]+$ ]] && [[ $(( NOW - AT )) -lt $READY_TTL ]]
+}
+
+# mkdir is atomic everywhere (macOS has no flock)
+acquire_lock() {
+  local TRIES=0
+  until mkdir "$LOCK" 2>/dev/null; do
+    # Break a lock left behind by a killed refresher
+    if [[ -n "$(find "$LOCK" -maxdepth 0 -mmin +1 2>/dev/null)" ]]; then
+      rmdir "$LOCK" 2>/dev/null
+      continue
+    fi
+    TRIES=$(( TRIES + 1 ))
+    [[ $TRIES -gt 100 ]] && return 1
+    sleep 0.1
+  done
 }
-EOF
+
+trace_begin ready
+NOW=$(date +%s)
+SIGNATURE=$(beads_signature)
+SUGGESTED=""
+
+if acquire_lock; then
+  # Another checker may have refreshed while we waited
+  if ! snapshot_fresh; then
+    READY_JSON=$(bd ready --json 2>/dev/null | jq -c '[.[] | {id, title}]' 2>/dev/null)
+    [[ -z "$READY_JSON" ]] && READY_JSON="[]"
+    printf '%s\t%s\n%s\n' "$SIGNATURE" "$NOW" "$READY_JSON" > "$SNAPSHOT.tmp.$$"
+    mv -f "$SNAPSHOT.tmp.$$" "$SNAPSHOT"
+  fi
+
+  # Keep this teammate's live claim if its bead is still ready, else claim
+  # the first ready bead nobody else holds. Claims expire after CLAIM_TTL.
+  if [[ "$TEAMMATE" != "unknown" ]]; then
+    touch "$CLAIMS"
+    CLAIMED=$(tail -n +2 "$SNAPSHOT" | jq -r --arg me "$TEAMMATE" --argjson now "$NOW" \
+      --argjson ttl "$CLAIM_TTL" --rawfile claims "$CLAIMS" '
+      [.[].id] as $ready |
+      [$claims | split("\n")[] | select(length > 0) | split("\t")
+        | {bead: .[0], who: .[1], at: (.[2] | tonumber? // 0)}
+        | select(.at > $now - $ttl and (.bead as $b | $ready | index($b)))] as $live |
+      [$live[] | select(.who != $me)] as $others |
+      (([$live[] | select(.who == $me) | .bead] | first)
+        // ([$ready[] | select(. as $b | $others | map(.bead) | index($b) | not)] | first)) as $pick |
+      (if $pick then [$pick, $me, $now] else empty end),
+      ($others[] | [.bead, .who, .at]) |
+      map(tostring) | join("\t")
+    ' 2>/dev/null)
+    printf '%s\n' "$CLAIMED" | sed '/^$/d' > "$CLAIMS.tmp.$$"
+    mv -f "$CLAIMS.tmp.$$" "$CLAIMS"
+    SUGGESTED=$(printf '%s\n' "$CLAIMED" | awk -F'\t' -v me="$TEAMMATE" 'NR == 1 && $2 == me { print $1 }')
+  fi
+
+  READY_JSON=$(tail -n +2 "$SNAPSHOT")
+  rmdir "$LOCK" 2>/dev/null
+else
+  # Lock unavailable: ask bd directly
+  READY_JSON=$(bd ready --json 2>/dev/null)
+fi
+
+READY=$(printf '%s' "$READY_JSON" | jq 'length' 2>/dev/null)
+[[ "$READY" =~ ^[0-9]+$ ]] || READY=0
+trace_add rows "$READY"
+
+if [ "$READY" -gt 0 ]; then
+  PICK=""
+  if [[ -n "$SUGGESTED" ]]; then
+    TITLE=$(printf '%s' "$READY_JSON" | jq -r --arg id "$SUGGESTED" '.[] | select(.id == $id) | .title // empty | .[:120]' 2>/dev/null)
+    PICK=" Suggested for you: $SUGGESTED ($TITLE) -- claim it with 'bd update $SUGGESTED --status in_progress'; other idle teammates are offered different beads."
+  fi
+  # jq escapes quotes, newlines and control characters in bead titles
+  jq -n --arg reason "There are $READY beads ready to work on. Run 'bd ready' and pick one.$PICK" \
+    '{decision: "block", reason: $reason}'
   exit 0
 fi
 
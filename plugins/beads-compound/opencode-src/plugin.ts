@@ -3,13 +3,130 @@
  *
  * Ports auto-recall.sh and memory-capture.sh hooks to OpenCode's event system.
  * Subagent wrapup is handled separately via tool.execute.after with tool=task filter.
+ *
+ * Hooks run through one persistent hooks/hook-server.sh process instead of a
+ * fresh bash per event, bash commands are filtered in-process before anything
+ * is sent to it, and session-start recall is cached per directory until the
+ * knowledge files, beads DB or git HEAD change.
  */
 
 import type { Plugin } from "@opencode-ai/plugin";
+import type { Subprocess } from "bun";
+import { existsSync, statSync } from "node:fs";
 import { resolve } from "node:path";
 
 console.log("[beads-compound] Plugin loaded successfully");
 
+// Installed layout is <base>/plugins/beads-compound next to <base>/hooks;
+// ../hooks covers running straight from the source tree (opencode-src)
+const HOOKS_DIR =
+  [resolve(import.meta.dir, "../hooks"), resolve(import.meta.dir, "../../hooks")].find((dir) =>
+    existsSync(resolve(dir, "hook-server.sh"))
+  ) ?? resolve(import.meta.dir, "../hooks");
+
+/**
+ * Client for hook-server.sh: requests are written as
+ * HOOK<TAB>DIR<TAB>PAYLOAD lines, responses are NUL-terminated and arrive in
+ * request order. The process is started lazily and restarted if it exits.
+ */
+class HookServer {
+  private proc: Subprocess<"pipe", "pipe", "inherit"> | null = null;
+  private pending: Array<(output: string) => void> = [];
+
+  private start() {
+    const proc = Bun.spawn(["bash", resolve(HOOKS_DIR, "hook-server.sh")], {
+      env: process.env,
+      stdin: "pipe",
+      stdout: "pipe",
+      stderr: "inherit",
+    });
+    proc.unref();
+    this.proc = proc;
+    this.pump(proc);
+    return proc;
+  }
+
+  private async pump(proc: Subprocess<"pipe", "pipe", "inherit">) {
+    const decoder = new TextDecoder();
+    let buffer = "";
+
+    try {
+      for await (const chunk of proc.stdout) {
+        buffer += decoder.decode(chunk, { stream: true });
+        let end;
+        while ((end = buffer.indexOf("\0")) >= 0) {
+          this.pending.shift()?.(buffer.slice(0, end));
+          buffer = buffer.slice(end + 1);
+        }
+      }
+    } catch (err) {
+      console.error("[beads-compound] hook-server read error:", err);
+    }
+
+    // Process exited: fail outstanding requests, restart on next call
+    if (this.proc === proc) {
+      this.proc = null;
+      for (const resolveOutput of this.pending.splice(0)) {
+        resolveOutput("");
+      }
+    }
+  }
+
+  run(hook: "auto-recall" | "memory-capture", directory: string, payload: object = {}) {
+    // Tabs/newlines would break request framing
+    if (/[\t\n\r]/.test(directory)) {
+      return Promise.resolve("");
+    }
+
+    const proc = this.proc ?? this.start();
+    return new Promise<string>((resolveOutput) => {
+      this.pending.push(resolveOutput);
+      proc.stdin.write(`${hook}\t${directory}\t${JSON.stringify(payload)}\n`);
+      proc.stdin.flush();
+    });
+  }
+}
+
+const hookServer = new HookServer();
+
+// Session-start recall per directory, reused until its inputs change
+const recallCache = new Map<string, { generation: string; result: Promise<string | undefined> }>();
+
+function fileStamp(path: string): string {
+  try {
+    const st = statSync(path);
+    return `${st.size}:${st.mtimeMs}`;
+  } catch {
+    return "-";
+  }
+}
+
+// Everything auto-recall.sh reads: knowledge files, open beads, current branch
+function recallGeneration(directory: string): string {
+  return [
+    ".beads/memory/knowledge.jsonl",
+    ".beads/memory/knowledge.db",
+    ".beads/beads.db",
+    ".beads/issues.jsonl",
+    ".git/HEAD",
+  ]
+    .map((file) => fileStamp(resolve(directory, file)))
+    .join("|");
+}
+
+async function runRecall(directory: string): Promise<string | undefined> {
+  const stdout = await hookServer.run("auto-recall", directory);
+
+  // Parse JSON output
+  try {
+    const output = JSON.parse(stdout);
+    return output.hookSpecificOutput?.systemMessage;
+  } catch (err) {
+    // Not JSON or parse error - no output to inject
+    return undefined;
+  }
+}
+
 export default {
   // Set CLAUDE_PROJECT_DIR globally for all bd commands
   "shell.env": async ({ directory }) => {
@@ -33,37 +150,21 @@ export default {
       return;
     }
 
-    const hookScript = resolve(
-      import.meta.dir,
-      "../hooks/auto-recall.sh"
-    );
-
-    const proc = Bun.spawn(["bash", hookScript], {
-      env: {
-        ...process.env,
-        CLAUDE_PROJECT_DIR: directory,
-      },
-      stdout: "pipe",
-      stderr: "pipe",
-    });
-
-    const stdout = await new Response(proc.stdout).text();
-    const stderr = await new Response(proc.stderr).text();
-
-    if (stderr) {
-      console.error("[beads-compound] auto-recall error:", stderr);
+    const generation = recallGeneration(directory);
+    let cached = recallCache.get(directory);
+    if (!cached || cached.generation !== generation) {
+      const entry = { generation, result: runRecall(directory) };
+      recallCache.set(directory, entry);
+      // auto-recall syncs knowledge.db itself; stamp the state it left behind
+      entry.result.then(() => {
+        entry.generation = recallGeneration(directory);
+      });
+      cached = entry;
     }
 
-    // Parse JSON output
-    try {
-      const output = JSON.parse(stdout);
-      if (output.hookSpecificOutput?.systemMessage) {
-        return {
-          systemMessage: output.hookSpecificOutput.systemMessage,
-        };
-      }
-    } catch (err) {
-      // Not JSON or parse error - no output to inject
+    const systemMessage = await cached.result;
+    if (systemMessage) {
+      return { systemMessage };
     }
 
     return;
@@ -136,8 +237,8 @@ Use one of: LEARNED, DECISION, FACT, PATTERN, INVESTIGATION`,
       return;
     }
 
-    // Construct stdin payload in Claude Code format
-    const stdinPayload = JSON.stringify({
+    // Payload in Claude Code format; bd comments add already passed the filter
+    await hookServer.run("memory-capture", directory, {
       tool_name: "Bash",
       tool_input: {
         command: command,
@@ -145,32 +246,6 @@ Use one of: LEARNED, DECISION, FACT, PATTERN, INVESTIGATION`,
       cwd: directory,
     });
 
-    const hookScript = resolve(
-      import.meta.dir,
-      "../hooks/memory-capture.sh"
-    );
-
-    // Use Bun.spawn() with stdin piping (security: prevents shell injection)
-    const proc = Bun.spawn(["bash", hookScript], {
-      env: {
-        ...process.env,
-        CLAUDE_PROJECT_DIR: directory,
-      },
-      stdin: "pipe",
-      stdout: "pipe",
-      stderr: "pipe",
-    });
-
-    // Write stdin payload
-    const writer = proc.stdin.getWriter();
-    await writer.write(new TextEncoder().encode(stdinPayload));
-    await writer.close();
-
-    const stderr = await new Response(proc.stderr).text();
-    if (stderr) {
-      console.error("[beads-compound] memory-capture error:", stderr);
-    }
-
     return;
   },
 } satisfies Plugin;
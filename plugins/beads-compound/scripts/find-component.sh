@@ -0,0 +1,133 @@
+#!/bin/bash
+#
+# Find agents and skills in the plugin registry
+#
+# Usage:
+#   ./find-component.sh "rails migration review"   # ranked matches
+#   ./find-component.sh --show security-sentinel    # full description + path
+#   ./find-component.sh --list                      # the whole registry
+#
+# Searches registry.tsv (one compact line per agent/skill, generated by
+# scripts/build-registry.py) through a SQLite FTS5 index with BM25 ranking,
+# using the same query builder as the knowledge store. The index lives in
+# ${TMPDIR:-/tmp} and is rebuilt only when registry.tsv changes. Without
+# sqlite3 it falls back to grep. Full descriptions are read from the source
+# markdown only for --show.
+#
+# Options:
+#   --show NAME   Print the full frontmatter description and file path
+#   --list        Print kind, name, category and tag line for every entry
+#   --top N       Number of matches to print (default: 8)
+#
+
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+PLUGIN_DIR="$(dirname "$SCRIPT_DIR")"
+REGISTRY="$PLUGIN_DIR/registry.tsv"
+
+# _kb_fts_query: free text -> safe FTS5 MATCH expression
+source "$PLUGIN_DIR/hooks/knowledge-db.sh"
+
+TOP_N=8
+MODE=search
+ARGS=()
+
+while [[ $# -gt 0 ]]; do
+  case "$1" in
+    --show) MODE=show; shift ;;
+    --list) MODE=list; shift ;;
+    --top) TOP_N="${2:-8}"; shift 2 ;;
+    -h|--help) sed -n '3,20p' "$0" | sed 's/^# \{0,1\}//'; exit 0 ;;
+    *) ARGS+=("$1"); shift ;;
+  esac
+done
+
+[[ "$TOP_N" =~ ^[0-9]+$ ]] || TOP_N=8
+QUERY="${ARGS[*]:-}"
+
+if [[ ! -f "$REGISTRY" ]]; then
+  echo "[!] Registry not found: $REGISTRY" >&2
+  echo "    Generate it with: python3 scripts/build-registry.py" >&2
+  exit 1
+fi
+
+format_rows() {
+  awk -F'\t' '{ printf "%-6s %-32s %-9s %s\n          %s\n", $1, $2, $3, $4, $5 }'
+}
+
+case "$MODE" in
+  list)
+    grep -v '^#' "$REGISTRY" | awk -F'\t' '{ printf "%-6s %-32s %-9s %s\n", $1, $2, $3, $4 }'
+    exit 0
+    ;;
+  show)
+    ROW=$(awk -F'\t' -v name="$QUERY" '$2 == name { print; exit }' "$REGISTRY")
+    if [[ -z "$ROW" ]]; then
+      echo "[!] No agent or skill named '$QUERY'" >&2
+      exit 1
+    fi
+    FILE="$PLUGIN_DIR/$(printf '%s\n' "$ROW" | cut -f5)"
+    printf '%s\n' "$ROW" | awk -F'\t' '{ printf "%s %s (%s)\n%s\n\n", $1, $2, $3, $5 }'
+    # Description from the frontmatter (plain, quoted or folded/literal block)
+    awk '
+      NR == 1 && /^---/ { fm = 1; next }
+      fm && /^---/ { exit }
+      fm && /^description:/ {
+        sub(/^description:[ \t]*/, ""); d = 1
+        if ($0 ~ /^[>|]/) next
+        gsub(/^"|"$/, ""); gsub(/\\"/, "\""); print; next
+      }
+      fm && d && /^[ \t]/ { sub(/^[ \t]+/, ""); print; next }
+      { d = 0 }
+    ' "$FILE" | fold -s -w 100
+    exit 0
+    ;;
+esac
+
+if [[ -z "$QUERY" ]]; then
+  echo "Usage: $0 QUERY | --show NAME | --list" >&2
+  exit 1
+fi
+
+FTS_QUERY=$(_kb_fts_query "$QUERY")
+[[ -n "$FTS_QUERY" ]] || exit 0
+
+if ! command -v sqlite3 &>/dev/null; then
+  # Fallback: any term, case-insensitive
+  PATTERN=$(printf '%s' "$FTS_QUERY" | sed 's/"//g; s/ OR /|/g')
+  grep -v '^#' "$REGISTRY" | grep -iE "$PATTERN" | head -n "$TOP_N" | format_rows
+  exit 0
+fi
+
+# Rebuild the index when registry.tsv changes (size:mtime signature)
+INDEX="${TMPDIR:-/tmp}/beads-compound-registry-$(printf '%s' "$REGISTRY" | cksum | cut -d' ' -f1).db"
+SIGNATURE=$(stat -c '%s:%Y' "$REGISTRY" 2>/dev/null || stat -f '%z:%m' "$REGISTRY")
+
+if [[ "$(sqlite3 "$INDEX" "SELECT value FROM meta WHERE key = 'signature';" 2>/dev/null)" != "$SIGNATURE" ]]; then
+  TMP_INDEX="$INDEX.tmp.$$"
+  ROWS="$TMP_INDEX.tsv"
+  # ASCII unit/record separators: taglines may contain quotes
+  grep -v '^#' "$REGISTRY" | tr '\t\n' '\037\036' > "$ROWS"
+  sqlite3 "$TMP_INDEX" <<SQL
+CREATE TABLE registry(kind TEXT, name TEXT, category TEXT, tagline TEXT, path TEXT);
+.mode ascii
+.import '$ROWS' registry
+CREATE VIRTUAL TABLE registry_fts USING fts5(name, tagline, category, kind, tokenize='porter unicode61');
+INSERT INTO registry_fts(rowid, name, tagline, category, kind) SELECT rowid, replace(name, '-', ' '), tagline, category, kind FROM registry;
+CREATE TABLE meta(key TEXT PRIMARY KEY, value TEXT);
+INSERT INTO meta VALUES ('signature', '$SIGNATURE');
+SQL
+  rm -f "$ROWS"
+  mv -f "$TMP_INDEX" "$INDEX"
+fi
+
+# BM25 weights: name=10, tagline=5, category=2, kind=1
+sqlite3 -separator $'\t' "$INDEX" <<SQL | format_rows
+SELECT r.kind, r.name, r.category, r.tagline, r.path
+FROM registry_fts f
+JOIN registry r ON r.rowid = f.rowid
+WHERE registry_fts MATCH '$FTS_QUERY'
+ORDER BY bm25(registry_fts, 10.0, 5.0, 2.0, 1.0)
+LIMIT $TOP_N;
+SQL
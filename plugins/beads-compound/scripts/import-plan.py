@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Import a markdown plan into beads in one pass.
+
+The plan is parsed once into a section tree, every record (epic, child
+steps, parent-child and blocking dependencies, knowledge comments) is built
+in memory, and the whole set is submitted with a single `bd import`. If the
+bulk import is unavailable it falls back to `bd create --json` per record,
+reading ids from JSON instead of scraping stdout. If a failed import already
+created any of the records, the script stops instead of creating duplicates.
+
+Usage:
+    python3 import-plan.py plan.md ["Epic Title"] [--prefix P] [--no-bulk] [--dry-run]
+
+Expected markdown format:
+    # Epic Title
+    Description here
+
+    ## Research / Background / Context      -> INVESTIGATION comment on the epic
+    ## Decisions / Choices / Approach       -> DECISION comment on the epic
+
+    ## Implementation Steps                 (or Tasks / Steps / Work)
+    ### Step 1: Database Schema             -> child bead EPIC.1
+    Details...
+
+    ### Step 2: API Endpoints               -> child bead EPIC.2
+    depends: 1
+    Details...
+
+Dependencies: without any `depends:` lines, each step blocks on the previous
+one (a linear chain). Once any step has a `depends:` line, only explicit
+annotations are used, so independent steps can run in parallel. Values are
+comma-separated step numbers (`2`, `Step 2`, `#2`), step titles, or `none`.
+`depends:` lines inside code fences are left in the step description.
+
+Options:
+    --prefix P    Issue id prefix (default: from bd config or existing issues)
+    --no-bulk     Skip `bd import` and create records one by one
+    --dry-run     Print the JSONL that would be imported and exit
+"""
+
+import argparse
+import getpass
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+FENCE = re.compile(r'^\s*(```|~~~)')
+DEPENDS = re.compile(r'^\s*[*_]*depends(?:\s+on)?[*_]*\s*:[*_]*\s*(.*)$', re.IGNORECASE)
+STEP_REF = re.compile(r'^(?:step\s*)?#?(\d+)$', re.IGNORECASE)
+
+RESEARCH = re.compile(r'^(Research|Background|Context)')
+DECISIONS = re.compile(r'^(Decisions|Choices|Approach)')
+STEPS = re.compile(r'^(Implementation|Tasks|Steps|Work)')
+
+BASE36 = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+
+class Section:
+    """A heading and the lines up to the next heading of the same or higher level."""
+
+    def __init__(self, level, title):
+        self.level = level
+        self.title = title
+        self.lines = []
+        self.children = []
+
+    def body(self):
+        """Own text plus all nested subsections, as written."""
+        out = list(self.lines)
+        for child in self.children:
+            out.append('#' * child.level + ' ' + child.title)
+            out.extend(child.body().split('\n'))
+        return '\n'.join(out).strip('\n')
+
+
+def parse_sections(text):
+    """Build the section tree in a single pass; headings in code fences are text."""
+    root = Section(0, '')
+    stack = [root]
+    in_fence = False
+
+    for line in text.split('\n'):
+        if FENCE.match(line):
+            in_fence = not in_fence
+        m = None if in_fence else HEADING.match(line)
+        if m:
+            section = Section(len(m.group(1)), m.group(2))
+            while stack[-1].level >= section.level:
+                stack.pop()
+            stack[-1].children.append(section)
+            stack.append(section)
+        else:
+            stack[-1].lines.append(line)
+
+    return root
+
+
+def walk(section):
+    for child in section.children:
+        yield child
+        yield from walk(child)
+
+
+def find_h2(root, pattern):
+    return [s for s in walk(root) if s.level == 2 and pattern.match(s.title)]
+
+
+def extract_steps(root):
+    """Steps are ### headings under the implementation section(s), in order."""
+    steps = []
+    for section in find_h2(root, STEPS):
+        for child in section.children:
+            if child.level != 3:
+                continue
+            depends = None
+            desc_lines = []
+            in_fence = False
+            for line in child.body().split('\n'):
+                if FENCE.match(line):
+                    in_fence = not in_fence
+                m = None if in_fence else DEPENDS.match(line)
+                if m and depends is None:
+                    depends = [v.strip(' *_`') for v in m.group(1).split(',') if v.strip(' *_`')]
+                else:
+                    desc_lines.append(line)
+            steps.append({
+                'title': child.title,
+                'description': '\n'.join(desc_lines).strip(),
+                'depends': depends,
+            })
+    return steps
+
+
+def resolve_dependencies(steps):
+    """Return, per step, the 0-based indexes of steps it blocks on."""
+    if all(step['depends'] is None for step in steps):
+        return [[i - 1] if i else [] for i in range(len(steps))]
+
+    by_title = {}
+    for i, step in enumerate(steps):
+        by_title.setdefault(step['title'].lower(), i)
+        # "Step 2: API Endpoints" is also reachable as "API Endpoints"
+        short = re.sub(r'^step\s*\d+\s*[:.)-]\s*', '', step['title'], flags=re.IGNORECASE).lower()
+        by_title.setdefault(short, i)
+
+    resolved = []
+    for i, step in enumerate(steps):
+        deps = []
+        for ref in step['depends'] or []:
+            if ref.lower() == 'none':
+                continue
+            m = STEP_REF.match(ref)
+            target = int(m.group(1)) - 1 if m else by_title.get(ref.lower())
+            if target is None or not 0 <= target < len(steps) or target == i:
+                sys.exit(f"Error: step {i + 1} ({step['title']}) has unknown dependency: {ref}")
+            if target not in deps:
+                deps.append(target)
+        resolved.append(deps)
+
+    check_acyclic(steps, resolved)
+    return resolved
+
+
+def check_acyclic(steps, deps):
+    state = [0] * len(steps)  # 0 = unvisited, 1 = on stack, 2 = done
+
+    def visit(i, path):
+        if state[i] == 1:
+            cycle = ' -> '.join(str(n + 1) for n in path[path.index(i):] + [i])
+            sys.exit(f"Error: dependency cycle between steps {cycle}")
+        if state[i] == 0:
+            state[i] = 1
+            for d in deps[i]:
+                visit(d, path + [i])
+            state[i] = 2
+
+    for i in range(len(steps)):
+        visit(i, [])
+
+
+def run_bd(*args, input=None):
+    return subprocess.run(['bd', *args], input=input, capture_output=True, text=True)
+
+
+def detect_prefix():
+    """Issue prefix from bd config, else from an existing issue id, else the directory name."""
+    result = run_bd('config', 'get', 'issue_prefix')
+    value = result.stdout.strip().split()[-1] if result.returncode == 0 and result.stdout.strip() else ''
+    if re.fullmatch(r'[A-Za-z0-9_]+', value or ''):
+        return value
+
+    result = run_bd('list', '--json', '--limit', '1')
+    try:
+        issues = json.loads(result.stdout)
+        if issues:
+            return issues[0]['id'].rsplit('-', 1)[0]
+    except (ValueError, KeyError, IndexError, TypeError):
+        pass
+
+    return re.sub(r'[^A-Za-z0-9_]', '', Path.cwd().name) or 'bd'
+
+
+def new_epic_id(prefix, title):
+    """Hash-based id in bd's style; retried on the rare collision."""
+    for attempt in range(8):
+        digest = hashlib.sha256(f'{title}\0{time.time_ns()}\0{attempt}'.encode()).digest()
+        n = int.from_bytes(digest[:8], 'big')
+        suffix = ''
+        for _ in range(6):
+            n, r = divmod(n, 36)
+            suffix += BASE36[r]
+        candidate = f'{prefix}-{suffix}'
+        if run_bd('show', candidate, '--json').returncode != 0:
+            return candidate
+    sys.exit("Error: could not allocate an unused epic id")
+
+
+def build_records(plan_text, epic_title, epic_id, root):
+    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    author = os.environ.get('BD_ACTOR') or getpass.getuser()
+
+    def issue(issue_id, title, description, issue_type):
+        return {
+            'id': issue_id,
+            'title': title,
+            'description': description,
+            'status': 'open',
+            'priority': 2,
+            'issue_type': issue_type,
+            'created_at': now,
+            'updated_at': now,
+            'labels': [],
+            'dependencies': [],
+        }
+
+    epic = issue(epic_id, epic_title, plan_text, 'epic')
+
+    comments = []
+    research = '\n\n'.join(s.body() for s in find_h2(root, RESEARCH)).strip()
+    if research:
+        comments.append(f'INVESTIGATION: Background and Research\n\n{research}')
+    decisions = '\n\n'.join(s.body() for s in find_h2(root, DECISIONS)).strip()
+    if decisions:
+        comments.append(f'DECISION: Architectural Decisions\n\n{decisions}')
+    if comments:
+        epic['comments'] = [{'author': author, 'text': text, 'created_at': now} for text in comments]
+
+    steps = extract_steps(root)
+    deps = resolve_dependencies(steps)
+
+    children = []
+    for i, step in enumerate(steps):
+        child_id = f'{epic_id}.{i + 1}'
+        child = issue(child_id, step['title'], step['description'], 'task')
+        child['dependencies'].append({'issue_id': child_id, 'depends_on_id': epic_id, 'type': 'parent-child',
+                                      'created_at': now, 'created_by': author})
+        for d in deps[i]:
+            child['dependencies'].append({'issue_id': child_id, 'depends_on_id': f'{epic_id}.{d + 1}',
+                                          'type': 'blocks', 'created_at': now, 'created_by': author})
+        children.append(child)
+
+    return epic, children
+
+
+def bulk_import(records):
+    with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False) as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        path = f.name
+    try:
+        result = run_bd('import', '-i', path)
+    finally:
+        os.unlink(path)
+    if result.returncode == 0:
+        return True
+
+    # A failed import may still have written some records; creating them
+    # again one by one would duplicate the epic and its children
+    created = [r['id'] for r in records if run_bd('show', r['id'], '--json').returncode == 0]
+    if created:
+        sys.exit(f"Error: bd import failed after creating {', '.join(created)}: {result.stderr.strip()}\n"
+                 f"Check them with 'bd show {created[0]}', then delete them and rerun with --no-bulk, "
+                 f"or finish the import by hand.")
+    print(f"  bd import failed, creating records individually: {result.stderr.strip()}", file=sys.stderr)
+    return False
+
+
+def create_one_by_one(epic, children):
+    """Fallback: bd create per record; ids come from --json, not stdout scraping."""
+
+    def create(*args):
+        result = run_bd('create', *args, '--json')
+        try:
+            data = json.loads(result.stdout)
+            return (data[0] if isinstance(data, list) else data)['id']
+        except (ValueError, KeyError, IndexError, TypeError):
+            sys.exit(f"Error: bd create failed: {result.stderr.strip() or result.stdout.strip()}")
+
+    epic_id = create(epic['title'], '-d', epic['description'], '--type', 'epic')
+    for comment in epic.get('comments', []):
+        run_bd('comments', 'add', epic_id, comment['text'])
+
+    ids = {epic['id']: epic_id}
+    for child in children:
+        args = [child['title'], '-d', child['description'], '--parent', epic_id]
+        blockers = [ids[d['depends_on_id']] for d in child['dependencies'] if d['type'] == 'blocks']
+        if blockers:
+            args += ['--deps', ','.join(blockers)]
+        ids[child['id']] = create(*args)
+
+    return ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('plan', help='Markdown plan file')
+    parser.add_argument('title', nargs='?', help='Epic title (default: first # heading)')
+    parser.add_argument('--prefix', help='Issue id prefix')
+    parser.add_argument('--no-bulk', action='store_true', help='Create records one by one instead of bd import')
+    parser.add_argument('--dry-run', action='store_true', help='Print the JSONL records and exit')
+    args = parser.parse_args()
+
+    plan_path = Path(args.plan)
+    if not plan_path.is_file():
+        sys.exit(f"Error: File not found: {args.plan}")
+
+    plan_text = plan_path.read_text()
+    root = parse_sections(plan_text)
+
+    title = args.title or next((s.title for s in walk(root) if s.level == 1), '')
+    if not title:
+        sys.exit("Error: Epic title required (no # heading found in the plan)")
+
+    prefix = args.prefix or ('bd' if args.dry_run else detect_prefix())
+    epic_id = f'{prefix}-plan' if args.dry_run else new_epic_id(prefix, title)
+    epic, children = build_records(plan_text, title, epic_id, root)
+
+    if args.dry_run:
+        for record in [epic] + children:
+            print(json.dumps(record, ensure_ascii=False))
+        return
+
+    print(f"Importing plan from: {args.plan}")
+    print(f"Epic title: {title}")
+    print("")
+
+    if not args.no_bulk and bulk_import([epic] + children):
+        ids = {record['id']: record['id'] for record in [epic] + children}
+    else:
+        ids = create_one_by_one(epic, children)
+
+    epic_id = ids[epic['id']]
+    print(f"Created epic: {epic_id}")
+    for n in ('INVESTIGATION', 'DECISION'):
+        if any(c['text'].startswith(n) for c in epic.get('comments', [])):
+            print(f"  Added {n} comment")
+    for child in children:
+        blockers = [ids[d['depends_on_id']] for d in child['dependencies'] if d['type'] == 'blocks']
+        after = f" (after {', '.join(blockers)})" if blockers else ''
+        print(f"  Created: {ids[child['id']]} - {child['title']}{after}")
+
+    print("")
+    print("Import complete!")
+    print("")
+    print(f"Epic: {epic_id}")
+    print(f"View: bd show {epic_id}")
+    print(f"List children: bd list --parent {epic_id}")
+    print("")
+    print("Next steps:")
+    print(f"  1. Review the created beads: bd show {epic_id}")
+    print(f"  2. Start work: /beads-work {epic_id}.1")
+    print(f"  3. Or refine with research: /beads-plan {epic_id}")
+
+
+if __name__ == '__main__':
+    main()
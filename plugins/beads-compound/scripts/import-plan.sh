@@ -24,9 +24,18 @@
 #   - Child beads for each step (### headers under Implementation Steps)
 #   - Knowledge comments for research/background sections
 #
+# import-plan.py (next to this script) does the same in one pass with a bulk
+# `bd import` and supports `depends:` annotations; it is used whenever
+# python3 is available. The shell implementation below is the fallback.
+#
 
 set -euo pipefail
 
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+if command -v python3 &>/dev/null && [[ -f "$SCRIPT_DIR/import-plan.py" ]] && [[ $# -ge 1 ]]; then
+  exec python3 "$SCRIPT_DIR/import-plan.py" "$@"
+fi
+
 PLAN_FILE="${1:-}"
 EPIC_TITLE="${2:-}"
 
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Generate, edit or compose many images concurrently using Gemini API.
+
+Usage:
+    python batch_images.py manifest.jsonl [--jobs N] [--rate R] [--retries N] [--force] [--no-cache]
+    python batch_images.py --serve [options] < jobs.jsonl
+
+The manifest has one JSON object per line:
+
+    {"prompt": "A red fox in snow", "output": "fox.png", "aspect_ratio": "16:9"}
+    {"prompt": "Add a scarf", "image": "fox.png", "output": "fox-scarf.png"}
+    {"prompt": "Put both on a poster", "images": ["a.png", "b.png"], "output": "poster.png"}
+
+A job with "image" is an edit, one with "images" is a composition, and any
+other job generates from the prompt alone. Optional keys: model,
+aspect_ratio, image_size, google_search. Relative paths are resolved against
+the manifest's directory. Jobs run concurrently, so an edit or composition
+should not use an image that another job in the same batch produces.
+
+Jobs whose output already exists are skipped, so an interrupted batch picks
+up where it stopped. Requests are rate limited with a token bucket and
+retried with jittered exponential backoff on rate-limit and server errors.
+
+With --serve, jobs are read from stdin as they arrive and one JSON result
+line per job is written to stdout, so an agent workflow can keep a single
+process (and its pooled HTTPS connections) open instead of starting a
+script per image.
+
+Examples:
+    python batch_images.py docs-images.jsonl
+    python batch_images.py docs-images.jsonl --jobs 8 --rate 2 --model gemini-3-pro-image-preview
+
+Environment:
+    GEMINI_API_KEY - Required API key
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Rate limits, timeouts and transient server failures
+RETRYABLE_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` requests per second, bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def is_retryable(error: Exception) -> bool:
+    """True for rate-limit/server API errors and network failures."""
+    if getattr(error, "code", None) in RETRYABLE_CODES:
+        return True
+    if httpx is not None and isinstance(error, httpx.TransportError):
+        return True
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Full-jitter exponential backoff for the given retry attempt (0-based)."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def parse_job(line: str, base: Path, number: int) -> dict:
+    """Parse one manifest line, resolving relative paths against base."""
+    try:
+        job = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON: {e}") from None
+    if not isinstance(job, dict) or not job.get("prompt") or not job.get("output"):
+        raise ValueError("each job needs 'prompt' and 'output'")
+    job["output"] = str(base / job["output"])
+    if "image" in job:
+        job["image"] = str(base / job["image"])
+    if "images" in job:
+        job["images"] = [str(base / p) for p in job["images"]]
+    job.setdefault("id", number)
+    return job
+
+
+def load_manifest(path: str | Path) -> list[dict]:
+    """Read a JSONL manifest, resolving relative paths against its directory."""
+    path = Path(path)
+    jobs = []
+    for number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            jobs.append(parse_job(line, path.parent, number))
+        except ValueError as e:
+            raise ValueError(f"{path}:{number}: {e}") from None
+    return jobs
+
+
+def run_job(job: dict, generator, output: Path) -> str | None:
+    """Dispatch one job to the generator, writing the image to `output`."""
+    options = {
+        "model": job.get("model"),
+        "aspect_ratio": job.get("aspect_ratio"),
+        "image_size": job.get("image_size"),
+    }
+    if "images" in job:
+        if len(job["images"]) > 14:
+            raise ValueError("Maximum 14 reference images supported")
+        _, text = generator.compose(job["prompt"], job["images"], output, **options)
+    elif "image" in job:
+        _, text = generator.edit(job["image"], job["prompt"], output, **options)
+    else:
+        _, text = generator.generate(
+            job["prompt"], output, google_search=bool(job.get("google_search")), **options
+        )
+    return text
+
+
+def make_worker(generator, *, rate=1.0, burst=1, retries=4, force=False, on_result=None):
+    """Return a function that runs one job and returns its result dict.
+
+    The returned worker is thread-safe; all workers from one call share a
+    token bucket.
+    """
+    bucket = TokenBucket(rate, burst)
+
+    def attempt_job(job, output, result):
+        if not force and output.exists() and output.stat().st_size > 0:
+            result["status"] = "skipped"
+            return
+        output.parent.mkdir(parents=True, exist_ok=True)
+        # Save under a temp name so an interrupted job never looks complete
+        partial = output.with_name(f".{output.stem}.partial{output.suffix}")
+        for attempt in range(retries + 1):
+            bucket.acquire()
+            result["attempts"] = attempt + 1
+            try:
+                result["text"] = run_job(job, generator, partial)
+                if not partial.exists():
+                    raise RuntimeError("No image was generated.")
+                os.replace(partial, output)
+                result["status"] = "done"
+                return
+            except Exception as e:
+                if attempt < retries and is_retryable(e):
+                    time.sleep(backoff_delay(attempt))
+                    continue
+                partial.unlink(missing_ok=True)
+                raise
+
+    def work(job):
+        output = Path(job["output"])
+        result = {"id": job.get("id"), "output": str(output), "attempts": 0}
+        # Every job ends with a result, even when setup (mkdir, stat) fails,
+        # so a batch keeps going and a --serve client always gets an answer
+        try:
+            attempt_job(job, output, result)
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = f"{type(e).__name__}: {e}"
+        if on_result:
+            on_result(result)
+        return result
+
+    return work
+
+
+def run_batch(
+    jobs: list[dict],
+    generator,
+    *,
+    concurrency: int = 4,
+    rate: float = 1.0,
+    burst: int = 1,
+    retries: int = 4,
+    force: bool = False,
+    on_result=None,
+) -> list[dict]:
+    """Run jobs with bounded concurrency, rate limiting, retries and resume.
+
+    Args:
+        jobs: Job dicts with prompt, output and optional image/images/options
+        generator: Object with generate/edit/compose methods like
+            GeminiImageGenerator (any stand-in with the same signatures works)
+        concurrency: Requests in flight at once
+        rate: Requests started per second (0 disables the limiter)
+        burst: Requests that may start back to back before `rate` applies
+        retries: Retries per job on retryable errors
+        force: Regenerate outputs that already exist
+        on_result: Called with each result dict as jobs finish
+
+    Returns:
+        One result dict per job, in input order, with status
+        "done", "skipped" or "failed"
+    """
+    work = make_worker(generator, rate=rate, burst=burst, retries=retries, force=force, on_result=on_result)
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        return list(pool.map(work, jobs))
+
+
+def serve(generator, stream_in=sys.stdin, stream_out=sys.stdout, *, concurrency: int = 4, **options) -> int:
+    """Run jobs read as JSONL from stream_in until EOF, one process for all.
+
+    Each job starts as soon as its line arrives; one JSON result line is
+    written to stream_out per job as it finishes (not necessarily in input
+    order, so match results by "id"). Relative paths are resolved against
+    the current directory. Returns the number of failed jobs.
+    """
+    lock = threading.Lock()
+    failed = [0]
+
+    def emit(result):
+        with lock:
+            if result["status"] == "failed":
+                failed[0] += 1
+            stream_out.write(json.dumps(result) + "\n")
+            stream_out.flush()
+
+    work = make_worker(generator, on_result=emit, **options)
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        for number, line in enumerate(stream_in, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                job = parse_job(line, Path("."), number)
+            except ValueError as e:
+                emit({"id": number, "status": "failed", "error": str(e)})
+                continue
+            pool.submit(work, job)
+    return failed[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run a batch of Gemini image jobs from a JSONL manifest",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("manifest", nargs="?", help="JSONL manifest of jobs")
+    parser.add_argument("--serve", action="store_true", help="Read jobs from stdin and write JSON results to stdout")
+    parser.add_argument("--jobs", "-j", type=int, default=4, help="Concurrent requests (default: 4)")
+    parser.add_argument("--rate", type=float, default=1.0, help="Requests per second (default: 1, 0 = unlimited)")
+    parser.add_argument("--burst", type=int, default=1, help="Requests allowed back to back (default: 1)")
+    parser.add_argument("--retries", type=int, default=4, help="Retries on retryable errors (default: 4)")
+    parser.add_argument("--force", action="store_true", help="Regenerate outputs that already exist")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the API instead of reusing cached results")
+    parser.add_argument(
+        "--model", "-m",
+        choices=["gemini-2.5-flash-image", "gemini-3-pro-image-preview"],
+        help="Default model for jobs that do not set one"
+    )
+
+    args = parser.parse_args()
+
+    if bool(args.serve) == bool(args.manifest):
+        parser.error("give a manifest file or --serve")
+
+    jobs = []
+    if args.manifest:
+        try:
+            jobs = load_manifest(args.manifest)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    from gemini_images import GeminiImageGenerator
+
+    try:
+        options = {"cache": not args.no_cache}
+        if args.model:
+            options["model"] = args.model
+        generator = GeminiImageGenerator(**options)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.serve:
+        failed = serve(
+            generator,
+            concurrency=args.jobs, rate=args.rate, burst=args.burst,
+            retries=args.retries, force=args.force,
+        )
+        sys.exit(1 if failed else 0)
+
+    lock = threading.Lock()
+    finished = [0]
+
+    def report(result):
+        with lock:
+            finished[0] += 1
+            line = f"[{finished[0]}/{len(jobs)}] {result['status']:<7} {result['output']}"
+            if result["status"] == "failed":
+                line += f" ({result['error']})"
+            print(line, flush=True)
+
+    results = run_batch(
+        jobs, generator,
+        concurrency=args.jobs, rate=args.rate, burst=args.burst,
+        retries=args.retries, force=args.force, on_result=report,
+    )
+
+    counts = {status: sum(1 for r in results if r["status"] == status) for status in ("done", "skipped", "failed")}
+    print(f"\n{counts['done']} generated, {counts['skipped']} skipped, {counts['failed']} failed")
+    sys.exit(1 if counts["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,11 +19,14 @@ Environment:
 import argparse
 import os
 import sys
+from pathlib import Path
 
-from PIL import Image
-from google import genai
 from google.genai import types
 
+from gemini_client import get_client
+from preprocess import format_report
+from response_cache import ResponseCache, generate_content
+
 
 def compose_images(
     instruction: str,
@@ -32,6 +35,8 @@ def compose_images(
     model: str = "gemini-3-pro-image-preview",
     aspect_ratio: str | None = None,
     image_size: str | None = None,
+    use_cache: bool = True,
+    preprocess: bool = True,
 ) -> str | None:
     """Compose multiple images based on instructions.
     
@@ -42,13 +47,13 @@ def compose_images(
         model: Gemini model to use (pro recommended)
         aspect_ratio: Output aspect ratio
         image_size: Output resolution
+        use_cache: Reuse the stored result of an identical earlier request
+        preprocess: Downsample and re-encode inputs to image_size before upload
     
     Returns:
         Any text response from the model, or None
     """
-    api_key = os.environ.get("GEMINI_API_KEY")
-    if not api_key:
-        raise EnvironmentError("GEMINI_API_KEY environment variable not set")
+    client = get_client()
     
     if len(image_paths) > 14:
         raise ValueError("Maximum 14 reference images supported")
@@ -61,10 +66,8 @@ def compose_images(
         if not os.path.exists(path):
             raise FileNotFoundError(f"Image not found: {path}")
     
-    client = genai.Client(api_key=api_key)
-    
-    # Load images
-    images = [Image.open(path) for path in image_paths]
+    # Hashed for the cache, opened only if the API is called
+    images = [Path(path) for path in image_paths]
     
     # Build contents: instruction first, then images
     contents = [instruction] + images
@@ -83,26 +86,20 @@ def compose_images(
     
     config = types.GenerateContentConfig(**config_kwargs)
     
-    response = client.models.generate_content(
-        model=model,
-        contents=contents,
-        config=config,
+    cache = ResponseCache() if use_cache else None
+    upload = {}
+    image_bytes, text_response = generate_content(
+        client, model, contents, config, cache=cache, preprocess=preprocess, report=upload
     )
+    if upload.get("images"):
+        print(format_report(upload))
     
-    text_response = None
-    image_saved = False
-    
-    for part in response.parts:
-        if part.text is not None:
-            text_response = part.text
-        elif part.inline_data is not None:
-            image = part.as_image()
-            image.save(output_path)
-            image_saved = True
-    
-    if not image_saved:
+    if image_bytes is None:
         raise RuntimeError("No image was generated.")
     
+    with open(output_path, "wb") as f:
+        f.write(image_bytes)
+    
     return text_response
 
 
@@ -131,6 +128,16 @@ def main():
         choices=["1K", "2K", "4K"],
         help="Output resolution"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the API instead of reusing an identical earlier result"
+    )
+    parser.add_argument(
+        "--no-preprocess",
+        action="store_true",
+        help="Upload input images as-is instead of resizing them to --size"
+    )
     
     args = parser.parse_args()
     
@@ -142,6 +149,8 @@ def main():
             model=args.model,
             aspect_ratio=args.aspect,
             image_size=args.size,
+            use_cache=not args.no_cache,
+            preprocess=not args.no_preprocess,
         )
         
         print(f"Composed image saved to: {args.output}")
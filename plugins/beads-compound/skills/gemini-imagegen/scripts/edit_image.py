@@ -17,11 +17,14 @@ Environment:
 import argparse
 import os
 import sys
+from pathlib import Path
 
-from PIL import Image
-from google import genai
 from google.genai import types
 
+from gemini_client import get_client
+from preprocess import format_report
+from response_cache import ResponseCache, generate_content
+
 
 def edit_image(
     input_path: str,
@@ -30,6 +33,8 @@ def edit_image(
     model: str = "gemini-2.5-flash-image",
     aspect_ratio: str | None = None,
     image_size: str | None = None,
+    use_cache: bool = True,
+    preprocess: bool = True,
 ) -> str | None:
     """Edit an existing image based on text instructions.
     
@@ -40,21 +45,19 @@ def edit_image(
         model: Gemini model to use
         aspect_ratio: Output aspect ratio
         image_size: Output resolution
+        use_cache: Reuse the stored result of an identical earlier request
+        preprocess: Downsample and re-encode inputs to image_size before upload
     
     Returns:
         Any text response from the model, or None
     """
-    api_key = os.environ.get("GEMINI_API_KEY")
-    if not api_key:
-        raise EnvironmentError("GEMINI_API_KEY environment variable not set")
+    client = get_client()
     
     if not os.path.exists(input_path):
         raise FileNotFoundError(f"Input image not found: {input_path}")
     
-    client = genai.Client(api_key=api_key)
-    
-    # Load input image
-    input_image = Image.open(input_path)
+    # Hashed for the cache, opened only if the API is called
+    input_image = Path(input_path)
     
     # Build config
     config_kwargs = {"response_modalities": ["TEXT", "IMAGE"]}
@@ -70,26 +73,20 @@ def edit_image(
     
     config = types.GenerateContentConfig(**config_kwargs)
     
-    response = client.models.generate_content(
-        model=model,
-        contents=[instruction, input_image],
-        config=config,
+    cache = ResponseCache() if use_cache else None
+    upload = {}
+    image_bytes, text_response = generate_content(
+        client, model, [instruction, input_image], config, cache=cache, preprocess=preprocess, report=upload
     )
+    if upload.get("images"):
+        print(format_report(upload))
     
-    text_response = None
-    image_saved = False
-    
-    for part in response.parts:
-        if part.text is not None:
-            text_response = part.text
-        elif part.inline_data is not None:
-            image = part.as_image()
-            image.save(output_path)
-            image_saved = True
-    
-    if not image_saved:
+    if image_bytes is None:
         raise RuntimeError("No image was generated. Check your instruction and try again.")
     
+    with open(output_path, "wb") as f:
+        f.write(image_bytes)
+    
     return text_response
 
 
@@ -118,6 +115,16 @@ def main():
         choices=["1K", "2K", "4K"],
         help="Output resolution"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the API instead of reusing an identical earlier result"
+    )
+    parser.add_argument(
+        "--no-preprocess",
+        action="store_true",
+        help="Upload input images as-is instead of resizing them to --size"
+    )
     
     args = parser.parse_args()
     
@@ -129,6 +136,8 @@ def main():
             model=args.model,
             aspect_ratio=args.aspect,
             image_size=args.size,
+            use_cache=not args.no_cache,
+            preprocess=not args.no_preprocess,
         )
         
         print(f"Edited image saved to: {args.output}")
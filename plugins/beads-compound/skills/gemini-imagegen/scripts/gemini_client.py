@@ -0,0 +1,90 @@
+"""
+Shared Gemini client for the gemini-imagegen scripts.
+
+Building a genai.Client sets up a new HTTP connection pool, so every request
+from a fresh client pays for a new TCP and TLS handshake. get_client() keeps
+one client per process (per API key and settings) and reuses it across calls
+and threads, with explicit timeouts and keep-alive limits.
+
+Usage:
+    from gemini_client import get_client
+
+    client = get_client()
+    client.models.generate_content(...)
+
+Environment:
+    GEMINI_API_KEY          - Required API key
+    GEMINI_BASE_URL         - API endpoint override, e.g. a local stand-in server
+    GEMINI_TIMEOUT          - Request timeout in seconds (default: 120)
+    GEMINI_MAX_CONNECTIONS  - Connection pool size (default: 10)
+    GEMINI_KEEPALIVE        - Seconds an idle connection is kept open (default: 60)
+"""
+
+import os
+import threading
+
+import httpx
+from google import genai
+from google.genai import types
+
+DEFAULT_TIMEOUT = 120.0
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_KEEPALIVE = 60.0
+
+_clients: dict[tuple, genai.Client] = {}
+_lock = threading.Lock()
+
+
+def _setting(value, env: str, default: float) -> float:
+    if value is not None:
+        return value
+    return float(os.environ.get(env) or default)
+
+
+def get_client(
+    api_key: str | None = None,
+    *,
+    base_url: str | None = None,
+    timeout: float | None = None,
+    max_connections: int | None = None,
+    keepalive: float | None = None,
+) -> genai.Client:
+    """Return the process-wide client for these settings, creating it once.
+
+    Args:
+        api_key: Gemini API key (defaults to GEMINI_API_KEY env var)
+        base_url: API endpoint (defaults to GEMINI_BASE_URL, then the SDK's)
+        timeout: Request timeout in seconds
+        max_connections: Maximum pooled connections
+        keepalive: Seconds before an idle pooled connection is closed
+
+    Returns:
+        A genai.Client that is safe to share between threads
+    """
+    api_key = api_key or os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        raise EnvironmentError("GEMINI_API_KEY environment variable not set")
+
+    base_url = base_url or os.environ.get("GEMINI_BASE_URL") or None
+    timeout = _setting(timeout, "GEMINI_TIMEOUT", DEFAULT_TIMEOUT)
+    max_connections = int(_setting(max_connections, "GEMINI_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS))
+    keepalive = _setting(keepalive, "GEMINI_KEEPALIVE", DEFAULT_KEEPALIVE)
+
+    key = (api_key, base_url, timeout, max_connections, keepalive)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            http_options = types.HttpOptions(
+                base_url=base_url,
+                timeout=int(timeout * 1000),  # milliseconds
+                client_args={
+                    "limits": httpx.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=max_connections,
+                        keepalive_expiry=keepalive,
+                    ),
+                },
+            )
+            client = genai.Client(api_key=api_key, http_options=http_options)
+            _clients[key] = client
+        return client
@@ -9,6 +9,7 @@ Usage:
     gen = GeminiImageGenerator()
     gen.generate("A sunset over mountains", "sunset.png")
     gen.edit("input.png", "Add clouds", "output.png")
+    gen.batch([{"prompt": "A red fox", "output": "fox.png"}, ...])
 
 Environment:
     GEMINI_API_KEY - Required API key
@@ -22,6 +23,9 @@ from PIL import Image
 from google import genai
 from google.genai import types
 
+from gemini_client import get_client
+from response_cache import ResponseCache, generate_content
+
 
 AspectRatio = Literal["1:1", "2:3", "3:2", "3:4", "4:3", "4:5", "5:4", "9:16", "16:9", "21:9"]
 ImageSize = Literal["1K", "2K", "4K"]
@@ -34,19 +38,46 @@ class GeminiImageGenerator:
     FLASH = "gemini-2.5-flash-image"
     PRO = "gemini-3-pro-image-preview"
     
-    def __init__(self, api_key: str | None = None, model: Model = FLASH):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: Model = FLASH,
+        client: genai.Client | None = None,
+        cache: ResponseCache | bool = True,
+        preprocess: bool = True,
+    ):
         """Initialize the generator.
         
         Args:
             api_key: Gemini API key (defaults to GEMINI_API_KEY env var)
             model: Default model to use
+            client: Pre-built client (e.g. a local stand-in for tests);
+                skips the API key check
+            cache: ResponseCache to use, True for the default cache, or
+                False to always call the API
+            preprocess: Downsample and re-encode input images to the
+                requested image_size before upload
         """
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY")
-        if not self.api_key:
+        if client is None and not self.api_key:
             raise EnvironmentError("GEMINI_API_KEY not set")
         
-        self.client = genai.Client(api_key=self.api_key)
+        # One pooled client per process, shared with the CLI scripts
+        self.client = client or get_client(self.api_key)
         self.model = model
+        if cache is True:
+            cache = ResponseCache()
+        self.cache = cache or None
+        self.preprocess = preprocess
+    
+    def _run(self, model: str, contents: list, config, output: Path) -> str | None:
+        """Run a request (or answer it from the cache) and save the image."""
+        data, text = generate_content(
+            self.client, model, contents, config, cache=self.cache, preprocess=self.preprocess
+        )
+        if data is not None:
+            output.write_bytes(data)
+        return text
     
     def _build_config(
         self,
@@ -96,20 +127,7 @@ class GeminiImageGenerator:
         """
         output = Path(output)
         config = self._build_config(aspect_ratio, image_size, google_search)
-        
-        response = self.client.models.generate_content(
-            model=model or self.model,
-            contents=[prompt],
-            config=config,
-        )
-        
-        text = None
-        for part in response.parts:
-            if part.text:
-                text = part.text
-            elif part.inline_data:
-                part.as_image().save(output)
-        
+        text = self._run(model or self.model, [prompt], config, output)
         return output, text
     
     def edit(
@@ -137,24 +155,12 @@ class GeminiImageGenerator:
         """
         output = Path(output)
         
-        if isinstance(input_image, (str, Path)):
-            input_image = Image.open(input_image)
+        # Paths are hashed for the cache and only opened on a miss
+        if isinstance(input_image, str):
+            input_image = Path(input_image)
         
         config = self._build_config(aspect_ratio, image_size)
-        
-        response = self.client.models.generate_content(
-            model=model or self.model,
-            contents=[instruction, input_image],
-            config=config,
-        )
-        
-        text = None
-        for part in response.parts:
-            if part.text:
-                text = part.text
-            elif part.inline_data:
-                part.as_image().save(output)
-        
+        text = self._run(model or self.model, [instruction, input_image], config, output)
         return output, text
     
     def compose(
@@ -182,31 +188,30 @@ class GeminiImageGenerator:
         """
         output = Path(output)
         
-        # Load images
-        loaded = []
-        for img in images:
-            if isinstance(img, (str, Path)):
-                loaded.append(Image.open(img))
-            else:
-                loaded.append(img)
+        # Paths are hashed for the cache and only opened on a miss
+        loaded = [Path(img) if isinstance(img, str) else img for img in images]
         
         config = self._build_config(aspect_ratio, image_size)
         contents = [instruction] + loaded
         
-        response = self.client.models.generate_content(
-            model=model or self.PRO,  # Pro recommended for composition
-            contents=contents,
-            config=config,
-        )
+        # Pro recommended for composition
+        text = self._run(model or self.PRO, contents, config, output)
+        return output, text
+    
+    def batch(self, jobs: list[dict], **options) -> list[dict]:
+        """Run many generate/edit/compose jobs concurrently.
         
-        text = None
-        for part in response.parts:
-            if part.text:
-                text = part.text
-            elif part.inline_data:
-                part.as_image().save(output)
+        Args:
+            jobs: Job dicts as in a batch manifest (prompt, output, ...)
+            **options: Passed to batch_images.run_batch (concurrency,
+                rate, retries, force, ...)
         
-        return output, text
+        Returns:
+            One result dict per job, in input order
+        """
+        from batch_images import run_batch
+        
+        return run_batch(jobs, self, **options)
     
     def chat(self) -> "ImageChat":
         """Start an interactive chat session for iterative refinement."""
@@ -15,12 +15,13 @@ Environment:
 """
 
 import argparse
-import os
 import sys
 
-from google import genai
 from google.genai import types
 
+from gemini_client import get_client
+from response_cache import ResponseCache, generate_content
+
 
 def generate_image(
     prompt: str,
@@ -28,6 +29,7 @@ def generate_image(
     model: str = "gemini-2.5-flash-image",
     aspect_ratio: str | None = None,
     image_size: str | None = None,
+    use_cache: bool = True,
 ) -> str | None:
     """Generate an image from a text prompt.
     
@@ -37,15 +39,12 @@ def generate_image(
         model: Gemini model to use
         aspect_ratio: Aspect ratio (1:1, 16:9, 9:16, etc.)
         image_size: Resolution (1K, 2K, 4K - 4K only for pro model)
+        use_cache: Reuse the stored result of an identical earlier request
     
     Returns:
         Any text response from the model, or None
     """
-    api_key = os.environ.get("GEMINI_API_KEY")
-    if not api_key:
-        raise EnvironmentError("GEMINI_API_KEY environment variable not set")
-    
-    client = genai.Client(api_key=api_key)
+    client = get_client()
     
     # Build config
     config_kwargs = {"response_modalities": ["TEXT", "IMAGE"]}
@@ -61,26 +60,15 @@ def generate_image(
     
     config = types.GenerateContentConfig(**config_kwargs)
     
-    response = client.models.generate_content(
-        model=model,
-        contents=[prompt],
-        config=config,
-    )
-    
-    text_response = None
-    image_saved = False
+    cache = ResponseCache() if use_cache else None
+    image_bytes, text_response = generate_content(client, model, [prompt], config, cache=cache)
     
-    for part in response.parts:
-        if part.text is not None:
-            text_response = part.text
-        elif part.inline_data is not None:
-            image = part.as_image()
-            image.save(output_path)
-            image_saved = True
-    
-    if not image_saved:
+    if image_bytes is None:
         raise RuntimeError("No image was generated. Check your prompt and try again.")
     
+    with open(output_path, "wb") as f:
+        f.write(image_bytes)
+    
     return text_response
 
 
@@ -108,6 +96,11 @@ def main():
         choices=["1K", "2K", "4K"],
         help="Image resolution (4K only available with pro model)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the API instead of reusing an identical earlier result"
+    )
     
     args = parser.parse_args()
     
@@ -118,6 +111,7 @@ def main():
             model=args.model,
             aspect_ratio=args.aspect,
             image_size=args.size,
+            use_cache=not args.no_cache,
         )
         
         print(f"Image saved to: {args.output}")
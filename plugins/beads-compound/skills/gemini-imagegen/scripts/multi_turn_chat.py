@@ -4,6 +4,7 @@ Interactive multi-turn image generation and refinement using Gemini API.
 
 Usage:
     python multi_turn_chat.py [--model MODEL] [--output-dir DIR]
+                              [--history-turns N] [--old-images MODE] [--summarize]
 
 This starts an interactive session where you can:
 - Generate images from prompts
@@ -17,20 +18,66 @@ Commands:
     /clear            - Start fresh conversation
     /quit             - Exit
 
+History:
+    Every message resends the conversation so far. To keep request size and
+    latency steady in long sessions, only the last --history-turns exchanges
+    are kept (default 6, 0 = all), images other than the latest are replaced
+    by thumbnails (--old-images thumbnail|drop|keep), and --summarize keeps
+    a short note of the prompts from dropped turns. The request size is
+    printed after every turn.
+
 Environment:
     GEMINI_API_KEY - Required API key
 """
 
 import argparse
-import os
+import io
 import sys
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
 from PIL import Image
-from google import genai
 from google.genai import types
 
+from gemini_client import get_client
+
+
+@dataclass
+class HistoryPolicy:
+    """How much of the conversation is resent with each message.
+    
+    Attributes:
+        max_turns: Exchanges (user message + reply) kept, None for all
+        old_images: "keep", "thumbnail" or "drop" images other than the latest
+        thumbnail_size: Long side in pixels of replacement thumbnails
+        summarize: Keep the prompts of dropped exchanges as a short text note
+    """
+    
+    max_turns: int | None = None
+    old_images: str = "keep"
+    thumbnail_size: int = 256
+    summarize: bool = False
+    
+    SUMMARY_CHARS = 1500
+
+
+def content_bytes(contents) -> int:
+    """Approximate request size of a list of Content/Part objects."""
+    total = 0
+    for item in contents:
+        for part in getattr(item, "parts", None) or [item]:
+            if getattr(part, "text", None):
+                total += len(part.text.encode())
+            inline = getattr(part, "inline_data", None)
+            if inline is not None and inline.data:
+                total += len(inline.data)
+    return total
+
+
+def format_bytes(n: int) -> str:
+    return f"{n / 1024 / 1024:.1f} MB" if n >= 1024 * 1024 else f"{n / 1024:.0f} KB"
+
 
 class ImageChat:
     """Interactive chat session for image generation and refinement."""
@@ -39,44 +86,129 @@ class ImageChat:
         self,
         model: str = "gemini-2.5-flash-image",
         output_dir: str = ".",
+        history: HistoryPolicy | None = None,
     ):
-        api_key = os.environ.get("GEMINI_API_KEY")
-        if not api_key:
-            raise EnvironmentError("GEMINI_API_KEY environment variable not set")
-        
-        self.client = genai.Client(api_key=api_key)
+        self.client = get_client()
         self.model = model
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        self.history = history or HistoryPolicy()
+        self.config = types.GenerateContentConfig(
+            response_modalities=["TEXT", "IMAGE"]
+        )
+        
         self.chat = None
         self.current_image = None
         self.image_count = 0
+        # Request size of each turn sent, in bytes
+        self.payload_sizes: list[int] = []
+        self._summary: list[str] = []
         
         self._init_chat()
     
     def _init_chat(self):
         """Initialize or reset the chat session."""
-        config = types.GenerateContentConfig(
-            response_modalities=["TEXT", "IMAGE"]
-        )
         self.chat = self.client.chats.create(
             model=self.model,
-            config=config,
+            config=self.config,
         )
         self.current_image = None
+        self._summary = []
+    
+    def has_history(self) -> bool:
+        return bool(self.chat.get_history(curated=True))
+    
+    def _is_thumbnail(self, part: types.Part) -> bool:
+        """True if an image part is already thumbnail-sized (reads the header only)."""
+        with Image.open(io.BytesIO(part.inline_data.data)) as img:
+            return max(img.size) <= self.history.thumbnail_size
+    
+    def _thumbnail(self, part: types.Part) -> types.Part:
+        """JPEG thumbnail of an image part, keeping its thought signature."""
+        with Image.open(io.BytesIO(part.inline_data.data)) as img:
+            img.thumbnail((self.history.thumbnail_size, self.history.thumbnail_size))
+            buffer = io.BytesIO()
+            img.convert("RGB").save(buffer, "JPEG", quality=80)
+        return types.Part(
+            inline_data=types.Blob(data=buffer.getvalue(), mime_type="image/jpeg"),
+            thought_signature=part.thought_signature,
+        )
+    
+    def _bounded_history(self, history: list[types.Content]) -> list[types.Content] | None:
+        """Apply the history policy. Returns None when nothing changes."""
+        policy = self.history
+        changed = False
+        
+        # Split into exchanges, each starting at a user message
+        turns = []
+        for content in history:
+            if content.role == "user" or not turns:
+                turns.append([])
+            turns[-1].append(content)
+        if self._summary:
+            # The first exchange is the summary note from an earlier trim
+            turns = turns[1:]
+        
+        if policy.max_turns and len(turns) > policy.max_turns:
+            dropped, turns = turns[:-policy.max_turns], turns[-policy.max_turns:]
+            changed = True
+            if policy.summarize:
+                for turn in dropped:
+                    self._summary += [p.text for p in turn[0].parts or [] if p.text and not p.thought]
+        
+        # Only the most recent image is current; earlier ones are superseded
+        if policy.old_images != "keep":
+            latest = None
+            for content in (c for turn in turns for c in turn):
+                for part in content.parts or []:
+                    if part.inline_data is not None:
+                        latest = part
+            for content in (c for turn in turns for c in turn):
+                parts = []
+                for part in content.parts or []:
+                    if part.inline_data is None or part is latest or self._is_thumbnail(part):
+                        parts.append(part)
+                    elif policy.old_images == "thumbnail":
+                        parts.append(self._thumbnail(part))
+                        changed = True
+                    else:
+                        parts.append(types.Part(text="[earlier image omitted]", thought_signature=part.thought_signature))
+                        changed = True
+                content.parts = parts
+        
+        if not changed:
+            return None
+        
+        result = [c for turn in turns for c in turn]
+        if self._summary:
+            note = "Earlier requests in this session: " + " | ".join(self._summary)
+            if len(note) > policy.SUMMARY_CHARS:
+                note = note[:policy.SUMMARY_CHARS - 3] + "..."
+            result = [
+                types.Content(role="user", parts=[types.Part(text=note)]),
+                types.Content(role="model", parts=[types.Part(text="Noted.")]),
+            ] + result
+        return result
     
     def send_message(self, message: str, image: Image.Image | None = None) -> tuple[str | None, Image.Image | None]:
         """Send a message and optionally an image, return response text and image."""
         contents = []
         if message:
-            contents.append(message)
+            contents.append(types.Part(text=message))
         if image:
-            contents.append(image)
+            if isinstance(image, Image.Image):
+                buffer = io.BytesIO()
+                image.save(buffer, image.format or "PNG")
+                mime = Image.MIME.get(image.format or "PNG", "image/png")
+                contents.append(types.Part.from_bytes(data=buffer.getvalue(), mime_type=mime))
+            else:
+                contents.append(image)
         
         if not contents:
             return None, None
         
+        self.payload_sizes.append(content_bytes(self.chat.get_history(curated=True)) + content_bytes(contents))
         response = self.chat.send_message(contents)
         
         text_response = None
@@ -89,6 +221,10 @@ class ImageChat:
                 image_response = part.as_image()
                 self.current_image = image_response
         
+        bounded = self._bounded_history(self.chat.get_history(curated=True))
+        if bounded is not None:
+            self.chat = self.client.chats.create(model=self.model, config=self.config, history=bounded)
+        
         return text_response, image_response
     
     def save_image(self, filename: str | None = None) -> str | None:
@@ -129,11 +265,34 @@ def main():
         default=".",
         help="Directory to save images"
     )
+    parser.add_argument(
+        "--history-turns",
+        type=int,
+        default=6,
+        help="Exchanges resent with each message (default: 6, 0 = all)"
+    )
+    parser.add_argument(
+        "--old-images",
+        default="thumbnail",
+        choices=["thumbnail", "drop", "keep"],
+        help="What to resend for images other than the latest (default: thumbnail)"
+    )
+    parser.add_argument(
+        "--summarize",
+        action="store_true",
+        help="Keep the prompts of dropped exchanges as a short note"
+    )
     
     args = parser.parse_args()
     
+    history = HistoryPolicy(
+        max_turns=args.history_turns or None,
+        old_images=args.old_images,
+        summarize=args.summarize,
+    )
+    
     try:
-        chat = ImageChat(model=args.model, output_dir=args.output_dir)
+        chat = ImageChat(model=args.model, output_dir=args.output_dir, history=history)
     except Exception as e:
         print(f"Error initializing: {e}", file=sys.stderr)
         sys.exit(1)
@@ -195,7 +354,7 @@ def main():
         try:
             # If we have a loaded image and this is first message, include it
             image_to_send = None
-            if chat.current_image and not chat.chat.history:
+            if chat.current_image and not chat.has_history():
                 image_to_send = chat.current_image
             
             text, image = chat.send_message(user_input, image_to_send)
@@ -208,6 +367,8 @@ def main():
                 path = chat.save_image()
                 print(f"\n[Image generated: {path}]")
             
+            print(f"[Request: {format_bytes(chat.payload_sizes[-1])}]")
+            
         except Exception as e:
             print(f"\nError: {e}")
 
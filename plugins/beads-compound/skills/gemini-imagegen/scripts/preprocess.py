@@ -0,0 +1,155 @@
+"""
+Input image preprocessing for Gemini image requests.
+
+Reference images only need to be as large as the requested output. Before
+upload, each input is downsampled so its long side fits the target
+`image_size` (1K/2K/4K, default 1K) with a Lanczos filter, EXIF rotation is
+applied, metadata is dropped, and the image is re-encoded as JPEG (or WebP
+when it has transparency). The original bytes are sent instead whenever
+they are already smaller.
+
+Images are processed in parallel, and each prepared variant is cached on
+disk by the hash of its source bytes and the target size, so repeated
+requests with the same inputs skip decoding entirely.
+
+Usage:
+    from preprocess import prepare_contents
+
+    contents, report = prepare_contents(["Add clouds", Path("photo.jpg")], "2K")
+    print(format_report(report))
+"""
+
+import hashlib
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageOps
+from google.genai import types
+
+from response_cache import default_root
+
+# Long-side pixels for each output size
+TARGET_PIXELS = {"1K": 1024, "2K": 2048, "4K": 4096}
+DEFAULT_SIZE = "1K"
+JPEG_QUALITY = 90
+# Bump when the processing changes so cached variants are rebuilt
+PREPROCESS_VERSION = 1
+# Encodings the API accepts as-is
+ORIGINAL_MIME = {"JPEG": "image/jpeg", "PNG": "image/png", "WEBP": "image/webp"}
+
+
+def _encode(image: Image.Image) -> tuple[bytes, str]:
+    """Encode without metadata: WebP when there is alpha, JPEG otherwise."""
+    buffer = io.BytesIO()
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        image.convert("RGBA").save(buffer, "WEBP", quality=JPEG_QUALITY, method=4)
+        return buffer.getvalue(), "image/webp"
+    image.convert("RGB").save(buffer, "JPEG", quality=JPEG_QUALITY, optimize=True)
+    return buffer.getvalue(), "image/jpeg"
+
+
+def _resize(image: Image.Image, target: int) -> Image.Image:
+    """Apply EXIF rotation and shrink so the long side is at most target."""
+    if image.format == "JPEG":
+        # Let the JPEG decoder scale down by a power of two first
+        image.draft("RGB", (target, target))
+    image = ImageOps.exif_transpose(image)
+    if max(image.size) > target:
+        image.thumbnail((target, target), Image.LANCZOS)
+    return image
+
+
+def target_pixels(image_size: str | None) -> int:
+    """Long-side pixel limit for a requested output size."""
+    return TARGET_PIXELS.get(image_size or DEFAULT_SIZE, TARGET_PIXELS[DEFAULT_SIZE])
+
+
+def prepare_image(source, target: int, cache_dir: Path | None = None) -> tuple[bytes, str, int]:
+    """Return (bytes to upload, mime type, original size in bytes) for one image."""
+    if isinstance(source, Image.Image):
+        # In-memory images have no source bytes to hash or fall back to
+        data, mime = _encode(_resize(source, target))
+        return data, mime, len(data)
+
+    original = Path(source).read_bytes()
+    key = hashlib.sha256(original).hexdigest()
+    variant = None
+    if cache_dir is not None:
+        variant = cache_dir / f"{key}-{target}-v{PREPROCESS_VERSION}"
+        for suffix, mime in ((".jpg", "image/jpeg"), (".webp", "image/webp")):
+            try:
+                data = variant.with_suffix(suffix).read_bytes()
+            except OSError:
+                continue
+            os.utime(variant.with_suffix(suffix))
+            return data, mime, len(original)
+        if variant.with_suffix(".orig").exists():
+            with Image.open(io.BytesIO(original)) as image:
+                return original, ORIGINAL_MIME[image.format], len(original)
+
+    with Image.open(io.BytesIO(original)) as image:
+        original_mime = ORIGINAL_MIME.get(image.format)
+        data, mime = _encode(_resize(image, target))
+
+    keep_original = original_mime is not None and len(original) <= len(data)
+    if variant is not None:
+        variant.parent.mkdir(parents=True, exist_ok=True)
+        path = variant.with_suffix(".orig" if keep_original else ".jpg" if mime == "image/jpeg" else ".webp")
+        tmp = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+        tmp.write_bytes(b"" if keep_original else data)
+        os.replace(tmp, path)
+    if keep_original:
+        return original, original_mime, len(original)
+    return data, mime, len(original)
+
+
+def prepare_contents(
+    contents: list,
+    image_size: str | None = None,
+    cache_dir: str | Path | None = None,
+) -> tuple[list, dict]:
+    """Replace image entries of a request with preprocessed uploads.
+
+    Args:
+        contents: Prompt strings and images (paths or PIL images); other
+            entries are passed through unchanged
+        image_size: Requested output size ("1K", "2K", "4K")
+        cache_dir: Where prepared variants are kept (default: inputs/ in
+            the response cache directory)
+
+    Returns:
+        Tuple of (contents for the API, report dict with images,
+        original_bytes and upload_bytes)
+    """
+    target = target_pixels(image_size)
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_root() / "inputs"
+    indexes = [i for i, item in enumerate(contents) if isinstance(item, (Path, Image.Image))]
+
+    def work(index):
+        return prepare_image(contents[index], target, cache_dir)
+
+    if len(indexes) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(indexes), os.cpu_count() or 1)) as pool:
+            prepared = list(pool.map(work, indexes))
+    else:
+        prepared = [work(i) for i in indexes]
+
+    result = list(contents)
+    report = {"images": len(indexes), "original_bytes": 0, "upload_bytes": 0}
+    for index, (data, mime, original_size) in zip(indexes, prepared):
+        result[index] = types.Part.from_bytes(data=data, mime_type=mime)
+        report["original_bytes"] += original_size
+        report["upload_bytes"] += len(data)
+    return result, report
+
+
+def format_report(report: dict) -> str:
+    """One-line summary such as 'Uploaded 3 image(s): 412 KB (was 9.8 MB, saved 96%)'."""
+    def size(n):
+        return f"{n / 1024 / 1024:.1f} MB" if n >= 1024 * 1024 else f"{n / 1024:.0f} KB"
+
+    original, upload = report["original_bytes"], report["upload_bytes"]
+    saved = 100 * (original - upload) / original if original else 0
+    return f"Uploaded {report['images']} image(s): {size(upload)} (was {size(original)}, saved {saved:.0f}%)"
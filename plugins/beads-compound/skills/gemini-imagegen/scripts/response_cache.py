@@ -0,0 +1,237 @@
+"""
+Content-addressed response cache for Gemini image requests.
+
+A request is identified by a hash of the model, the generation config, the
+prompt text, the bytes of every input image and, for requests with images,
+how they are preprocessed before upload. The returned image bytes and
+text are stored under that hash, so repeating a request (same prompt, model,
+settings and inputs) reads the result from disk instead of calling the API.
+The cache is bounded in size; the least recently used entries are evicted.
+
+Usage:
+    from response_cache import ResponseCache, generate_content
+
+    cache = ResponseCache()
+    image_bytes, text = generate_content(client, model, [prompt, "in.png"], config, cache=cache)
+
+Environment:
+    GEMINI_IMAGEGEN_CACHE        - Cache directory (default: ~/.cache/gemini-imagegen)
+    GEMINI_IMAGEGEN_CACHE_MAX_MB - Size limit in MB (default: 500)
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from PIL import Image
+
+DEFAULT_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "gemini-imagegen"
+DEFAULT_MAX_MB = 500
+# Bump when the key or entry layout changes
+CACHE_VERSION = 2
+
+
+def default_root() -> Path:
+    """Cache directory, honouring GEMINI_IMAGEGEN_CACHE."""
+    return Path(os.environ.get("GEMINI_IMAGEGEN_CACHE") or DEFAULT_DIR)
+
+
+def _file_digest(path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _content_digest(item) -> tuple[str, str]:
+    """(kind, digest) identifying one entry of a request's contents."""
+    if isinstance(item, str):
+        return "text", item
+    if isinstance(item, Path):
+        return "image", _file_digest(item)
+    if isinstance(item, (bytes, bytearray)):
+        return "image", hashlib.sha256(item).hexdigest()
+    if isinstance(item, Image.Image):
+        digest = hashlib.sha256(f"{item.mode} {item.size}".encode())
+        digest.update(item.tobytes())
+        return "image", digest.hexdigest()
+    # Images returned by the SDK carry their encoded bytes
+    image_bytes = getattr(item, "image_bytes", None)
+    if image_bytes is not None:
+        return "image", hashlib.sha256(image_bytes).hexdigest()
+    raise TypeError(f"Cannot build a cache key for {type(item).__name__}")
+
+
+def _config_dict(config) -> dict:
+    """Normalized, JSON-serializable form of a GenerateContentConfig."""
+    if config is None:
+        return {}
+    if hasattr(config, "model_dump"):
+        return config.model_dump(mode="json", exclude_none=True)
+    return dict(config)
+
+
+def request_key(model: str, contents: list, config=None, preprocess: dict | None = None) -> str:
+    """Hash identifying a request: model, normalized config, contents and
+    input preprocessing settings (None when images are uploaded as-is)."""
+    payload = {
+        "version": CACHE_VERSION,
+        "model": model,
+        "config": _config_dict(config),
+        "contents": [_content_digest(item) for item in contents],
+        "preprocess": preprocess,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class ResponseCache:
+    """On-disk cache of image responses with size-bounded LRU eviction."""
+
+    def __init__(self, root: str | Path | None = None, max_bytes: int | None = None):
+        self.root = Path(root) if root else default_root()
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get("GEMINI_IMAGEGEN_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        base = self.root / key[:2] / key
+        return base.with_suffix(".bin"), base.with_suffix(".json")
+
+    def get(self, key: str) -> tuple[bytes, str | None] | None:
+        """Return (image bytes, text) for a cached request, or None."""
+        data_path, meta_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text())
+            data = data_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        # Reads count as use for LRU eviction
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+        return data, meta.get("text")
+
+    def put(self, key: str, data: bytes, text: str | None = None, mime_type: str | None = None):
+        """Store a response, then evict old entries if over the size limit."""
+        data_path, meta_path = self._paths(key)
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        suffix = f".tmp.{os.getpid()}.{threading.get_ident()}"
+        for path, content in (
+            (data_path, data),
+            (meta_path, json.dumps({"text": text, "mime_type": mime_type, "size": len(data)}).encode()),
+        ):
+            tmp = path.with_name(path.name + suffix)
+            tmp.write_bytes(content)
+            os.replace(tmp, path)
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until under max_bytes.
+
+        Preprocessed input images (inputs/) share the size limit.
+        """
+        with self._lock:
+            entries = []
+            total = 0
+            for meta_path in self.root.glob("*/*.json"):
+                data_path = meta_path.with_suffix(".bin")
+                try:
+                    size = data_path.stat().st_size + meta_path.stat().st_size
+                    used = meta_path.stat().st_mtime
+                except OSError:
+                    continue
+                entries.append((used, size, data_path, meta_path))
+                total += size
+            for path in self.root.glob("inputs/*"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path, path))
+                total += stat.st_size
+            if total <= self.max_bytes:
+                return
+            for used, size, data_path, meta_path in sorted(entries):
+                # Metadata first: an entry without it is never read
+                meta_path.unlink(missing_ok=True)
+                data_path.unlink(missing_ok=True)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+    def clear(self):
+        """Remove every cached entry."""
+        for path in self.root.glob("*/*"):
+            path.unlink(missing_ok=True)
+
+
+def generate_content(
+    client,
+    model: str,
+    contents: list,
+    config=None,
+    *,
+    cache: ResponseCache | None = None,
+    preprocess: bool = True,
+    report: dict | None = None,
+) -> tuple[bytes | None, str | None]:
+    """Call generate_content, answering from the cache when possible.
+
+    Args:
+        client: genai.Client (or a stand-in with models.generate_content)
+        model: Model name
+        contents: Prompt strings and images; Path entries are read from
+            disk only on a cache miss
+        config: GenerateContentConfig
+        cache: ResponseCache, or None to always call the API
+        preprocess: Downsample and re-encode input images for the requested
+            image_size before upload (see preprocess.py)
+        report: Filled with the upload size report when the API is called
+
+    Returns:
+        Tuple of (image bytes or None, text response or None)
+    """
+    image_size = getattr(getattr(config, "image_config", None), "image_size", None)
+    # The uploaded images, and so the response, depend on preprocessing
+    settings = None
+    if preprocess and any(isinstance(item, (Path, Image.Image)) for item in contents):
+        from preprocess import PREPROCESS_VERSION, target_pixels
+
+        settings = {"version": PREPROCESS_VERSION, "target": target_pixels(image_size)}
+
+    key = None
+    if cache is not None:
+        key = request_key(model, contents, config, settings)
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+
+    if preprocess:
+        from preprocess import prepare_contents
+
+        inputs_dir = (cache.root if cache is not None else default_root()) / "inputs"
+        loaded, upload = prepare_contents(contents, image_size, inputs_dir)
+        if report is not None:
+            report.update(upload)
+    else:
+        loaded = [Image.open(item) if isinstance(item, Path) else item for item in contents]
+    response = client.models.generate_content(model=model, contents=loaded, config=config)
+
+    data = None
+    mime_type = None
+    text = None
+    for part in response.parts or []:
+        if part.text is not None:
+            text = part.text
+        elif part.inline_data is not None:
+            data = part.inline_data.data
+            mime_type = part.inline_data.mime_type
+
+    if cache is not None and data is not None:
+        cache.put(key, data, text, mime_type)
+    return data, text
@@ -24,6 +24,36 @@ ensure_gitignore() {
   fi
 }
 
+# cp flags differ: macOS clones with -c (APFS clonefile), GNU with --reflink
+if [[ "$(uname)" == "Darwin" ]]; then
+  CLONE_FLAG="-c"
+else
+  CLONE_FLAG="--reflink=always"
+fi
+
+# Copy a file as a copy-on-write clone when the filesystem supports it,
+# else a plain copy. Never hardlinks: env files are edited per worktree.
+clone_file() {
+  cp $CLONE_FLAG "$1" "$2" 2>/dev/null || cp "$1" "$2"
+}
+
+# Copy a directory tree cheaply: copy-on-write clone, else a plain recursive
+# copy. Hardlinks (GNU cp -l) are only used with batch --hardlink: a
+# hardlinked tree shares files with its source, so anything that writes in
+# place (native rebuilds, patch-package, .next/cache) changes both.
+CLONE_HARDLINK=false
+clone_tree() {
+  local src="$1" dest="$2"
+  mkdir -p "$(dirname "$dest")"
+  cp -R $CLONE_FLAG "$src" "$dest" 2>/dev/null && return
+  rm -rf "$dest"
+  if $CLONE_HARDLINK; then
+    cp -al "$src" "$dest" 2>/dev/null && return
+    rm -rf "$dest"
+  fi
+  cp -R "$src" "$dest"
+}
+
 # Copy .env files from main repo to worktree
 copy_env_files() {
   local worktree_path="$1"
@@ -57,7 +87,7 @@ copy_env_files() {
       cp "$dest" "${dest}.backup"
     fi
 
-    cp "$source" "$dest"
+    clone_file "$source" "$dest"
     echo -e "  ${GREEN}Copied $env_file${NC}"
     copied=$((copied + 1))
   done
@@ -122,6 +152,157 @@ create_worktree() {
   echo ""
 }
 
+# Milliseconds since the epoch (bash 5 EPOCHREALTIME, else whole seconds)
+now_ms() {
+  if [[ -n "$EPOCHREALTIME" ]]; then
+    local t="${EPOCHREALTIME/,/.}"
+    echo $(( ${t%.*} * 1000 + 10#$(printf '%.3s' "${t#*.}000") ))
+  else
+    echo $(( $(date +%s) * 1000 ))
+  fi
+}
+
+# Provision one worktree non-interactively; writes a timing line to $3
+provision_worktree() {
+  local branch_name="$1" from_branch="$2" result_file="$3"
+  local worktree_path="$WORKTREE_DIR/$branch_name"
+  local start=$(now_ms) t0 t1 add_ms env_ms deps_ms status="ok"
+
+  if [[ -e "$worktree_path" ]]; then
+    printf '%s\texists\t0\t0\t0\t0\n' "$branch_name" > "$result_file"
+    return 0
+  fi
+
+  t0=$(now_ms)
+  # Concurrent adds can race on shared ref locks; retry once
+  if ! git worktree add -q -b "$branch_name" "$worktree_path" "$from_branch" 2>&1; then
+    sleep 1
+    git worktree add -q -b "$branch_name" "$worktree_path" "$from_branch" 2>&1 || {
+      printf '%s\tfailed\t0\t0\t0\t%s\n' "$branch_name" $(( $(now_ms) - start )) > "$result_file"
+      return 1
+    }
+  fi
+  t1=$(now_ms); add_ms=$(( t1 - t0 ))
+
+  copy_env_files "$worktree_path"
+  t0=$(now_ms); env_ms=$(( t0 - t1 ))
+
+  local dir
+  if [[ -n "$DEPS_SOURCE" ]]; then
+    for dir in "${DEPS_DIRS[@]}"; do
+      if [[ -d "$DEPS_SOURCE/$dir" ]] && [[ ! -e "$worktree_path/$dir" ]]; then
+        echo "Cloning $dir from $DEPS_SOURCE"
+        clone_tree "$DEPS_SOURCE/$dir" "$worktree_path/$dir" || status="partial"
+      fi
+    done
+  fi
+  t1=$(now_ms); deps_ms=$(( t1 - t0 ))
+
+  printf '%s\t%s\t%s\t%s\t%s\t%s\n' "$branch_name" "$status" "$add_ms" "$env_ms" "$deps_ms" $(( t1 - start )) > "$result_file"
+}
+
+# Create many worktrees concurrently (non-interactive, for parallel workers)
+batch_create() {
+  local from_branch="main" jobs=4 template="" branches=() extra_dirs=()
+
+  while [[ $# -gt 0 ]]; do
+    case "$1" in
+      --from) from_branch="$2"; shift 2 ;;
+      --jobs|-j) jobs="$2"; shift 2 ;;
+      --template) template="$2"; shift 2 ;;
+      --cache) extra_dirs+=("$2"); shift 2 ;;
+      --hardlink) CLONE_HARDLINK=true; shift ;;
+      -*) echo -e "${RED}Unknown option: $1${NC}"; exit 1 ;;
+      *) branches+=("$1"); shift ;;
+    esac
+  done
+
+  if [[ ${#branches[@]} -eq 0 ]]; then
+    echo -e "${RED}Error: At least one branch name required${NC}"
+    exit 1
+  fi
+
+  if [[ ! "$jobs" =~ ^[1-9][0-9]*$ ]]; then
+    echo -e "${RED}Error: --jobs must be a positive integer${NC}"
+    exit 1
+  fi
+
+  local name
+  for name in "${branches[@]}"; do
+    if ! git check-ref-format --branch "$name" >/dev/null 2>&1; then
+      echo -e "${RED}Error: Invalid branch name: $name${NC}"
+      exit 1
+    fi
+  done
+
+  # Installed dependency dirs come from a template worktree, or from the
+  # main checkout when only --cache dirs are requested
+  DEPS_SOURCE=""
+  DEPS_DIRS=()
+  if [[ -n "$template" ]]; then
+    if [[ "$template" == "main" ]]; then
+      DEPS_SOURCE="$GIT_ROOT"
+    elif [[ -d "$WORKTREE_DIR/$template" ]]; then
+      DEPS_SOURCE="$WORKTREE_DIR/$template"
+    elif [[ -d "$template" ]]; then
+      DEPS_SOURCE="$(cd "$template" && pwd)"
+    else
+      echo -e "${RED}Error: Template worktree not found: $template${NC}"
+      exit 1
+    fi
+    DEPS_DIRS=(node_modules vendor/bundle Pods)
+  elif [[ ${#extra_dirs[@]} -gt 0 ]]; then
+    DEPS_SOURCE="$GIT_ROOT"
+  fi
+  [[ ${#extra_dirs[@]} -gt 0 ]] && DEPS_DIRS+=("${extra_dirs[@]}")
+
+  # Update the base branch once, without switching the main checkout
+  echo -e "${BLUE}Updating $from_branch...${NC}"
+  if [[ "$(git rev-parse --abbrev-ref HEAD 2>/dev/null)" == "$from_branch" ]]; then
+    git pull --ff-only origin "$from_branch" >/dev/null 2>&1 || true
+  else
+    git fetch origin "$from_branch:$from_branch" >/dev/null 2>&1 || true
+  fi
+
+  mkdir -p "$WORKTREE_DIR"
+  ensure_gitignore
+
+  local results_dir
+  results_dir=$(mktemp -d "${TMPDIR:-/tmp}/worktree-batch.XXXXXX")
+
+  echo -e "${BLUE}Provisioning ${#branches[@]} worktree(s), $jobs at a time...${NC}"
+  local start=$(now_ms) i=0
+  for name in "${branches[@]}"; do
+    while [[ $(jobs -rp | wc -l) -ge $jobs ]]; do
+      sleep 0.1
+    done
+    i=$((i + 1))
+    provision_worktree "$name" "$from_branch" "$results_dir/$i.result" > "$results_dir/$i.log" 2>&1 &
+  done
+  wait
+
+  echo ""
+  printf '%-32s %-8s %8s %8s %8s %8s\n' "WORKTREE" "STATUS" "ADD_MS" "ENV_MS" "DEPS_MS" "TOTAL_MS"
+  local failed=0 n line status
+  for n in $(seq 1 "$i"); do
+    if [[ -f "$results_dir/$n.result" ]]; then
+      IFS=$'\t' read -r name status add env deps total < "$results_dir/$n.result"
+    else
+      name="${branches[$((n - 1))]}" status="failed" add=0 env=0 deps=0 total=0
+    fi
+    printf '%-32s %-8s %8s %8s %8s %8s\n' "$name" "$status" "$add" "$env" "$deps" "$total"
+    if [[ "$status" == "failed" ]]; then
+      failed=$((failed + 1))
+      sed 's/^/    /' "$results_dir/$n.log"
+    fi
+  done
+  echo ""
+  echo -e "${GREEN}Done in $(( $(now_ms) - start )) ms${NC} (worktrees in $WORKTREE_DIR)"
+
+  rm -rf "$results_dir"
+  [[ $failed -eq 0 ]]
+}
+
 # List all worktrees
 list_worktrees() {
   echo -e "${BLUE}Available worktrees:${NC}"
@@ -283,6 +464,10 @@ main() {
     create)
       create_worktree "$2" "$3"
       ;;
+    batch)
+      shift
+      batch_create "$@"
+      ;;
     list|ls)
       list_worktrees
       ;;
@@ -316,6 +501,14 @@ Usage: worktree-manager.sh <command> [options]
 Commands:
   create <branch-name> [from-branch]  Create new worktree (copies .env files automatically)
                                       (from-branch defaults to main)
+  batch [options] <branch-name>...    Create many worktrees concurrently (non-interactive)
+    --from <branch>                   Base branch (default: main)
+    --jobs <n>                        Worktrees provisioned at once (default: 4)
+    --template <name|path|main>       Clone installed dependencies (node_modules,
+                                      vendor/bundle, Pods) from this worktree
+    --cache <dir>                     Also clone this untracked dir (repeatable)
+    --hardlink                        Hardlink dirs when copy-on-write is unavailable
+                                      (shares files with the source; see below)
   list | ls                           List all worktrees
   switch | go [name]                  Switch to worktree
   copy-env | env [name]               Copy .env files from main repo to worktree
@@ -328,10 +521,18 @@ Environment Files:
   - Skips .env.example (should be in git)
   - Creates .backup files if destination already exists
   - Use 'copy-env' to refresh env files after main repo changes
+  - Copies are copy-on-write clones where the filesystem supports them
+
+Batch Provisioning:
+  - Dependency/cache dirs are cloned copy-on-write, else copied
+  - --hardlink links them instead of copying; tools that write in place
+    (native rebuilds, patch-package, .next/cache) then modify the source too
+  - Prints add/env/deps/total milliseconds per worktree
 
 Examples:
   worktree-manager.sh create feature-login
   worktree-manager.sh create feature-auth develop
+  worktree-manager.sh batch --jobs 8 --template main worker-1 worker-2 worker-3
   worktree-manager.sh switch feature-login
   worktree-manager.sh copy-env feature-login
   worktree-manager.sh copy-env                   # copies to current worktree
@@ -4,54 +4,160 @@ Skill Packager - Creates a distributable zip file of a skill folder
 
 Usage:
     python utils/package_skill.py <path/to/skill-folder> [output-directory]
+    python utils/package_skill.py --all <skills-root> [output-directory]
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
+    python utils/package_skill.py --all skills/public ./dist
+
+Archives are reproducible: entries are sorted, timestamps and permissions are
+fixed, and junk (__pycache__, .DS_Store, ...) is left out. Already-compressed
+files such as images are stored rather than deflated. The content hash of the
+skill is recorded in the zip comment, and a skill whose hash matches its
+existing archive is not repackaged.
+
+Options:
+    --all ROOT        Package every skill directory under ROOT in parallel
+    --exclude GLOB    Extra file or directory pattern to leave out (repeatable)
+    --force           Repackage even when the archive is up to date
+    --jobs N          Parallel workers for --all (default: CPU count)
 """
 
+import argparse
+import hashlib
+import os
 import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
 from pathlib import Path
 from quick_validate import validate_skill
 
+IGNORE_PATTERNS = (
+    '__pycache__', '*.pyc', '*.pyo', '.DS_Store', 'Thumbs.db', '.git', '.gitignore',
+    '.venv', 'node_modules', '*.swp', '*~', '.pytest_cache', '.mypy_cache',
+)
+
+# Already compressed: deflating again costs time and saves nothing
+STORED_SUFFIXES = {
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.ico',
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.zst', '.7z',
+    '.mp3', '.mp4', '.m4a', '.mov', '.webm', '.ogg', '.woff', '.woff2', '.pdf',
+}
+
+# DOS epoch: the earliest timestamp a zip entry can hold
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+HASH_PREFIX = 'skill-sha256:'
+# Bump when the archive layout changes so existing archives are rebuilt
+PACKAGE_FORMAT = '1'
+
+
+def is_ignored(rel_path, patterns):
+    """True if any component of rel_path matches an ignore pattern"""
+    return any(fnmatch(part, pattern) for part in rel_path.parts for pattern in patterns)
+
+
+def collect_files(skill_path, patterns=IGNORE_PATTERNS):
+    """Files to package, sorted by their path within the skill"""
+    files = []
+    for root, dirs, names in os.walk(skill_path):
+        root = Path(root)
+        dirs[:] = [d for d in dirs if not is_ignored(Path(d), patterns)]
+        for name in names:
+            rel = (root / name).relative_to(skill_path)
+            if not is_ignored(rel, patterns):
+                files.append(rel)
+    return sorted(files, key=lambda p: p.as_posix())
+
+
+def content_hash(skill_path, files):
+    """Hash of paths, executable bits and contents of the packaged files"""
+    digest = hashlib.sha256(f'format {PACKAGE_FORMAT}\n'.encode())
+    for rel in files:
+        path = skill_path / rel
+        digest.update(f'{rel.as_posix()}\0{int(os.access(path, os.X_OK))}\0'.encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def archive_hash(zip_path):
+    """Content hash recorded in an existing archive, or None"""
+    try:
+        with zipfile.ZipFile(zip_path) as zipf:
+            comment = zipf.comment.decode('utf-8', 'replace')
+    except (OSError, zipfile.BadZipFile):
+        return None
+    return comment[len(HASH_PREFIX):] if comment.startswith(HASH_PREFIX) else None
 
-def package_skill(skill_path, output_dir=None):
+
+def write_archive(zip_path, skill_path, files, digest, verbose=True):
+    """Write a byte-reproducible zip, atomically replacing zip_path"""
+    tmp_path = zip_path.with_name(f'.{zip_path.name}.tmp.{os.getpid()}')
+    try:
+        with zipfile.ZipFile(tmp_path, 'w') as zipf:
+            for rel in files:
+                path = skill_path / rel
+                arcname = f'{skill_path.name}/{rel.as_posix()}'
+                info = zipfile.ZipInfo(arcname, date_time=FIXED_DATE_TIME)
+                info.create_system = 3  # Unix, so external_attr is honoured
+                mode = 0o755 if os.access(path, os.X_OK) else 0o644
+                info.external_attr = (0o100000 | mode) << 16
+                if path.suffix.lower() in STORED_SUFFIXES:
+                    info.compress_type = zipfile.ZIP_STORED
+                else:
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                zipf.writestr(info, path.read_bytes(), compresslevel=9)
+                if verbose:
+                    print(f"  Added: {arcname}")
+            zipf.comment = f'{HASH_PREFIX}{digest}'.encode()
+        os.replace(tmp_path, zip_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def package_skill(skill_path, output_dir=None, excludes=(), force=False, verbose=True):
     """
     Package a skill folder into a zip file.
 
+    Returns:
+        Path to the created (or already up-to-date) zip file, or None if error
+    """
+    return build_package(skill_path, output_dir, excludes, force, verbose)[0]
+
+
+def build_package(skill_path, output_dir=None, excludes=(), force=False, verbose=True):
+    """
+    Package a skill folder into a zip file, skipping it when up to date.
+
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the zip file (defaults to current directory)
+        excludes: Extra ignore patterns on top of IGNORE_PATTERNS
+        force: Rebuild even when the archive's content hash matches
+        verbose: Print each step and every added file
 
     Returns:
-        Path to the created zip file, or None if error
+        (zip path or None on error, True if the archive was rewritten)
     """
+    log = print if verbose else (lambda *args, **kwargs: None)
     skill_path = Path(skill_path).resolve()
 
     # Validate skill folder exists
     if not skill_path.exists():
         print(f"❌ Error: Skill folder not found: {skill_path}")
-        return None
+        return None, False
 
     if not skill_path.is_dir():
         print(f"❌ Error: Path is not a directory: {skill_path}")
-        return None
+        return None, False
 
     # Validate SKILL.md exists
     skill_md = skill_path / "SKILL.md"
     if not skill_md.exists():
         print(f"❌ Error: SKILL.md not found in {skill_path}")
-        return None
-
-    # Run validation before packaging
-    print("🔍 Validating skill...")
-    valid, message = validate_skill(skill_path)
-    if not valid:
-        print(f"❌ Validation failed: {message}")
-        print("   Please fix the validation errors before packaging.")
-        return None
-    print(f"✅ {message}\n")
+        return None, False
 
     # Determine output location
     skill_name = skill_path.name
@@ -63,42 +169,90 @@ def package_skill(skill_path, output_dir=None):
 
     zip_filename = output_path / f"{skill_name}.zip"
 
+    files = collect_files(skill_path, IGNORE_PATTERNS + tuple(excludes))
+    digest = content_hash(skill_path, files)
+
+    # Archives are only written after validation, so a matching hash means
+    # this exact content was already validated and packaged
+    if not force and archive_hash(zip_filename) == digest:
+        log(f"✅ Up to date: {zip_filename}")
+        return zip_filename, False
+
+    # Run validation before packaging
+    log("🔍 Validating skill...")
+    valid, message = validate_skill(skill_path)
+    if not valid:
+        print(f"❌ Validation failed for {skill_name}: {message}")
+        print("   Please fix the validation errors before packaging.")
+        return None, False
+    log(f"✅ {message}\n")
+
     # Create the zip file
     try:
-        with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob('*'):
-                if file_path.is_file():
-                    # Calculate the relative path within the zip
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
-
-        print(f"\n✅ Successfully packaged skill to: {zip_filename}")
-        return zip_filename
+        write_archive(zip_filename, skill_path, files, digest, verbose)
+        log(f"\n✅ Successfully packaged skill to: {zip_filename}")
+        return zip_filename, True
 
     except Exception as e:
-        print(f"❌ Error creating zip file: {e}")
-        return None
+        print(f"❌ Error creating zip file for {skill_name}: {e}")
+        return None, False
+
+
+def package_all(root, output_dir=None, excludes=(), force=False, jobs=None):
+    """Package every skill under root in parallel. Returns the number of failures."""
+    root = Path(root)
+    skills = sorted(p.parent for p in root.glob('*/SKILL.md'))
+    if not skills:
+        print(f"❌ Error: No skills found under {root}")
+        return 1
+
+    def build(skill):
+        result, rebuilt = build_package(skill, output_dir, excludes, force, verbose=False)
+        if result:
+            print(f"  {'packaged ' if rebuilt else 'unchanged'}  {result}")
+        return result
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        results = list(pool.map(build, skills))
+
+    failures = results.count(None)
+    print(f"\n📦 {len(skills) - failures}/{len(skills)} skills packaged")
+    return failures
 
 
 def main():
-    if len(sys.argv) < 2:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('skill_path', nargs='?', help='Skill folder to package')
+    parser.add_argument('output_dir', nargs='?', help='Output directory (default: current directory)')
+    parser.add_argument('--all', dest='root', help='Package every skill under ROOT')
+    parser.add_argument('--exclude', action='append', default=[], help='Extra ignore pattern')
+    parser.add_argument('--force', action='store_true', help='Repackage even if up to date')
+    parser.add_argument('--jobs', type=int, help='Parallel workers for --all')
+    args = parser.parse_args()
+
+    if args.root:
+        # With --all the only positional is the output directory
+        output_dir = args.output_dir or args.skill_path
+        print(f"📦 Packaging skills under: {args.root}")
+        if output_dir:
+            print(f"   Output directory: {output_dir}")
+        print()
+        sys.exit(1 if package_all(args.root, output_dir, args.exclude, args.force, args.jobs) else 0)
+
+    if not args.skill_path:
         print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
         print("\nExample:")
         print("  python utils/package_skill.py skills/public/my-skill")
         print("  python utils/package_skill.py skills/public/my-skill ./dist")
+        print("  python utils/package_skill.py --all skills/public ./dist")
         sys.exit(1)
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
-
-    print(f"📦 Packaging skill: {skill_path}")
-    if output_dir:
-        print(f"   Output directory: {output_dir}")
+    print(f"📦 Packaging skill: {args.skill_path}")
+    if args.output_dir:
+        print(f"   Output directory: {args.output_dir}")
     print()
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(args.skill_path, args.output_dir, args.exclude, args.force)
 
     if result:
         sys.exit(0)
@@ -1,65 +1,267 @@
 #!/usr/bin/env python3
 """
-Quick validation script for skills - minimal version
+Quick validation script for skills
+
+Usage:
+    python quick_validate.py <skill_directory>
+    python quick_validate.py --all <skills_root> [--json PATH] [--cache PATH | --no-cache]
+
+--all validates every skill directory under the root concurrently and prints
+one line per skill. Results are cached by the SHA-256 of each SKILL.md (and of
+this script), so unchanged skills are not parsed again. One cache serves any
+number of roots and keeps the 2000 most recently used results.
+
+Options:
+    --all ROOT     Validate every directory under ROOT that holds a SKILL.md
+    --json PATH    Write a combined report as JSON ('-' for stdout)
+    --cache PATH   Result cache (default: ~/.cache/skill-creator/quick_validate.json)
+    --no-cache     Neither read nor write the cache
+    --jobs N       Parallel workers (default: CPU count x 4, max 32)
 """
 
-import sys
+import argparse
+import hashlib
+import json
 import os
 import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def validate_skill(skill_path):
-    """Basic validation of a skill"""
-    skill_path = Path(skill_path)
-    
-    # Check SKILL.md exists
-    skill_md = skill_path / 'SKILL.md'
-    if not skill_md.exists():
-        return False, "SKILL.md not found"
-    
-    # Read and validate frontmatter
-    content = skill_md.read_text()
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+DEFAULT_CACHE = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'skill-creator' / 'quick_validate.json'
+CACHE_MAX_ENTRIES = 2000
+
+
+def parse_frontmatter_fallback(frontmatter):
+    """Top-level string fields without PyYAML: plain, quoted and multi-line
+    plain scalars, and folded (>) or literal (|) block scalars"""
+    fields = {}
+    lines = frontmatter.splitlines()
+    i = 0
+    while i < len(lines):
+        key_match = re.match(r'^([A-Za-z0-9_-]+):\s*(.*)$', lines[i])
+        i += 1
+        if not key_match:
+            continue
+        key, value = key_match.group(1), key_match.group(2).strip()
+        block = []
+        while i < len(lines) and (not lines[i].strip() or lines[i][0] in ' \t'):
+            block.append(lines[i])
+            i += 1
+        while block and not block[-1].strip():
+            block.pop()
+
+        if re.match(r'^[>|][+-]?[0-9]?$', value):
+            indent = min((len(b) - len(b.lstrip()) for b in block if b.strip()), default=0)
+            body = [b[indent:] for b in block]
+            if value[0] == '>':
+                # Folding: lines join with spaces, blank lines become newlines
+                value = re.sub(r' ?\n ?', '\n', ' '.join(b if b.strip() else '\n' for b in body)).strip()
+            else:
+                value = '\n'.join(body)
+        else:
+            if block:
+                value = ' '.join([value] + [b.strip() for b in block if b.strip()]).strip()
+            value = value.strip('"\'')
+        fields[key] = value
+    return fields
+
+
+def parse_frontmatter(content):
+    """Return (fields, error) for the YAML frontmatter of a SKILL.md"""
     if not content.startswith('---'):
-        return False, "No YAML frontmatter found"
-    
-    # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
+        return None, "No YAML frontmatter found"
+
+    match = re.match(r'^---\r?\n(.*?)\r?\n---', content, re.DOTALL)
     if not match:
-        return False, "Invalid frontmatter format"
-    
+        return None, "Invalid frontmatter format"
     frontmatter = match.group(1)
-    
+
+    if yaml is None:
+        return parse_frontmatter_fallback(frontmatter), None
+
+    try:
+        fields = yaml.safe_load(frontmatter)
+    except yaml.YAMLError as e:
+        return None, f"Invalid YAML in frontmatter: {e}"
+    if not isinstance(fields, dict):
+        return None, "Frontmatter must be a YAML mapping"
+    return fields, None
+
+
+def validate_content(content):
+    """Validate the text of a SKILL.md, returning (valid, message)"""
+    fields, error = parse_frontmatter(content)
+    if error:
+        return False, error
+
     # Check required fields
-    if 'name:' not in frontmatter:
+    if 'name' not in fields:
         return False, "Missing 'name' in frontmatter"
-    if 'description:' not in frontmatter:
+    if 'description' not in fields:
         return False, "Missing 'description' in frontmatter"
-    
-    # Extract name for validation
-    name_match = re.search(r'name:\s*(.+)', frontmatter)
-    if name_match:
-        name = name_match.group(1).strip()
-        # Check naming convention (hyphen-case: lowercase with hyphens)
-        if not re.match(r'^[a-z0-9-]+$', name):
-            return False, f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
-        if name.startswith('-') or name.endswith('-') or '--' in name:
-            return False, f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens"
-
-    # Extract and validate description
-    desc_match = re.search(r'description:\s*(.+)', frontmatter)
-    if desc_match:
-        description = desc_match.group(1).strip()
-        # Check for angle brackets
-        if '<' in description or '>' in description:
-            return False, "Description cannot contain angle brackets (< or >)"
+
+    name = fields['name']
+    if not isinstance(name, str):
+        return False, "'name' must be a string"
+    name = name.strip()
+    # Check naming convention (hyphen-case: lowercase with hyphens)
+    if not re.match(r'^[a-z0-9-]+$', name):
+        return False, f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
+    if name.startswith('-') or name.endswith('-') or '--' in name:
+        return False, f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens"
+
+    description = fields['description']
+    if not isinstance(description, str):
+        return False, "'description' must be a string"
+    if not description.strip():
+        return False, "Description cannot be empty"
+    # Check for angle brackets
+    if '<' in description or '>' in description:
+        return False, "Description cannot contain angle brackets (< or >)"
 
     return True, "Skill is valid!"
 
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python quick_validate.py <skill_directory>")
+
+def validate_skill(skill_path):
+    """Basic validation of a skill"""
+    skill_path = Path(skill_path)
+
+    # Check SKILL.md exists
+    skill_md = skill_path / 'SKILL.md'
+    if not skill_md.exists():
+        return False, "SKILL.md not found"
+
+    return validate_content(skill_md.read_text(encoding='utf-8'))
+
+
+def validator_hash():
+    """Hash of this script, so rule changes invalidate cached results"""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(b'yaml' if yaml else b'regex')
+    return digest.hexdigest()[:16]
+
+
+def load_cache(path):
+    if path is None:
+        return {}
+    try:
+        cache = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if cache.get('validator') != validator_hash():
+        return {}
+    return cache.get('results', {})
+
+
+def save_cache(path, results):
+    if path is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'.{path.name}.tmp.{os.getpid()}')
+    tmp.write_text(json.dumps({'validator': validator_hash(), 'results': results}, indent=1, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def find_skills(root):
+    """Every directory under root with a SKILL.md, plus top-level directories without one"""
+    root = Path(root)
+    dirs = {p.parent for p in root.rglob('SKILL.md') if not any(part.startswith('.') for part in p.relative_to(root).parts)}
+    dirs |= {p for p in root.iterdir() if p.is_dir() and not p.name.startswith('.')}
+    return sorted(dirs)
+
+
+def check_skill(skill_path, cache):
+    """Validate one skill directory, consulting the hash-keyed cache"""
+    skill_md = skill_path / 'SKILL.md'
+    if not skill_md.exists():
+        return {'path': str(skill_path), 'valid': False, 'message': "SKILL.md not found", 'sha256': None, 'cached': False}
+
+    content = skill_md.read_bytes()
+    sha256 = hashlib.sha256(content).hexdigest()
+    cached = cache.get(sha256)
+    if cached is not None:
+        valid, message = cached[:2]
+    else:
+        valid, message = validate_content(content.decode('utf-8'))
+    return {'path': str(skill_path), 'valid': valid, 'message': message, 'sha256': sha256, 'cached': cached is not None}
+
+
+def validate_all(root, cache_path=None, jobs=None):
+    """Validate every skill under root concurrently. Returns the combined report."""
+    cache = load_cache(cache_path)
+    skills = find_skills(root)
+    workers = jobs or min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda path: check_skill(path, cache), skills))
+
+    # Merge into the entries other roots left behind (each entry is
+    # [valid, message, last used]), dropping the least recently used past
+    # CACHE_MAX_ENTRIES
+    if cache_path is not None:
+        now = int(time.time())
+        merged = dict(cache)
+        merged.update({r['sha256']: [r['valid'], r['message'], now] for r in results if r['sha256']})
+        if len(merged) > CACHE_MAX_ENTRIES:
+            newest = sorted(merged.items(), key=lambda item: item[1][2], reverse=True)
+            merged = dict(newest[:CACHE_MAX_ENTRIES])
+        save_cache(cache_path, merged)
+
+    invalid = sum(1 for r in results if not r['valid'])
+    return {
+        'root': str(Path(root).resolve()),
+        'validator': validator_hash(),
+        'total': len(results),
+        'valid': len(results) - invalid,
+        'invalid': invalid,
+        'cached': sum(1 for r in results if r['cached']),
+        'skills': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('skill_directory', nargs='?', help='Skill directory to validate')
+    parser.add_argument('--all', dest='root', help='Validate every skill under ROOT')
+    parser.add_argument('--json', dest='json_path', help="Write JSON report ('-' for stdout)")
+    parser.add_argument('--cache', type=Path, default=DEFAULT_CACHE, help='Result cache file')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the cache')
+    parser.add_argument('--jobs', type=int, help='Parallel workers')
+    args = parser.parse_args()
+
+    if bool(args.root) == bool(args.skill_directory):
+        parser.print_usage()
+        sys.exit(1)
+
+    if args.skill_directory:
+        valid, message = validate_skill(args.skill_directory)
+        print(message)
+        sys.exit(0 if valid else 1)
+
+    if not Path(args.root).is_dir():
+        print(f"Error: not a directory: {args.root}", file=sys.stderr)
         sys.exit(1)
-    
-    valid, message = validate_skill(sys.argv[1])
-    print(message)
-    sys.exit(0 if valid else 1)
\ No newline at end of file
+
+    report = validate_all(args.root, None if args.no_cache else args.cache, args.jobs)
+
+    if args.json_path == '-':
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        for r in report['skills']:
+            print(f"{'✅' if r['valid'] else '❌'} {r['path']}: {r['message']}")
+        print(f"\n{report['valid']}/{report['total']} valid ({report['cached']} from cache)")
+        if args.json_path:
+            Path(args.json_path).write_text(json.dumps(report, indent=2) + '\n')
+
+    sys.exit(0 if report['invalid'] == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/bin/bash
+#
+# Per-call overhead of memory-capture.sh for irrelevant and matching payloads
+#
+# Usage:
+#   capture-bench.sh [N] [BASELINE_REF]
+#
+# Runs N PostToolUse payloads of each kind (a plain `git status` and a
+# `bd comments add ... "LEARNED: ..."`) through the working-tree hook and,
+# if BASELINE_REF is given, through memory-capture.sh as of that git ref,
+# then prints mean and p50 milliseconds per call.
+#
+# Example: capture-bench.sh 200 HEAD~1
+#
+
+set -euo pipefail
+
+N="${1:-200}"
+BASELINE_REF="${2:-}"
+
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+HOOKS_DIR="$(cd "$SCRIPT_DIR/../hooks" && pwd)"
+
+WORK=$(mktemp -d /tmp/capture-bench-XXXXXX)
+trap 'rm -rf "$WORK"' EXIT
+
+# Each variant gets its own hooks dir so library sourcing via ${0%/*} works
+mkdir -p "$WORK/current"
+cp "$HOOKS_DIR"/*.sh "$HOOKS_DIR"/*.py "$WORK/current/"
+VARIANTS=("current")
+
+if [[ -n "$BASELINE_REF" ]]; then
+  mkdir -p "$WORK/baseline"
+  cp "$HOOKS_DIR"/*.sh "$HOOKS_DIR"/*.py "$WORK/baseline/"
+  git -C "$HOOKS_DIR" show "$BASELINE_REF:./memory-capture.sh" > "$WORK/baseline/memory-capture.sh"
+  VARIANTS=("baseline" "current")
+fi
+
+IRRELEVANT='{"session_id":"s","cwd":"/project","hook_event_name":"PostToolUse","tool_name":"Bash","tool_input":{"command":"git status"},"tool_response":{"stdout":"On branch main\nnothing to commit"}}'
+
+python3 - "$WORK" "$N" "$IRRELEVANT" "${VARIANTS[@]}" <<'PYEOF'
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+work, n, irrelevant, variants = sys.argv[1], int(sys.argv[2]), sys.argv[3], sys.argv[4:]
+
+
+def matching(i):
+    cmd = f'bd comments add BD-{i % 40} "LEARNED: bench insight {i} about cache retry timeout"'
+    return json.dumps({"session_id": "s", "cwd": "/project", "hook_event_name": "PostToolUse",
+                       "tool_name": "Bash", "tool_input": {"command": cmd}})
+
+
+def bench(variant, kind):
+    project = os.path.join(work, f"project-{variant}-{kind}")
+    os.makedirs(os.path.join(project, ".beads", "memory"))
+    env = dict(os.environ, CLAUDE_PROJECT_DIR=project)
+    env.pop("BEADS_COMPOUND_TRACE", None)
+    hook = os.path.join(work, variant, "memory-capture.sh")
+
+    times = []
+    for i in range(n):
+        payload = irrelevant if kind == "irrelevant" else matching(i)
+        start = time.perf_counter()
+        subprocess.run(["bash", hook], input=payload.encode(), env=env, check=False)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.mean(times), statistics.median(times)
+
+
+print(f"{'variant':<10} {'payload':<12} {'calls':>6} {'mean ms':>9} {'p50 ms':>9}")
+for kind in ("irrelevant", "matching"):
+    for variant in variants:
+        mean, p50 = bench(variant, kind)
+        print(f"{variant:<10} {kind:<12} {n:>6} {mean:>9.2f} {p50:>9.2f}")
+PYEOF
@@ -0,0 +1,292 @@
+#!/bin/bash
+#
+# Hook replay and load-test harness for memory-capture.sh / subagent-wrapup.sh
+#
+# Usage:
+#   hook-replay.sh record HOOK CORPUS_DIR          # stdin payload -> corpus (scrubbed)
+#   hook-replay.sh synth CORPUS_DIR [N] [RATIO]    # N synthetic PostToolUse payloads,
+#                                                  # RATIO = fraction that are bd comments
+#   hook-replay.sh replay CORPUS_DIR [--concurrency C] [--repeat R] [--hook HOOK]
+#
+# Recording: register `bash /path/to/hook-replay.sh record memory-capture ~/hook-corpus`
+# as an extra hook next to the real one. Payloads are stored one per line in
+# CORPUS_DIR/HOOK.jsonl with session ids, paths and tool output scrubbed.
+# Bash commands are redacted to a same-length run of "x" except for the
+# trailing `bd comments add ...` part that memory-capture.sh parses, so
+# tokens or credentials elsewhere in a command are not stored. The comment
+# text itself is kept verbatim.
+#
+# Replay runs every payload through the hooks in a throwaway project with a
+# stub `bd` on PATH. The serial pass is the oracle: with --concurrency C > 1
+# the same payloads are replayed again C at a time in a second project, and
+# knowledge rows missing from or duplicated in knowledge.jsonl/knowledge.db
+# are reported along with "database is locked" errors. --repeat R replays the
+# corpus R times, tagging comment text per round so keys stay unique.
+#
+
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+HOOKS_DIR="$SCRIPT_DIR/../hooks"
+
+usage() {
+  sed -n '3,10p' "$0" | sed 's/^# \{0,1\}//' >&2
+  exit 1
+}
+
+[[ $# -lt 2 ]] && usage
+
+CMD="$1"
+shift
+
+case "$CMD" in
+  record)
+    HOOK="$1"
+    CORPUS_DIR="$2"
+
+    if [[ ! "$HOOK" =~ ^[a-z-]+$ ]]; then
+      echo "Invalid hook name: $HOOK" >&2
+      exit 1
+    fi
+
+    mkdir -p "$CORPUS_DIR"
+
+    # Keep only what the hooks read; scrub identifying paths and ids.
+    # $HOME is replaced literally (split/join), not as a regex.
+    jq -c --arg home "$HOME" '
+      def mask: if length > 0 then "x" * length else "" end;
+      del(.tool_response, .transcript_path) |
+      (if (.tool_input.command | type) == "string" then
+         .tool_input.command |= (
+           . as $cmd |
+           ([match("bd\\s+comments?\\s+add\\s+"; "g")] | last) as $m |
+           if $m == null then mask
+           else ($cmd[:$m.offset] | mask) + $cmd[$m.offset:] end)
+       else . end) |
+      (if .session_id then .session_id = "session" else . end) |
+      (if .agent_id then .agent_id = "agent" else . end) |
+      (if .agent_transcript_path then .agent_transcript_path = "TRANSCRIPT" else . end) |
+      (if .cwd then .cwd = (if (.cwd | test("\\.worktrees/")) then "/project/.worktrees/w" else "/project" end) else . end) |
+      walk(if type == "string" and $home != "" then split($home) | join("~") else . end)
+    ' >> "$CORPUS_DIR/$HOOK.jsonl"
+    exit 0
+    ;;
+
+  synth)
+    CORPUS_DIR="$1"
+    N="${2:-1000}"
+    RATIO="${3:-0.01}"
+
+    mkdir -p "$CORPUS_DIR"
+
+    python3 - "$CORPUS_DIR/memory-capture.jsonl" "$N" "$RATIO" <<'PYEOF'
+import json
+import random
+import sys
+
+path, n, ratio = sys.argv[1], int(sys.argv[2]), float(sys.argv[3])
+rng = random.Random(42)
+prefixes = ["LEARNED", "DECISION", "FACT", "PATTERN", "INVESTIGATION"]
+plain = ["git status", "npm test", "ls -la src", "rg TODO", "pytest -q tests/",
+         "bd ready --json", "bd show BD-12", "cat README.md | head -50"]
+
+with open(path, "w") as f:
+    for i in range(n):
+        if rng.random() < ratio:
+            prefix = rng.choice(prefixes)
+            cmd = f'bd comments add BD-{rng.randint(1, 40)} "{prefix}: synthetic insight {i} about cache timeout handling"'
+        else:
+            cmd = rng.choice(plain)
+        f.write(json.dumps({"session_id": "session", "cwd": "/project", "hook_event_name": "PostToolUse",
+                            "tool_name": "Bash", "tool_input": {"command": cmd}}) + "\n")
+
+print(f"Wrote {n} payloads to {path}")
+PYEOF
+    exit 0
+    ;;
+
+  replay)
+    CORPUS_DIR="$1"
+    shift
+    ;;
+
+  *)
+    usage
+    ;;
+esac
+
+CONCURRENCY=1
+REPEAT=1
+ONLY_HOOK=""
+
+while [[ $# -gt 0 ]]; do
+  case "$1" in
+    --concurrency) CONCURRENCY="$2"; shift 2 ;;
+    --repeat) REPEAT="$2"; shift 2 ;;
+    --hook) ONLY_HOOK="$2"; shift 2 ;;
+    *) usage ;;
+  esac
+done
+
+for CMD_NAME in jq python3; do
+  if ! command -v "$CMD_NAME" &>/dev/null; then
+    echo "Required: $CMD_NAME" >&2
+    exit 1
+  fi
+done
+
+WORK=$(mktemp -d /tmp/hook-replay-XXXXXX)
+trap 'rm -rf "$WORK"' EXIT
+
+# Stub bd: answers the read-only queries hooks make, accepts comment writes
+mkdir -p "$WORK/bin"
+cat > "$WORK/bin/bd" <<'BDEOF'
+#!/bin/bash
+case "$1" in
+  ready|list|show) echo "[]" ;;
+  *) exit 0 ;;
+esac
+BDEOF
+chmod +x "$WORK/bin/bd"
+
+# Synthetic transcript for SubagentStop payloads
+printf '%s\n' '{"type":"user","message":{"content":"BEAD_ID: BD-replay\nImplement the thing"}}' > "$WORK/transcript.jsonl"
+
+python3 - "$CORPUS_DIR" "$HOOKS_DIR" "$WORK" "$CONCURRENCY" "$REPEAT" "$ONLY_HOOK" <<'PYEOF'
+import json
+import math
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+corpus_dir, hooks_dir, work, concurrency, repeat, only_hook = sys.argv[1:7]
+concurrency, repeat = max(1, int(concurrency)), max(1, int(repeat))
+hooks_dir, work = Path(hooks_dir).resolve(), Path(work)
+
+HOOKS = {"memory-capture": "memory-capture.sh", "subagent-wrapup": "subagent-wrapup.sh"}
+PREFIX = re.compile(r'(INVESTIGATION|LEARNED|DECISION|FACT|PATTERN):\s*')
+
+
+def load_jobs():
+    jobs = []
+    for name, script in HOOKS.items():
+        if only_hook and name != only_hook:
+            continue
+        path = Path(corpus_dir) / f"{name}.jsonl"
+        if not path.exists():
+            continue
+        payloads = [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+        for rnd in range(repeat):
+            for payload in payloads:
+                jobs.append((name, script, tag(payload, rnd)))
+    return jobs
+
+
+def tag(payload, rnd):
+    """Make each repeat round produce distinct knowledge keys."""
+    payload = json.loads(json.dumps(payload))
+    cmd = payload.get("tool_input", {}).get("command")
+    if rnd and isinstance(cmd, str):
+        payload["tool_input"]["command"] = PREFIX.sub(lambda m: f"{m.group(0)}[r{rnd}] ", cmd, count=1)
+    if "agent_transcript_path" in payload:
+        payload["agent_transcript_path"] = str(work / "transcript.jsonl")
+    return payload
+
+
+def make_project(name):
+    project = work / name
+    (project / ".beads" / "memory").mkdir(parents=True)
+    return project
+
+
+def run(project, jobs, workers):
+    env = dict(os.environ, CLAUDE_PROJECT_DIR=str(project), PATH=f"{work / 'bin'}:{os.environ['PATH']}")
+    env.pop("BEADS_COMPOUND_TRACE", None)
+
+    def one(job):
+        name, script, payload = job
+        payload = dict(payload, cwd=str(project))
+        start = time.perf_counter()
+        proc = subprocess.run(["bash", str(hooks_dir / script)], input=json.dumps(payload).encode(),
+                              capture_output=True, env=env, cwd=project)
+        return name, time.perf_counter() - start, proc.returncode, proc.stderr.decode(errors="replace")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(one, jobs))
+    return results, time.perf_counter() - start
+
+
+def knowledge(project):
+    memory = project / ".beads" / "memory"
+    jsonl_keys = []
+    path = memory / "knowledge.jsonl"
+    if path.exists():
+        for line in path.read_text().splitlines():
+            try:
+                jsonl_keys.append(json.loads(line)["key"])
+            except (ValueError, KeyError):
+                pass
+    db_keys = set()
+    if (memory / "knowledge.db").exists():
+        conn = sqlite3.connect(memory / "knowledge.db")
+        db_keys = {row[0] for row in conn.execute("SELECT key FROM knowledge")}
+        conn.close()
+    return jsonl_keys, db_keys
+
+
+def pct(values, p):
+    # Nearest rank, as in `hook-trace.sh report`
+    values = sorted(values)
+    return values[max(math.ceil(len(values) * p) - 1, 0)] if values else 0.0
+
+
+def report(label, results, elapsed):
+    print(f"\n{label}: {len(results)} invocations in {elapsed:.2f}s ({len(results) / elapsed:.1f}/s)")
+    print(f"  {'hook':<18} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'errors':>7}")
+    for name in sorted({r[0] for r in results}):
+        lat = [r[1] * 1000 for r in results if r[0] == name]
+        errors = sum(1 for r in results if r[0] == name and r[2] != 0)
+        print(f"  {name:<18} {len(lat):>6} {pct(lat, .5):>8.1f} {pct(lat, .95):>8.1f} "
+              f"{pct(lat, .99):>8.1f} {max(lat):>8.1f} {errors:>7}")
+    locked = sum(r[3].count("database is locked") for r in results)
+    print(f"  'database is locked' errors: {locked}")
+    return locked
+
+
+jobs = load_jobs()
+if not jobs:
+    print(f"No payloads found in {corpus_dir}", file=sys.stderr)
+    sys.exit(1)
+
+serial = make_project("serial")
+results, elapsed = run(serial, jobs, 1)
+report("Serial", results, elapsed)
+oracle_jsonl, oracle_db = knowledge(serial)
+print(f"  knowledge rows: jsonl={len(oracle_jsonl)} db={len(oracle_db)}")
+
+if concurrency == 1:
+    sys.exit(0)
+
+concurrent = make_project("concurrent")
+results, elapsed = run(concurrent, jobs, concurrency)
+locked = report(f"Concurrent (c={concurrency})", results, elapsed)
+jsonl_keys, db_keys = knowledge(concurrent)
+
+expected = set(oracle_jsonl)
+lost_jsonl = expected - set(jsonl_keys)
+dup_jsonl = len(jsonl_keys) - len(set(jsonl_keys))
+lost_db = set(oracle_db) - db_keys
+
+print(f"  knowledge rows: jsonl={len(jsonl_keys)} db={len(db_keys)}")
+print(f"  lost from jsonl: {len(lost_jsonl)}   duplicated in jsonl: {dup_jsonl}   lost from db: {len(lost_db)}")
+for key in sorted(lost_jsonl | lost_db)[:10]:
+    print(f"    missing: {key}")
+
+sys.exit(1 if (lost_jsonl or dup_jsonl or lost_db or locked) else 0)
+PYEOF
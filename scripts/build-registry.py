@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Build the compact agent/skill registry (plugins/beads-compound/registry.tsv).
+
+One line per agent and skill: kind, name, category, a short tag line (the
+first sentence of the description, at most 90 characters) and the file path
+relative to the plugin. The registry is a cheap index to load or grep; the
+full description is read on demand with
+`plugins/beads-compound/scripts/find-component.sh --show NAME`.
+
+Rebuilds are incremental: content hashes of the source markdown are kept in
+an untracked cache (scripts/.registry-cache.json), a file whose hash is
+unchanged is not parsed again, and the registry is only rewritten when a
+row changed. Edits that leave the name, category and tag line alone (most
+body edits) therefore leave registry.tsv, and --check, untouched.
+
+Usage:
+    python3 scripts/build-registry.py [--root DIR] [--check] [--no-cache]
+
+Options:
+    --root DIR   Plugin directory (default: plugins/beads-compound)
+    --check      Exit 1 if the registry is out of date, without writing
+    --no-cache   Parse every source file
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from frontmatter import split_document, trim_text
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent / "plugins" / "beads-compound"
+DEFAULT_CACHE = Path(__file__).resolve().parent / ".registry-cache.json"
+REGISTRY_NAME = "registry.tsv"
+HEADER = "# kind\tname\tcategory\ttagline\tpath"
+TAGLINE_CHARS = 90
+
+
+def sources(root):
+    """Yield (kind, category, path) for every agent and skill."""
+    for path in sorted((root / 'agents').glob('*/*.md')):
+        yield 'agent', path.parent.name, path
+    for path in sorted((root / 'skills').glob('*/SKILL.md')):
+        yield 'skill', 'skill', path
+
+
+def tagline(description):
+    first = description.split('. ', 1)[0].strip()
+    if first and not first.endswith('.'):
+        first += '.'
+    return trim_text(first, TAGLINE_CHARS)
+
+
+def clean(value):
+    return ' '.join(value.split())
+
+
+def load_cache(path, root):
+    """Cached {path: {"sha": hash, "row": fields}} for this plugin root."""
+    try:
+        cache = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+    return cache.get('files', {}) if cache.get('root') == str(root) else {}
+
+
+def save_cache(path, root, files):
+    tmp = Path(f'{path}.tmp.{os.getpid()}')
+    tmp.write_text(json.dumps({'root': str(root), 'files': files}, indent=1, sort_keys=True) + '\n')
+    os.replace(tmp, path)
+
+
+def build(root, cache):
+    """Return (registry text, parsed count, reused count, new cache)."""
+    lines, parsed, reused, files = [HEADER], 0, 0, {}
+    for kind, category, path in sources(root):
+        content = path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        rel = path.relative_to(root).as_posix()
+        entry = cache.get(rel)
+        if entry and entry.get('sha') == digest:
+            row = entry['row']
+            reused += 1
+        else:
+            fields, _ = split_document(content.decode('utf-8'))
+            name = fields.get('name') or (path.parent.name if kind == 'skill' else path.stem)
+            row = [kind, clean(name), category, clean(tagline(fields.get('description', ''))), rel]
+            parsed += 1
+        files[rel] = {'sha': digest, 'row': row}
+        lines.append('\t'.join(row))
+    return '\n'.join(lines) + '\n', parsed, reused, files
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--root', type=Path, default=DEFAULT_ROOT, help='Plugin directory')
+    parser.add_argument('--check', action='store_true', help='Fail if the registry is stale')
+    parser.add_argument('--cache', type=Path, default=DEFAULT_CACHE, help='Content-hash cache file')
+    parser.add_argument('--no-cache', action='store_true', help='Parse every source file')
+    args = parser.parse_args()
+
+    root = args.root.resolve()
+    registry = root / REGISTRY_NAME
+    text, parsed, reused, files = build(root, {} if args.no_cache else load_cache(args.cache, root))
+    current = registry.read_text(encoding='utf-8') if registry.exists() else ''
+    if not args.no_cache:
+        try:
+            save_cache(args.cache, root, files)
+        except OSError:
+            pass  # the cache only saves parsing time
+
+    if text == current:
+        print(f"{REGISTRY_NAME} up to date ({len(files)} entries)")
+        return 0
+    if args.check:
+        print(f"{REGISTRY_NAME} is stale; run: python3 scripts/build-registry.py", file=sys.stderr)
+        return 1
+
+    tmp = registry.with_name(f'.{REGISTRY_NAME}.tmp.{os.getpid()}')
+    tmp.write_text(text, encoding='utf-8')
+    os.replace(tmp, registry)
+    print(f"Wrote {REGISTRY_NAME}: {parsed} parsed, {reused} unchanged")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
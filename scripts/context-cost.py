@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Measure the context cost of the agent, command and skill corpus.
+
+Every session pays for the frontmatter `name` + `description` of each agent,
+and of each command and skill that the model may invoke on its own. Bodies
+are only loaded when the item is used. This script parses every item under
+plugins/beads-compound in one parallel pass, estimates tokens for both parts,
+and reports the always-loaded total against a budget so context overhead can
+be tracked like any other performance budget.
+
+Usage:
+    python3 scripts/context-cost.py [--root DIR] [--budget TOKENS]
+                                    [--json PATH] [--markdown PATH] [--top N]
+
+Token counts are estimates (characters / --chars-per-token, default 4);
+use them to compare items and releases, not as exact tokenizer output.
+
+Exit status is 1 when the always-loaded total exceeds --budget.
+
+Options:
+    --root DIR             Plugin directory (default: plugins/beads-compound)
+    --budget TOKENS        Always-loaded token budget (default: 3000)
+    --json PATH            Write the full report as JSON ('-' for stdout)
+    --markdown PATH        Write the markdown report to PATH (default: stdout)
+    --top N                Heaviest always-loaded items to list (default: 15)
+    --chars-per-token N    Characters per token for estimates (default: 4)
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from frontmatter import split_document
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent / "plugins" / "beads-compound"
+
+
+def estimate_tokens(text, chars_per_token):
+    return math.ceil(len(text) / chars_per_token) if text else 0
+
+
+def is_true(value):
+    return str(value).strip().lower() in ('true', 'yes', 'on', '1')
+
+
+def discover(root):
+    """Yield (kind, path) for every agent, command and skill under root."""
+    for path in sorted((root / 'agents').rglob('*.md')):
+        yield 'agent', path
+    for path in sorted((root / 'commands').glob('*.md')):
+        yield 'command', path
+    for path in sorted((root / 'skills').glob('*/SKILL.md')):
+        yield 'skill', path
+
+
+def analyze(item, root, chars_per_token):
+    kind, path = item
+    fields, body = split_document(path.read_text(encoding='utf-8'))
+    name = fields.get('name') or (path.parent.name if kind == 'skill' else path.stem)
+    description = fields.get('description', '')
+    disabled = is_true(fields.get('disable-model-invocation', 'false'))
+
+    # Agents are always listed; commands and skills can opt out
+    always_loaded = kind == 'agent' or not disabled
+    listing = f"{name}: {description}"
+    return {
+        'kind': kind,
+        'name': name,
+        'path': str(path.relative_to(root)),
+        'description_chars': len(description),
+        'description_tokens': estimate_tokens(listing, chars_per_token),
+        'body_tokens': estimate_tokens(body, chars_per_token),
+        'disable_model_invocation': disabled,
+        'always_loaded': always_loaded,
+    }
+
+
+def build_report(root, budget, chars_per_token):
+    items = list(discover(root))
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda item: analyze(item, root, chars_per_token), items))
+
+    by_kind = {}
+    for r in results:
+        k = by_kind.setdefault(r['kind'], {'count': 0, 'always_loaded_count': 0,
+                                           'always_loaded_tokens': 0, 'on_demand_tokens': 0})
+        k['count'] += 1
+        k['on_demand_tokens'] += r['body_tokens']
+        if r['always_loaded']:
+            k['always_loaded_count'] += 1
+            k['always_loaded_tokens'] += r['description_tokens']
+
+    always = sum(k['always_loaded_tokens'] for k in by_kind.values())
+    return {
+        'root': str(root),
+        'chars_per_token': chars_per_token,
+        'budget': budget,
+        'always_loaded_tokens': always,
+        'on_demand_tokens': sum(k['on_demand_tokens'] for k in by_kind.values()),
+        'over_budget': always > budget,
+        'by_kind': by_kind,
+        'model_invocable': [r['path'] for r in results
+                            if r['kind'] != 'agent' and not r['disable_model_invocation']],
+        'items': results,
+    }
+
+
+def render_markdown(report, top):
+    status = 'OVER BUDGET' if report['over_budget'] else 'within budget'
+    out = [
+        '# Context cost report',
+        '',
+        f"Always loaded: **{report['always_loaded_tokens']} tokens** "
+        f"(budget {report['budget']}, {status}). "
+        f"On demand: {report['on_demand_tokens']} tokens. "
+        f"Estimated at {report['chars_per_token']} chars/token.",
+        '',
+        '| Kind | Items | Always loaded | Always-loaded tokens | On-demand tokens |',
+        '|------|------:|--------------:|---------------------:|-----------------:|',
+    ]
+    for kind in ('agent', 'command', 'skill'):
+        k = report['by_kind'].get(kind)
+        if k:
+            out.append(f"| {kind}s | {k['count']} | {k['always_loaded_count']} | "
+                       f"{k['always_loaded_tokens']} | {k['on_demand_tokens']} |")
+
+    heaviest = sorted((r for r in report['items'] if r['always_loaded']),
+                      key=lambda r: r['description_tokens'], reverse=True)[:top]
+    out += ['', f'## Heaviest always-loaded descriptions (top {len(heaviest)})', '',
+            '| Tokens | Kind | Name | Body tokens |', '|-------:|------|------|------------:|']
+    out += [f"| {r['description_tokens']} | {r['kind']} | {r['name']} | {r['body_tokens']} |"
+            for r in heaviest]
+
+    out += ['', '## Commands and skills without `disable-model-invocation`', '']
+    if report['model_invocable']:
+        out += [f'- {path}' for path in report['model_invocable']]
+    else:
+        out.append('None.')
+    return '\n'.join(out) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--root', type=Path, default=DEFAULT_ROOT, help='Plugin directory')
+    parser.add_argument('--budget', type=int, default=3000, help='Always-loaded token budget')
+    parser.add_argument('--json', dest='json_path', help="Write JSON report ('-' for stdout)")
+    parser.add_argument('--markdown', dest='markdown_path', help='Write markdown report (default: stdout)')
+    parser.add_argument('--top', type=int, default=15, help='Heaviest items to list')
+    parser.add_argument('--chars-per-token', type=float, default=4, help='Characters per token')
+    args = parser.parse_args()
+
+    root = args.root.resolve()
+    if not (root / 'agents').is_dir() and not (root / 'commands').is_dir():
+        print(f"Error: no agents/ or commands/ under {root}", file=sys.stderr)
+        return 2
+
+    report = build_report(root, args.budget, args.chars_per_token)
+
+    if args.json_path == '-':
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    elif args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2) + '\n')
+
+    if args.json_path != '-' or args.markdown_path:
+        markdown = render_markdown(report, args.top)
+        if args.markdown_path:
+            Path(args.markdown_path).write_text(markdown)
+        else:
+            sys.stdout.write(markdown)
+
+    return 1 if report['over_budget'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
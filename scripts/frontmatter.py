@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Frontmatter engine for agent, command and skill markdown.
+
+Parses YAML frontmatter without losing anything: fields that are not
+changed keep their original text byte for byte, so rewriting a file with
+the same values is a no-op. A declarative rule set (JSON) describes the
+edits, and `apply` runs it across the plugin tree with a process pool,
+skipping files whose content hash is unchanged since the last run, showing
+unified diffs with --dry-run, and writing through a temp file + rename.
+
+Usage:
+    python3 scripts/frontmatter.py apply [RULES] [--root DIR] [--dry-run] [--jobs N] [--no-cache]
+    python3 scripts/frontmatter.py show FILE
+
+RULES defaults to scripts/context-rules.json and --root to
+plugins/beads-compound. Rules are applied in order; each has a `match`
+(a glob relative to the root, or a list of globs; `*` also matches `/`)
+and one or more actions, applied in the order listed:
+
+    {"match": "agents/*/*.md", "move_examples": "description"}
+        Move <example> blocks out of the field (and out of a body section
+        titled "## Delegation Examples") into an <examples> block at the top
+        of the body.
+    {"match": "agents/*/lint.md", "set": {"description": "..."}}
+        Set fields, replacing existing values.
+    {"match": ["commands/lfg.md"], "set_default": {"disable-model-invocation": "true"}}
+        Set fields only where they are missing.
+    {"match": "agents/*/*.md", "trim": {"description": 250}}
+        Cut a field to at most N characters, at a sentence boundary if possible.
+
+Exit status is 1 if any file could not be processed.
+"""
+
+import argparse
+import concurrent.futures
+import difflib
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_ROOT = SCRIPT_DIR.parent / "plugins" / "beads-compound"
+DEFAULT_RULES = SCRIPT_DIR / "context-rules.json"
+DEFAULT_CACHE = SCRIPT_DIR / ".frontmatter-cache.json"
+
+DOCUMENT_RE = re.compile(r'^(---[ \t]*\r?\n)(.*?)(\r?\n---[ \t]*(?:\r?\n|$))(.*)$', re.DOTALL)
+EXAMPLE_RE = re.compile(r'<example>.*?</example>', re.DOTALL)
+DELEGATION_RE = re.compile(r'## Delegation Examples\s*\n\n(?:<example>.*?</example>\s*\n*)*', re.DOTALL)
+
+# Plain scalars that YAML would misread or that the repo writes quoted
+PLAIN_UNSAFE_RE = re.compile(r'^[\s\'"&*!|>%@`{\[#,?:-]|: | #|[\n"]|\s$')
+
+
+# --- Parsing ---------------------------------------------------------------
+
+def _is_indented(line):
+    return not line.strip() or line[0] in ' \t'
+
+
+def decode_value(first, block):
+    """Decode a scalar from its `key:` line remainder and indented lines."""
+    value = first.strip()
+    while block and not block[-1].strip():
+        block = block[:-1]
+
+    if value[:1] in ('>', '|'):
+        indent = min((len(b) - len(b.lstrip()) for b in block if b.strip()), default=0)
+        body = [b[indent:] for b in block]
+        if value[0] == '>':
+            return ' '.join(b.strip() for b in body if b.strip())
+        return '\n'.join(body)
+
+    if block:
+        value = ' '.join([value] + [b.strip() for b in block if b.strip()])
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+        quote, value = value[0], value[1:-1]
+        if quote == '"':
+            try:
+                return json.loads(f'"{value}"')
+            except ValueError:
+                return value.replace('\\"', '"')
+        return value.replace("''", "'")
+    return value
+
+
+def encode_value(value):
+    """Serialize a string the way the repo writes frontmatter: plain when
+    short and unambiguous, double-quoted otherwise."""
+    if value == '':
+        return ''
+    if len(value) > 80 or PLAIN_UNSAFE_RE.search(value):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class Frontmatter:
+    """Ordered frontmatter entries that remember their original text."""
+
+    def __init__(self, text):
+        # Each entry is [key or None, raw lines]; None holds comments etc.
+        self.entries = []
+        for line in text.split('\n') if text else []:
+            if self.entries and _is_indented(line):
+                self.entries[-1][1].append(line)
+            elif ':' in line and not line.lstrip().startswith('#'):
+                self.entries.append([line.split(':', 1)[0].strip(), [line]])
+            else:
+                self.entries.append([None, [line]])
+
+    def _find(self, key):
+        for entry in self.entries:
+            if entry[0] == key:
+                return entry
+        return None
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def get(self, key, default=None):
+        entry = self._find(key)
+        if entry is None:
+            return default
+        return decode_value(entry[1][0].split(':', 1)[1], entry[1][1:])
+
+    def fields(self):
+        return {key: self.get(key) for key, _ in self.entries if key is not None}
+
+    def set(self, key, value):
+        """Set a field; returns True if the file content changes."""
+        entry = self._find(key)
+        if entry is not None and self.get(key) == value:
+            return False
+        encoded = encode_value(value)
+        raw = [f'{key}: {encoded}' if encoded else f'{key}:']
+        if entry is None:
+            self.entries.append([key, raw])
+        else:
+            # Keep blank lines that separated this entry from the next
+            trailing = []
+            for line in reversed(entry[1][1:]):
+                if line.strip():
+                    break
+                trailing.insert(0, line)
+            entry[1] = raw + trailing
+        return True
+
+    def render(self):
+        return '\n'.join(line for _, raw in self.entries for line in raw)
+
+
+class Document:
+    """A markdown file split into frontmatter and body, round-trip safe."""
+
+    def __init__(self, content):
+        match = DOCUMENT_RE.match(content)
+        if match:
+            self.open, fm_text, self.close, self.body = match.groups()
+            self.frontmatter = Frontmatter(fm_text)
+            self.has_frontmatter = True
+        else:
+            self.open, self.close, self.body = '---\n', '\n---\n', content
+            self.frontmatter = Frontmatter('')
+            self.has_frontmatter = False
+
+    def render(self):
+        if not self.has_frontmatter and not self.frontmatter.entries:
+            return self.body
+        return f'{self.open}{self.frontmatter.render()}{self.close}{self.body}'
+
+
+def parse_frontmatter(text):
+    """Parse frontmatter text into a dict of decoded string values."""
+    return Frontmatter(text).fields()
+
+
+def split_document(content):
+    """Split a markdown file into (frontmatter dict, body)."""
+    doc = Document(content)
+    return doc.frontmatter.fields(), doc.body
+
+
+# --- Rules -----------------------------------------------------------------
+
+def trim_text(text, limit):
+    """Cut text to at most `limit` chars, preferring a sentence boundary."""
+    if len(text) <= limit:
+        return text
+    cut = text[:limit]
+    end = max(cut.rfind('. '), cut.rfind('.\n'), cut.rfind('.') if cut.endswith('.') else -1)
+    if end >= limit // 2:
+        return cut[:end + 1].rstrip()
+    space = cut.rfind(' ')
+    return (cut[:space] if space > 0 else cut).rstrip(' ,;:-') + '...'
+
+
+def move_examples(doc, field):
+    """Move <example> blocks from a field and the Delegation Examples section
+    into the <examples> block at the top of the body."""
+    examples = []
+    value = doc.frontmatter.get(field)
+    if value and '<example>' in value:
+        examples += EXAMPLE_RE.findall(value)
+        doc.frontmatter.set(field, re.sub(r'\s+', ' ', EXAMPLE_RE.sub('', value)).strip())
+
+    section = DELEGATION_RE.search(doc.body)
+    if section:
+        examples += EXAMPLE_RE.findall(section.group(0))
+        doc.body = doc.body[:section.start()] + doc.body[section.end():]
+
+    if not examples:
+        return
+    joined = '\n\n'.join(examples)
+    stripped = doc.body.lstrip('\n')
+    if stripped.startswith('<examples>\n'):
+        close = stripped.index('</examples>')
+        doc.body = stripped[:close].rstrip('\n') + '\n\n' + joined + '\n' + stripped[close:]
+    else:
+        doc.body = '\n<examples>\n' + joined + '\n</examples>\n\n' + stripped
+
+
+def rule_matches(rule, rel):
+    patterns = rule.get('match', [])
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    return any(fnmatch.fnmatch(rel, pattern) for pattern in patterns)
+
+
+def apply_rules(content, rel, rules):
+    """Return the rewritten content of one file."""
+    doc = Document(content)
+    for rule in rules:
+        if not rule_matches(rule, rel):
+            continue
+        # Examples first: trimming a field would cut through its <example> blocks
+        if rule.get('move_examples'):
+            move_examples(doc, rule['move_examples'] if isinstance(rule['move_examples'], str) else 'description')
+        for key, value in rule.get('set', {}).items():
+            doc.frontmatter.set(key, str(value))
+        for key, value in rule.get('set_default', {}).items():
+            if key not in doc.frontmatter:
+                doc.frontmatter.set(key, str(value))
+        for key, limit in rule.get('trim', {}).items():
+            value = doc.frontmatter.get(key)
+            if value is not None:
+                doc.frontmatter.set(key, trim_text(value, int(limit)))
+    return doc.render()
+
+
+# --- Batch apply -----------------------------------------------------------
+
+def sha256(data):
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def atomic_write(path, content):
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        os.chmod(tmp, path.stat().st_mode & 0o777)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def process_file(job):
+    """Worker: apply rules to one file. Returns (rel, status, hash, diff or error)."""
+    path, rel, rules, dry_run = job
+    try:
+        path = Path(path)
+        with open(path, encoding='utf-8', newline='') as f:
+            original = f.read()
+        updated = apply_rules(original, rel, rules)
+        if updated == original:
+            return rel, 'unchanged', sha256(original), ''
+        diff = ''.join(difflib.unified_diff(
+            original.splitlines(keepends=True), updated.splitlines(keepends=True),
+            fromfile=f'a/{rel}', tofile=f'b/{rel}'))
+        if not dry_run:
+            atomic_write(path, updated)
+        return rel, 'changed', sha256(updated), diff
+    except Exception as e:  # reported per file, the batch keeps going
+        return rel, 'error', '', str(e)
+
+
+def load_cache(path, rules_hash):
+    try:
+        cache = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+    return cache.get('files', {}) if cache.get('rules') == rules_hash else {}
+
+
+def cmd_apply(args):
+    rules_text = Path(args.rules).read_text()
+    rules = json.loads(rules_text).get('rules', [])
+    rules_hash = sha256(rules_text)
+    root = Path(args.root).resolve()
+    cache = {} if args.no_cache else load_cache(args.cache, rules_hash)
+
+    jobs, skipped, hashes = [], 0, {}
+    for path in sorted(root.rglob('*.md')):
+        rel = path.relative_to(root).as_posix()
+        if not any(rule_matches(rule, rel) for rule in rules):
+            continue
+        content_hash = sha256(path.read_text(encoding='utf-8'))
+        if cache.get(rel) == content_hash:
+            skipped += 1
+            hashes[rel] = content_hash
+            continue
+        jobs.append((str(path), rel, rules, args.dry_run))
+
+    changed = errors = 0
+    if jobs:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            for rel, status, digest, detail in pool.map(process_file, jobs, chunksize=8):
+                if status == 'error':
+                    errors += 1
+                    print(f"  ERROR {rel}: {detail}", file=sys.stderr)
+                    continue
+                if status == 'changed':
+                    changed += 1
+                    if args.dry_run:
+                        sys.stdout.write(detail)
+                    else:
+                        print(f"  ✓ {rel}")
+                hashes[rel] = digest
+
+    verb = 'would change' if args.dry_run else 'changed'
+    print(f"{verb} {changed}, unchanged {len(jobs) - changed - errors}, "
+          f"cached {skipped}, errors {errors}", file=sys.stderr)
+
+    if not args.dry_run and not args.no_cache:
+        tmp = f'{args.cache}.tmp.{os.getpid()}'
+        Path(tmp).write_text(json.dumps({'rules': rules_hash, 'files': hashes}, indent=1, sort_keys=True) + '\n')
+        os.replace(tmp, args.cache)
+    return 1 if errors else 0
+
+
+def cmd_show(args):
+    doc = Document(Path(args.file).read_text(encoding='utf-8'))
+    json.dump(doc.frontmatter.fields(), sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write('\n')
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    apply = sub.add_parser('apply', help='Apply a rule set across the plugin tree')
+    apply.add_argument('rules', nargs='?', default=str(DEFAULT_RULES), help='Rules JSON file')
+    apply.add_argument('--root', default=str(DEFAULT_ROOT), help='Plugin directory')
+    apply.add_argument('--dry-run', action='store_true', help='Print diffs, write nothing')
+    apply.add_argument('--jobs', type=int, default=os.cpu_count(), help='Worker processes')
+    apply.add_argument('--cache', default=str(DEFAULT_CACHE), help='Content-hash cache file')
+    apply.add_argument('--no-cache', action='store_true', help='Process every matching file')
+    apply.set_defaults(func=cmd_apply)
+
+    show = sub.add_parser('show', help='Print the parsed frontmatter of a file as JSON')
+    show.add_argument('file')
+    show.set_defaults(func=cmd_show)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
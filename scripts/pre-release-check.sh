@@ -69,7 +69,19 @@ echo "  Skills:   $SKILLS (need 15+)"
 [[ "$COMMANDS" -ge 25 ]] && { echo "  PASS  Commands"; ((PASS++)) || true; } || fail "Commands" "$COMMANDS < 25"
 [[ "$AGENTS"   -ge 28 ]] && { echo "  PASS  Agents";   ((PASS++)) || true; } || fail "Agents"   "$AGENTS < 28"
 [[ "$SKILLS"   -ge 15 ]] && { echo "  PASS  Skills";   ((PASS++)) || true; } || fail "Skills"   "$SKILLS < 15"
+check "Skill frontmatter valid" sh -c "python3 plugins/beads-compound/skills/skill-creator/scripts/quick_validate.py --all plugins/beads-compound/skills >/dev/null"
 
+echo ""
+echo "=== Context budget ==="
+
+# Always-loaded agent/command/skill descriptions, in estimated tokens
+CONTEXT_SUMMARY=$(python3 scripts/context-cost.py --json - | jq -r '"\(.always_loaded_tokens) \(.budget)"')
+read -r CONTEXT_TOKENS CONTEXT_BUDGET <<< "$CONTEXT_SUMMARY"
+echo "  Always loaded: ${CONTEXT_TOKENS:-?} tokens (budget ${CONTEXT_BUDGET:-?})"
+[[ -n "$CONTEXT_TOKENS" && "$CONTEXT_TOKENS" -le "$CONTEXT_BUDGET" ]] && { echo "  PASS  Context budget"; ((PASS++)) || true; } || fail "Context budget" "run scripts/context-cost.py for the heaviest items"
+check "Frontmatter rules" sh -c "bash scripts/test-frontmatter.sh >/dev/null"
+check "SubagentStop hook" sh -c "bash scripts/test-subagent-wrapup.sh >/dev/null"
+check "Agent/skill registry current" python3 scripts/build-registry.py --check
 echo ""
 echo "=== Source files ==="
 
@@ -0,0 +1,73 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Regression checks for scripts/frontmatter.py, run against a throwaway
+# plugin tree with the shipped rule set (scripts/context-rules.json).
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+TEST_ROOT="$(mktemp -d)"
+trap 'rm -rf "$TEST_ROOT"' EXIT
+
+PASSED=0
+FAILED=0
+
+pass() {
+  PASSED=$((PASSED + 1))
+  echo "[PASS] $1"
+}
+
+fail() {
+  FAILED=$((FAILED + 1))
+  echo "[FAIL] $1: $2"
+}
+
+apply_rules() {
+  python3 "$SCRIPT_DIR/frontmatter.py" apply "$SCRIPT_DIR/context-rules.json" \
+    --root "$TEST_ROOT" --no-cache --jobs 1 >/dev/null 2>&1
+}
+
+# A description over the 250-character trim limit holding two examples:
+# both must move to the body before the description is trimmed
+mkdir -p "$TEST_ROOT/agents/review"
+AGENT="$TEST_ROOT/agents/review/long-examples.md"
+LONG="Reviews code for long-running example problems in large change sets. Use after any change that touches several modules at once"
+cat > "$AGENT" <<EOF
+---
+name: long-examples
+description: "$LONG <example>Context: the first long example, padded out so that the description is well past the trim limit of two hundred and fifty characters.</example> <example>Context: another long example that must also survive.</example>"
+model: inherit
+---
+
+Body text.
+EOF
+
+if apply_rules; then
+  pass "apply exits 0"
+else
+  fail "apply" "non-zero exit"
+fi
+
+DESCRIPTION=$(python3 "$SCRIPT_DIR/frontmatter.py" show "$AGENT" | python3 -c 'import json,sys; print(json.load(sys.stdin)["description"])')
+if [[ "$DESCRIPTION" != *"<example"* && "$DESCRIPTION" == "Reviews code for long-running"* ]]; then
+  pass "description has no example fragments"
+else
+  fail "description" "$DESCRIPTION"
+fi
+
+if grep -q "the first long example" "$AGENT" && grep -q "another long example that must also survive" "$AGENT"; then
+  pass "both examples moved into the body"
+else
+  fail "examples" "an example was lost"
+fi
+
+BEFORE=$(cat "$AGENT")
+apply_rules
+if [[ "$(cat "$AGENT")" == "$BEFORE" ]]; then
+  pass "second apply is a no-op"
+else
+  fail "idempotence" "second apply changed the file"
+fi
+
+echo
+echo "$PASSED passed, $FAILED failed"
+[[ "$FAILED" -eq 0 ]]
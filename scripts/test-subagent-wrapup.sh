@@ -0,0 +1,83 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Regression checks for the SubagentStop hook
+# (plugins/beads-compound/hooks/subagent-wrapup.sh), run against throwaway
+# transcripts.
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+HOOK="$SCRIPT_DIR/../plugins/beads-compound/hooks/subagent-wrapup.sh"
+TEST_ROOT="$(mktemp -d)"
+trap 'rm -rf "$TEST_ROOT"' EXIT
+
+PASSED=0
+FAILED=0
+
+pass() {
+  PASSED=$((PASSED + 1))
+  echo "[PASS] $1"
+}
+
+fail() {
+  FAILED=$((FAILED + 1))
+  echo "[FAIL] $1: $2"
+}
+
+# run_hook AGENT_ID TRANSCRIPT_PATH -> hook stdout
+run_hook() {
+  jq -n --arg id "$1" --arg path "$2" '{agent_id: $id, agent_transcript_path: $path}' \
+    | CLAUDE_PROJECT_DIR="$TEST_ROOT" bash "$HOOK" 2>/dev/null
+}
+
+NO_BEAD="$TEST_ROOT/no-bead.jsonl"
+cat > "$NO_BEAD" <<'EOF'
+{"type":"user","timestamp":"2026-01-01T00:00:00Z","message":{"content":"Summarise the README"}}
+{"type":"assistant","timestamp":"2026-01-01T00:00:05Z","message":{"content":"Done."}}
+EOF
+
+WITH_BEAD="$TEST_ROOT/with-bead.jsonl"
+cat > "$WITH_BEAD" <<'EOF'
+{"type":"user","timestamp":"2026-01-01T00:00:00Z","message":{"content":"BEAD_ID: demo-1 fix the parser"}}
+{"type":"assistant","timestamp":"2026-01-01T00:00:05Z","message":{"content":"Done."}}
+EOF
+
+LOGGED="$TEST_ROOT/logged.jsonl"
+cat > "$LOGGED" <<'EOF'
+{"type":"user","timestamp":"2026-01-01T00:00:00Z","message":{"content":"BEAD_ID: demo-1 fix the parser"}}
+{"type":"assistant","timestamp":"2026-01-01T00:00:05Z","message":{"content":[{"type":"tool_use","name":"Bash","input":{"command":"bd comments add demo-1 \"LEARNED: the parser was fine\""}}]}}
+EOF
+
+# No BEAD_ID in the transcript: an empty bead field must not shift the
+# logged flag into BEAD_ID
+OUT=$(run_hook agent-1 "$NO_BEAD")
+if [[ -z "$OUT" ]]; then
+  pass "subagent without a bead is allowed to stop"
+else
+  fail "no bead" "$OUT"
+fi
+
+# Empty agent_id: the transcript path must not shift into AGENT_ID
+OUT=$(run_hook "" "$WITH_BEAD")
+if [[ -z "$OUT" ]]; then
+  pass "main agent (no agent_id) is allowed to stop"
+else
+  fail "no agent_id" "$OUT"
+fi
+
+OUT=$(run_hook agent-1 "$WITH_BEAD")
+if [[ "$OUT" == *'"decision": "block"'* && "$OUT" == *"bd comments add demo-1 "* ]]; then
+  pass "subagent on a bead with nothing logged is blocked"
+else
+  fail "bead, nothing logged" "$OUT"
+fi
+
+OUT=$(run_hook agent-1 "$LOGGED")
+if [[ -z "$OUT" ]]; then
+  pass "subagent that already logged is allowed to stop"
+else
+  fail "bead, logged" "$OUT"
+fi
+
+echo
+echo "$PASSED passed, $FAILED failed"
+[[ "$FAILED" -eq 0 ]]